@@ -1,13 +1,17 @@
 import React, { useState, useEffect, useCallback, useRef } from 'react';
 import { TEMPLATES, CALL_TYPES, INITIATED_CALL_TYPES, REASON_FOR_STOP_TYPES, CONSENSUAL_STOP_TYPES, INTRO_BODY, INITIAL_SETTINGS, getFreshInitialState, US_STATES, CPS_INTAKE_VERSION_1, CPS_INTAKE_VERSION_2, ARREST_VERSION_1, ARREST_VERSION_2, CITIZEN_LINK_SENT_VERSION_1, CITIZEN_LINK_SENT_VERSION_2, BWC_VERSION_1, BWC_VERSION_2, BWC_VERSION_3, BWC_INITIATED_TEXT, getInitialOptionalSections } from './constants';
 import { SUBTYPES } from './subtypes';
-import { CJIS_CODES } from './cjis_codes';
-import { ReportState, Template, PartyCategory, OptionalSection, PersistentSettings, Offense, NameEntry, Vehicle, Conviction, CustomParagraph } from './types';
+import { CJIS_INDEX } from './cjis_codes_index';
+import { hydrateOffense, prefetchOffenseText } from './offense_text';
+import { searchOffenses } from './cjis_search_index';
+import { ReportState, Template, PartyCategory, OptionalSection, PersistentSettings, Offense, OffenseIndexEntry, OffenseRef, NameEntry, Vehicle, Conviction, CustomParagraph } from './types';
 import { AccordionItem } from './components/AccordionItem';
 import { PreviewSection } from './components/PreviewSection';
 import { SlashCommandOverlay } from './components/SlashCommandOverlay';
 import { AdditionalStatementsSelector } from './components/AdditionalStatementsSelector';
 import { AdditionalStatementsEditor } from './components/AdditionalStatementsEditor';
+import { StatuteText } from './components/StatuteText';
+import { StatuteReferences } from './components/StatuteReferences';
 
 const STORAGE_KEY_REPORT = 'report_drafter_current_report';
 const STORAGE_KEY_SETTINGS = 'report_drafter_persistent_settings';
@@ -311,7 +315,7 @@ export default function App() {
   const [showSettings, setShowSettings] = useState(false);
   const [showResetModal, setShowResetModal] = useState(false);
   const [fullReportCopied, setFullReportCopied] = useState(false);
-  const [selectedStatute, setSelectedStatute] = useState<Offense | null>(null);
+  const [selectedStatute, setSelectedStatute] = useState<OffenseRef | null>(null);
   const [showStatuteModal, setShowStatuteModal] = useState(false);
   const [linkingOffenseRef, setLinkingOffenseRef] = useState<{ category: PartyCategory, index: number } | null>(null);
   const [tempLinkedOffenses, setTempLinkedOffenses] = useState<string[]>([]);
@@ -390,7 +394,8 @@ export default function App() {
               statute: customDef.statute,
               level: customDef.level,
               elements: customDef.elements,
-              statuteText: customDef.statuteText
+              statuteText: customDef.statuteText,
+              statuteTree: customDef.statuteTree
             };
           }
         }
@@ -419,19 +424,27 @@ export default function App() {
   const [jsonCopied, setJsonCopied] = useState(false);
 
   // Merge static codes with custom overrides
-  const mergedCjisCodes = React.useMemo(() => {
-    if (!settings.customOffenses) return CJIS_CODES;
-    return CJIS_CODES.map(code => settings.customOffenses![code.literal] || code);
+  const mergedCjisCodes = React.useMemo((): OffenseIndexEntry[] => {
+    if (!settings.customOffenses) return CJIS_INDEX;
+    return CJIS_INDEX.map(code => settings.customOffenses![code.literal] || code);
   }, [settings.customOffenses]);
 
+  // Index entries carry no text; fetch it from the offense's text shard
+  const editOffense = async (entry: OffenseIndexEntry) => {
+    try {
+      setEditingOffense(await hydrateOffense(entry));
+    } catch (err) {
+      console.error('Failed to load offense text:', err);
+      alert('Could not load this offense. Check your connection and try again.');
+    }
+  };
+
   const editorFilteredOffenses = React.useMemo(() => {
     if (!offenseSearchTerm) return [];
     const search = offenseSearchTerm.trim().toLowerCase();
 
-    const matches = mergedCjisCodes.filter(offense =>
-      offense.literal.toLowerCase().includes(search) ||
-      offense.citation.toLowerCase().includes(search)
-    );
+    // Prebuilt trigram index: only candidate offenses are checked
+    const matches = searchOffenses(search, mergedCjisCodes);
 
     // Sort: exact matches or prefix matches first (same as main app)
     return matches.sort((a, b) => {
@@ -501,12 +514,31 @@ export default function App() {
     }));
 
     // Reset the editing view to show the original default
-    const original = CJIS_CODES.find(c => c.literal === literal);
+    const original = CJIS_INDEX.find(c => c.literal === literal);
     if (original) {
-      setEditingOffense(original);
+      editOffense(original);
     }
   };
 
+  // Add a searched offense to the report with its elements and statute text
+  const addOffenseToIncident = async (entry: OffenseIndexEntry) => {
+    let offense: Offense;
+    try {
+      offense = await hydrateOffense(entry);
+    } catch (err) {
+      console.error('Failed to load offense text:', err);
+      const { textRef, ...rest } = entry;
+      offense = rest;
+    }
+    setReportData(prev => ({
+      ...prev,
+      incidentDetails: {
+        ...prev.incidentDetails,
+        offenses: [...(prev.incidentDetails.offenses || []), { ...offense, id: generateId() }]
+      }
+    }));
+  };
+
 
 
   // Drag and Drop State
@@ -534,10 +566,8 @@ export default function App() {
     const search = offenseSearch.trim().toLowerCase();
     if (search.length < 2) return [];
 
-    const matches = mergedCjisCodes.filter(offense =>
-      offense.literal.toLowerCase().includes(search) ||
-      offense.citation.toLowerCase().includes(search)
-    );
+    // Prebuilt trigram index: only candidate offenses are checked
+    const matches = searchOffenses(search, mergedCjisCodes);
 
     // Sort: exact matches or prefix matches first
     return matches.sort((a, b) => {
@@ -554,6 +584,11 @@ export default function App() {
     }).slice(0, 50);
   }, [offenseSearch, mergedCjisCodes]);
 
+  // Start fetching the text shards of the offenses the officer may pick
+  useEffect(() => {
+    prefetchOffenseText(filteredOffenses);
+  }, [filteredOffenses]);
+
   // Persistence Effects
   useEffect(() => {
     localStorage.setItem(STORAGE_KEY_REPORT, JSON.stringify(reportData));
@@ -2902,7 +2937,7 @@ N/A
                       <button
                         key={offense.literal}
                         onClick={() => {
-                          setEditingOffense({ ...offense });
+                          editOffense(offense);
                           setOffenseEditorMobilePanel('editing');
                         }}
                         className={`w-full text-left px-4 py-3 rounded-lg text-sm transition-all ${editingOffense?.literal === offense.literal
@@ -2998,7 +3033,7 @@ N/A
                           title="Full statute text"
                           className="w-full px-4 py-3 rounded-lg bg-slate-50 dark:bg-slate-800 border border-slate-200 dark:border-slate-700 focus:ring-primary focus:border-primary dark:text-white font-mono text-xs leading-relaxed resize-none overflow-hidden offense-text-input"
                           value={editingOffense.statuteText || ''}
-                          onChange={(e) => setEditingOffense({ ...editingOffense, statuteText: e.target.value })}
+                          onChange={(e) => setEditingOffense({ ...editingOffense, statuteText: e.target.value, statuteTree: undefined })}
                           onInput={(e) => {
                             const target = e.target as HTMLTextAreaElement;
                             target.style.height = 'auto';
@@ -3146,13 +3181,10 @@ N/A
               </button>
             </div>
             <div className="p-8 overflow-y-auto">
-              <div className="bg-slate-50 dark:bg-slate-800/50 p-6 rounded-xl border border-slate-100 dark:border-slate-700 text-base leading-relaxed text-slate-700 dark:text-slate-300 whitespace-pre-wrap italic" style={{ fontFamily: 'Calibri, sans-serif' }}>
-                {selectedStatute.statuteText.split(/(\*\*.*?\*\*)/g).map((part, i) =>
-                  part.startsWith('**') && part.endsWith('**')
-                    ? <strong key={i} className="text-slate-900 dark:text-white not-italic">{part.slice(2, -2)}</strong>
-                    : part
-                )}
+              <div className="bg-slate-50 dark:bg-slate-800/50 p-6 rounded-xl border border-slate-100 dark:border-slate-700 text-base leading-relaxed text-slate-700 dark:text-slate-300 italic" style={{ fontFamily: 'Calibri, sans-serif' }}>
+                <StatuteText offense={selectedStatute} />
               </div>
+              <StatuteReferences offense={selectedStatute} offenses={mergedCjisCodes} onSelect={setSelectedStatute} />
             </div>
             <div className="p-4 bg-slate-50 dark:bg-slate-800/30 border-t border-slate-100 dark:border-slate-800 flex justify-end">
               <button
@@ -3383,8 +3415,7 @@ N/A
                                 <div
                                   key={`${offense.citation}-${idx}`}
                                   onClick={() => {
-                                    const newOffense = { ...offense, id: generateId() };
-                                    handleInputChange('incidentDetails', 'offenses', [...(reportData.incidentDetails.offenses || []), newOffense]);
+                                    addOffenseToIncident(offense);
                                     setOffenseSearch('');
                                     setShowOffenseDropdown(false);
                                   }}
@@ -0,0 +1,60 @@
+"""
+Fixed benchmark inputs, excerpted from the real corpora.
+
+TN_SECTIONS are Transportation Code sections as extracted from TN.doc (the TC
+sheet of offense_codes_updated.xlsx), PC_STATUTES are Penal Code sections as
+extracted from PE.htm (the PC sheet) and CITATIONS are citation cells from
+both sheets. Changing an input invalidates the stored baseline.
+
+clean_html_text() is the BeautifulSoup cleanup update_statute_text.py used
+before statute_source.strip_html_text() replaced it; the benchmark times both
+on the same page.
+"""
+
+import re
+
+from bs4 import BeautifulSoup
+
+
+def clean_html_text(html_content):
+    if not html_content: return ""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    text = soup.get_text(separator=' ')
+    lines = [line.strip() for line in text.split('\n')]
+    cleaned = '\n'.join([line for line in lines if line])
+    cleaned = re.sub(r' +', ' ', cleaned)
+    return cleaned
+
+
+TN_SECTIONS = {
+    '545.401': 'Sec.\xa0545.401.\xa0\xa0RECKLESS DRIVING;  OFFENSE.  (a)  A person commits an offense if the person drives a vehicle in wilful or wanton disregard for the safety of persons or property.\n(b)\xa0\xa0An offense under this section is a misdemeanor punishable by:\n(1)\xa0\xa0a fine not to exceed $200;\n(2)\xa0\xa0confinement in county jail for not more than 30 days;  or\n(3)\xa0\xa0both the fine and the confinement.\n(c)\xa0\xa0Notwithstanding Section 542.001, this section applies to:\n(1)\xa0\xa0a private access way or parking area provided for a client or patron by a business, other than a private residential property or the property of a garage or parking lot for which a charge is made for the storing or parking of motor vehicles;  and\n(2)\xa0\xa0a highway or other public place.\n(d)\xa0\xa0Notwithstanding Section 542.004, this section applies to a person, a team, or motor vehicles and other equipment engaged in work on a highway surface.',
+    '545.351': 'Sec.\xa0545.351.\xa0\xa0MAXIMUM SPEED REQUIREMENT.  (a)  An operator may not drive at a speed greater than is reasonable and prudent under the circumstances then existing.\n(b)\xa0\xa0An operator:\n(1)\xa0\xa0may not drive a vehicle at a speed greater than is reasonable and prudent under the conditions and having regard for actual and potential hazards then existing;  and\n(2)\xa0\xa0shall control the speed of the vehicle as necessary to avoid colliding with another person or vehicle that is on or entering the highway in compliance with law and the duty of each person to use due care.\n(c)\xa0\xa0An operator shall, consistent with Subsections (a) and (b), drive at an appropriate reduced speed if:\n(1)\xa0\xa0the operator is approaching and crossing an intersection or railroad grade crossing;\n(2)\xa0\xa0the operator is approaching and going around a curve;\n(3)\xa0\xa0the operator is approaching a hill crest;\n(4)\xa0\xa0the operator is traveling on a narrow or winding roadway;  and\n(5)\xa0\xa0a special hazard exists with regard to traffic, including pedestrians, or weather or highway conditions.',
+    '550.021': 'Sec.\xa0550.021.\xa0\xa0COLLISION INVOLVING PERSONAL INJURY OR DEATH.  (a)\xa0\xa0The operator of a vehicle involved in a collision that results or is reasonably likely to result in injury to or death of a person shall:\n(1)\xa0\xa0immediately stop the vehicle at the scene of the collision or as close to the scene as possible;\n(2)\xa0\xa0immediately return to the scene of the collision if the vehicle is not stopped at the scene of the collision;\n(3)\xa0\xa0immediately determine whether a person is involved in the collision, and if a person is involved in the collision, whether that person requires aid; and\n(4)\xa0\xa0remain at the scene of the collision until the operator complies with the requirements of Section 550.023.\n(b)\xa0\xa0An operator of a vehicle required to stop the vehicle by Subsection (a) shall do so without obstructing traffic more than is necessary.\n(c)\xa0\xa0A person commits an offense if the person does not stop or does not comply with the requirements of this section.\xa0\xa0An offense under this section:\n(1)\xa0\xa0involving a collision resulting in:\n(A)\xa0\xa0death of a person is a felony of the second degree; or\n(B)\xa0\xa0serious bodily injury, as defined by Section 1.07, Penal Code, to a person is a felony of the third degree; and\n(2)\xa0\xa0involving a collision resulting in injury to which Subdivision (1) does not apply is punishable by:\n(A)\xa0\xa0imprisonment in the Texas Department of Criminal Justice for not more than five years or confinement in the county jail for not more than one year;\n(B)\xa0\xa0a fine not to exceed $5,000; or\n(C)\xa0\xa0both the fine and the imprisonment or confinement.',
+    '545.421': 'Sec.\xa0545.421.\xa0\xa0FLEEING OR ATTEMPTING TO ELUDE POLICE OFFICER;  OFFENSE.  (a)  A person commits an offense if the person operates a motor vehicle and wilfully fails or refuses to bring the vehicle to a stop or flees, or attempts to elude, a pursuing police vehicle when given a visual or audible signal to bring the vehicle to a stop.\n(b)\xa0\xa0A signal under this section that is given by a police officer pursuing a vehicle may be by hand, voice, emergency light, or siren.\xa0\xa0The officer giving the signal must be in uniform and prominently display the officer\'s badge of office.\xa0\xa0The officer\'s vehicle must bear the insignia of a law enforcement agency, regardless of whether the vehicle displays an emergency light.\n(c)\xa0\xa0Except as provided by Subsection (d), an offense under this section is a Class B misdemeanor.\n(d)\xa0\xa0An offense under this section is a Class A misdemeanor if the person, during the commission of the offense, recklessly engages in conduct that places another in imminent danger of serious bodily injury.\n(e)\xa0\xa0A person is presumed to have recklessly engaged in conduct placing another in imminent danger of serious bodily injury under Subsection (d) if the person while intoxicated knowingly operated a motor vehicle during the commission of the offense.  In this subsection, "intoxicated" has the meaning assigned by Section 49.01, Penal Code.',
+    '521.457': "Sec.\xa0521.457.\xa0\xa0DRIVING WHILE LICENSE INVALID.  (a)  A person commits an offense if the person operates a motor vehicle on a highway:\n(1)\xa0\xa0after the person's driver's license has been canceled under this chapter if the person does not have a license that was subsequently issued under this chapter;\n(2)\xa0\xa0during a period that the person's driver's license or privilege is suspended or revoked under any law of this state;\n(3)\xa0\xa0while the person's driver's license is expired if the license expired during a period of suspension;  or\n(4)\xa0\xa0after renewal of the person's driver's license has been denied under any law of this state, if the person does not have a driver's license subsequently issued under this chapter.\n(b)\xa0\xa0A person commits an offense if the person is the subject of an order issued under any law of this state that prohibits the person from obtaining a driver's license and the person operates a motor vehicle on a highway.\n(c)\xa0\xa0It is not a defense to prosecution under this section that the person did not receive actual notice of a suspension imposed as a result of a conviction for an offense under Section 521.341.\n(d)\xa0\xa0Except as provided by Subsection (c), it is an affirmative defense to prosecution of an offense, other than an offense under Section 521.341, that the person did not receive actual notice of a cancellation, suspension, revocation, or prohibition order relating to the person's license.\xa0\xa0For purposes of this section, actual notice is presumed if the notice was sent in accordance with law.\n(e)\xa0\xa0Except as provided by Subsections (f), (f-1), and (f-2), an offense under this section is a Class C misdemeanor.\n(f)\xa0\xa0An offense under this section is a Class B misdemeanor if it is shown on the trial of the offense that the person:\n(1)\xa0\xa0has previously been convicted of an offense under this section or an offense under Section 601.371(a), as that law existed before September 1, 2003; or\n(2)\xa0\xa0at the time of the offense, was operating the motor vehicle in violation of Section 601.191.\n(f-1)\xa0\xa0If it is shown on the trial of an offense under this section that the license of the person has previously been suspended as the result of an offense involving the operation of a motor vehicle while intoxicated, the offense is a Class B misdemeanor.\n(f-2)\xa0\xa0An offense under this section is a Class A misdemeanor if it is shown on the trial of the offense that at the time of the offense the person was operating the motor vehicle in violation of Section 601.191 and caused or was at fault in a motor vehicle collision that resulted in serious bodily injury to or the death of another person.\n(g)\xa0\xa0For purposes of this section, a conviction for an offense that involves operation of a motor vehicle after August 31, 1987, is a final conviction, regardless of whether the sentence for the conviction is probated.\n(h)\xa0\xa0Except as provided by Subsection (i), the department may not suspend a person's driver's license under Section 521.292(a)(1), or extend the period a person's driver's license is suspended under Section 521.343(c), for a conviction of an offense under this section if:\n(1)\xa0\xa0the offense was committed before September 1, 2019;\n(2)\xa0\xa0the person was convicted of the offense after August 31, 2023; and\n(3)\xa0\xa0the person pays the department the fee required under Section 521.313(a) or any other fee required for the reinstatement of the person's driver's license in the manner prescribed by the department.\n(i)\xa0\xa0Subsection (h) does not apply to:\n(1)\xa0\xa0a commercial driver's license issued under Chapter 522; or\n(2)\xa0\xa0a person who was transporting hazardous materials or operating a commercial motor vehicle at the time of the offense under this section.\n(j)\xa0\xa0The fee collected under Subsection (h)(3) shall be deposited to the credit of the Texas mobility fund.",
+    '547.004': "Sec.\xa0547.004.\xa0\xa0GENERAL OFFENSES.  (a)  A person commits an offense that is a misdemeanor if the person operates or moves or, as an owner, knowingly permits another to operate or move, a vehicle that:\n(1)\xa0\xa0is unsafe so as to endanger a person;\n(2)\xa0\xa0is not equipped in a manner that complies with the vehicle equipment standards and requirements established by this chapter;  or\n(3)\xa0\xa0is equipped in a manner prohibited by this chapter.\n(b)\xa0\xa0A person commits an offense that is a misdemeanor if the person operates a vehicle equipped with an item of vehicle equipment that the person knows has been determined in a compliance proceeding under Section 547.206 to not comply with a department standard.\n(c)\xa0\xa0A court may dismiss a charge brought under this section if the defendant:\n(1)\xa0\xa0remedies the defect before the defendant's first court appearance; and\n(2)\xa0\xa0pays a reimbursement fee not to exceed $10.\n(d)\xa0\xa0Subsection (c) does not apply to an offense involving a commercial motor vehicle.",
+}
+
+# (section, subsection) looked up for each TN_SECTIONS entry, from its citation
+TN_LOOKUPS = [('545.401', None), ('545.351', '(A)(1)'), ('550.021', None), ('545.421', None), ('521.457', None), ('547.004', '(a)(1)')]
+
+PC_STATUTES = [
+    'Sec. 22.01. ASSAULT. (a) A person commits an offense if the person: (1) intentionally, knowingly, or recklessly causes bodily injury to another, including the person\'s spouse; (2) intentionally or knowingly threatens another with imminent bodily injury, including the person\'s spouse; or (3) intentionally or knowingly causes physical contact with another when the person knows or should reasonably believe that the other will regard the contact as offensive or provocative. (b) An offense under Subsection (a)(1) is a Class A misdemeanor, except that the offense is a felony of the third degree if the offense is committed against: (1) a person the actor knows is a public servant while the public servant is lawfully discharging an official duty, or in retaliation or on account of an exercise of official power or performance of an official duty as a public servant; (2) a person whose relationship to or association with the defendant is described by Section 71.0021 (b), 71.003 , or 71.005 , Family Code, if: (A) it is shown on the trial of the offense that the defendant has been previously convicted of an offense that was committed: (i) against a person whose relationship to or association with the defendant is described by Section 71.0021 (b), 71.003 , or 71.005 , Family Code; and (ii) under: (a) this chapter, Chapter 19, or Section 20.03, 20.04, 21.11, or 25.11; (b) Section 25.07 , if the applicable violation was based on the commission of family violence as described by Subsection (a)(1) of that section; or (c) Section 25.072 , if any of the applicable violations were based on the commission of family violence as described by Section 25.07 (a)(1); or (B) the offense is committed by intentionally, knowingly, or recklessly impeding the normal breathing or circulation of the blood of the person by applying pressure to the person\'s throat or neck or by blocking the person\'s nose or mouth; (3) a person who contracts with government to perform a service in a facility described by Section 1.07 (a)(14), Penal Code, or Section 51.02 (13) or (14), Family Code, or an employee of that person: (A) while the person or employee is engaged in performing a service within the scope of the contract, if the actor knows the person or employee is authorized by government to provide the service; or (B) in retaliation for or on account of the person\'s or employee\'s performance of a service within the scope of the contract; (4) a person the actor knows is a security officer while the officer is performing a duty as a security officer; (5) a person the actor knows is emergency services personnel while the person is providing emergency services; (6) a person the actor knows is a process server while the person is performing a duty as a process server; (7) a pregnant individual to force the individual to have an abortion; (8) a person the actor knows is pregnant at the time of the offense; (9) a person the actor knows is hospital personnel while the person is located on hospital property, including all land and buildings owned or leased by the hospital; or (10) a person the actor knows or reasonably should know is an employee or agent of a utility while the person is performing a duty within the scope of that employment or agency. (b-1) Notwithstanding Subsections (b) and (c), an offense under Subsection (a) is a felony of the third degree if the offense is committed: (1) by an actor who is committed to a civil commitment facility; and (2) against: (A) a person the actor knows is an officer or employee of the Texas Civil Commitment Office: (i) while the officer or employee is lawfully discharging an official duty; or (ii) in retaliation for or on account of an exercise of official power or performance of an official duty by the officer or employee; or (B) a person the actor knows is contracting with the state to perform a service in a civil commitment facility or an employee of that person: (i) while the person or employee is engaged in performing a service within the scope of the contract; or (ii) in retaliation for or on account of the person\'s or employee\'s performance of a service within the scope of the contract. (b-2) Notwithstanding Subsection (b)(1), an offense under Subsection (a)(1) is a felony of the second degree if the offense is committed against a person the actor knows is a peace officer or judge while the officer or judge is lawfully discharging an official duty or in retaliation or on account of an exercise of official power or performance of an official duty as a peace officer or judge. (b-3) Notwithstanding Subsection (b)(2), an offense under Subsection (a)(1) is a felony of the second degree if: (1) the offense is committed against a person whose relationship to or association with the defendant is described by Section 71.0021 (b), 71.003 , or 71.005 , Family Code; (2) it is shown on the trial of the offense that the defendant has been previously convicted of an offense that was committed: (A) against a person whose relationship to or association with the defendant is described by Section 71.0021 (b), 71.003 , or 71.005 , Family Code; and (B) under: (i) this chapter, Chapter 19 , or Section 20.03 , 20.04 , 21.11 , or 25.11 ; (ii) Section 25.07 , if the applicable violation was based on the commission of family violence as described by Subsection (a)(1) of that section; or (iii) Section 25.072 , if any of the applicable violations were based on the commission of family violence as described by Section 25.07 (a)(1); and (3) the offense is committed by intentionally, knowingly, or recklessly impeding the normal breathing or circulation of the blood of the person by applying pressure to the person\'s throat or neck or by blocking the person\'s nose or mouth. (b-4) Notwithstanding Subsection (b), an offense under Subsection (a)(1) is a felony of the third degree if it is shown on the trial of the offense that the actor committed the offense in the course of committing an offense under Section 20.05 (a)(2). (c) An offense under Subsection (a)(2) or (3) is a Class C misdemeanor, except that the offense is: (1) a Class A misdemeanor if the offense is committed under Subsection (a)(3) against an elderly individual or disabled individual, as those terms are defined by Section 22.04 ; (2) a Class B misdemeanor if the offense is committed by a person who is not a sports participant against a person the actor knows is a sports participant either: (A) while the participant is performing duties or responsibilities in the participant\'s capacity as a sports participant; or (B) in retaliation for or on account of the participant\'s performance of a duty or responsibility within the participant\'s capacity as a sports participant; or (3) a Class A misdemeanor if the offense is committed against a pregnant individual to force the individual to have an abortion. (d) For purposes of Subsection (b), the actor is presumed to have known the person assaulted was a public servant, a security officer, an employee or agent of a utility, or emergency services personnel if the person was wearing a distinctive uniform or badge indicating the person\'s employment, agency, or status, as applicable. (d-1) The actor is presumed to have known the person assaulted was a person described by Subsection (b-1)(2)(A) or (B), as applicable, if the person was wearing a distinctive uniform or badge indicating the person\'s status as an officer or employee of the Texas Civil Commitment Office or a contractor or employee of a contractor performing a service in a civil commitment facility. (e) In this section: (1) "Emergency services personnel" includes firefighters, emergency medical services personnel as defined by Section 773.003 , Health and Safety Code, emergency room personnel, and other individuals who, in the course and scope of employment or as a volunteer, provide services for the benefit of the general public during emergency situations. (1-a) "Hospital personnel" includes nurses, physicians, physician assistants, maintenance or janitorial staff, receptionists, and other individuals who are employed by or work in a facility that is licensed as a general hospital or special hospital, as those terms are defined by Section 241.003 , Health and Safety Code, including a hospital maintained or operated by the state. (2) "Process server" has the meaning assigned by Section 156.001 , Government Code. (3) "Security officer" means a commissioned security officer as defined by Section 1702.002 , Occupations Code, or a noncommissioned security officer registered under Section 1702.221 , Occupations Code. (4) "Sports participant" means a person who participates in any official capacity with respect to an interscholastic, intercollegiate, or other organized amateur or professional athletic competition and includes an athlete, referee, umpire, linesman, coach, instructor, administrator, or staff member. (5) "Utility" means: (A) an electric utility, as defined by Section 31.002 , Utilities Code; (B) a telecommunications provider, as defined by Section 51.002 , Utilities Code; (C) a cable service provider or video service provider, as defined by Section 66.002 , Utilities Code; (D) a gas utility, as defined by Section 101.003 , Utilities Code, which for the purposes of this subsection includes a municipally owned utility as defined by that section; (E) a gas utility, as defined by Section 121.001 , Utilities Code; (F) a pipeline used for the transportation or sale of oil, gas, or related products; or (G) an electric cooperative or municipally owned utility, as defined by Section 11.003 , Utilities Code. (f) For the purposes of Subsections (b)(2)(A) and (b-3)(2): (1) a defendant has been previously convicted of an offense listed in those subsections committed against a person whose relationship to or association with the defendant is described by Section 71.0021 (b), 71.003 , or 71.005 , Family Code, if the defendant was adjudged guilty of the offense or entered a plea of guilty or nolo contendere in return for a grant of deferred adjudication, regardless of whether the sentence for the offense was ever imposed or whether the sentence was probated and the defendant was subsequently discharged from community supervision; and (2) a conviction under the laws of another state for an offense containing elements that are substantially similar to the elements of an offense listed in those subsections is a conviction of the offense listed. (g) If conduct constituting an offense under this section also constitutes an offense under another section of this code, the actor may be prosecuted under either section or both sections.\nActs 1973, 63rd Leg., p. 883, ch. 399, Sec. 1, eff. Jan. 1, 1974. Amended by Acts 1977, 65th Leg., 1st C.S., p. 55, ch. 2, Sec. 12, 13, eff. July 22, 1977; Acts 1979, 66th Leg., p. 260, ch. 135, Sec. 1, 2, eff. Aug. 27, 1979; Acts 1979, 66th Leg., p. 367, ch. 164, Sec. 2, eff. Sept. 1, 1979; Acts 1983, 68th Leg., p. 5311, ch. 977, Sec. 1, eff. Sept. 1, 1983; Acts 1987, 70th Leg., ch. 1052, Sec. 2.08, eff. Sept. 1, 1987; Acts 1989, 71st Leg., ch. 739, Sec. 1 to 3, eff. Sept. 1, 1989; Acts 1991, 72nd Leg., ch. 14, Sec. 284(23) to (26), eff. Sept. 1, 1991; Acts 1991, 72nd Leg., ch. 334, Sec. 1, eff. Sept. 1, 1991; Acts 1991, 72nd Leg., ch. 366, Sec. 1, eff. Sept. 1, 1991; Acts 1993, 73rd Leg., ch. 900, Sec. 1.01, eff. Sept. 1, 1994; Acts 1997, 75th Leg., ch. 165, Sec. 27.01, eff. Sept. 1, 1997; Acts 1995, 74th Leg., ch. 318, Sec. 5, eff. Sept. 1, 1995; Acts 1995, 74th Leg., ch. 659, Sec. 1, eff. Sept. 1, 1995; Acts 1997, 75th Leg., ch. 165, Sec. 27.01, 31.01(68), eff. Sept. 1, 1997; Acts 1999, 76th Leg., ch. 62, Sec. 15.02(a), eff. Sept. 1, 1999; Acts 1999, 76th Leg., ch. 1158, Sec. 1, eff. Sept. 1, 1999; Acts 2003, 78th Leg., ch. 294, Sec. 1, eff. Sept. 1, 2003; Acts 2003, 78th Leg., ch. 1019, Sec. 1, 2, eff. Sept. 1, 2003; Acts 2003, 78th Leg., ch. 1028, Sec. 1, eff. Sept. 1, 2003. Amended by: Acts 2005, 79th Leg., Ch. 728 (H.B. 2018 ), Sec. 16.002, eff. September 1, 2005. Acts 2005, 79th Leg., Ch. 788 (S.B. 91 ), Sec. 1, eff. September 1, 2005. Acts 2005, 79th Leg., Ch. 788 (S.B. 91 ), Sec. 2, eff. September 1, 2005. Acts 2005, 79th Leg., Ch. 788 (S.B. 91 ), Sec. 6, eff. September 1, 2005. Acts 2007, 80th Leg., R.S., Ch. 623 (H.B. 495 ), Sec. 1, eff. September 1, 2007. Acts 2007, 80th Leg., R.S., Ch. 623 (H.B. 495 ), Sec. 2, eff. September 1, 2007. Acts 2009, 81st Leg., R.S., Ch. 427 (H.B. 2066 ), Sec. 1, eff. September 1, 2009. Acts 2009, 81st Leg., R.S., Ch. 665 (H.B. 2240 ), Sec. 2, eff. September 1, 2009. Acts 2013, 83rd Leg., R.S., Ch. 875 (H.B. 705 ), Sec. 1, eff. September 1, 2013. Acts 2017, 85th Leg., R.S., Ch. 34 (S.B. 1576 ), Sec. 27, eff. September 1, 2017. Acts 2017, 85th Leg., R.S., Ch. 440 (H.B. 2908 ), Sec. 3, eff. September 1, 2017. Acts 2017, 85th Leg., R.S., Ch. 858 (H.B. 2552 ), Sec. 18, eff. September 1, 2017. Acts 2019, 86th Leg., R.S., Ch. 467 (H.B. 4170 ), Sec. 21.001(39), eff. September 1, 2019. Acts 2019, 86th Leg., R.S., Ch. 467 (H.B. 4170 ), Sec. 21.002(14), eff. September 1, 2019. Acts 2019, 86th Leg., R.S., Ch. 751 (H.B. 902 ), Sec. 1, eff. September 1, 2019. Acts 2021, 87th Leg., R.S., Ch. 461 (H.B. 1306 ), Sec. 1, eff. September 1, 2021. Acts 2021, 87th Leg., R.S., Ch. 461 (H.B. 1306 ), Sec. 2, eff. September 1, 2021. Acts 2023, 88th Leg., R.S., Ch. 199 (S.B. 840 ), Sec. 2, eff. September 1, 2023. Acts 2023, 88th Leg., R.S., Ch. 199 (S.B. 840 ), Sec. 3, eff. September 1, 2023. Acts 2023, 88th Leg., R.S., Ch. 351 (S.B. 1179 ), Sec. 4, eff. September 1, 2023. Acts 2023, 88th Leg., R.S., Ch. 694 (H.B. 1589 ), Sec. 1, eff. September 1, 2023. Acts 2023, 88th Leg., 3rd C.S., Ch. 2 (S.B. 4 ), Sec. 6, eff. February 6, 2024. Acts 2025, 89th Leg., R.S., Ch. 478 (S.B. 482 ), Sec. 2, eff. September 1, 2025. Acts 2025, 89th Leg., R.S., Ch. 478 (S.B. 482 ), Sec. 3, eff. September 1, 2025. Acts 2025, 89th Leg., R.S., Ch. 1145 (S.B. 1610 ), Sec. 3, eff. September 1, 2025.',
+    'Sec. 31.03. THEFT. (a) A person commits an offense if he unlawfully appropriates property with intent to deprive the owner of property. (b) Appropriation of property is unlawful if: (1) it is without the owner\'s effective consent; (2) the property is stolen and the actor appropriates the property knowing it was stolen by another; or (3) property in the custody of any law enforcement agency was explicitly represented by any law enforcement agent to the actor as being stolen and the actor appropriates the property believing it was stolen by another. (c) For purposes of Subsection (b): (1) evidence that the actor has previously participated in recent transactions other than, but similar to, the transaction for which the prosecution is based is admissible for the purpose of showing knowledge or intent and the issues of knowledge or intent are raised by the actor\'s plea of not guilty; (2) the testimony of an accomplice shall be corroborated by proof that tends to connect the actor to the crime, but the actor\'s knowledge or intent may be established by the uncorroborated testimony of the accomplice; (3) an actor engaged in the business of buying and selling used or secondhand personal property, or lending money on the security of personal property deposited with the actor, is presumed to know upon receipt by the actor of stolen property (other than a motor vehicle subject to Chapter 501 , Transportation Code) that the property has been previously stolen from another if the actor pays for or loans against the property $25 or more (or consideration of equivalent value) and the actor knowingly or recklessly: (A) fails to record the name, address, and physical description or identification number of the seller or pledgor; (B) fails to record a complete description of the property, including the serial number, if reasonably available, or other identifying characteristics; or (C) fails to obtain a signed warranty from the seller or pledgor that the seller or pledgor has the right to possess the property. It is the express intent of this provision that the presumption arises unless the actor complies with each of the numbered requirements; (4) for the purposes of Subdivision (3)(A), "identification number" means driver\'s license number, military identification number, identification certificate, or other official number capable of identifying an individual; (5) stolen property does not lose its character as stolen when recovered by any law enforcement agency; (6) an actor engaged in the business of obtaining abandoned or wrecked motor vehicles or parts of an abandoned or wrecked motor vehicle for resale, disposal, scrap, repair, rebuilding, demolition, or other form of salvage is presumed to know on receipt by the actor of stolen property that the property has been previously stolen from another if the actor knowingly or recklessly: (A) fails to maintain an accurate and legible inventory of each motor vehicle component part purchased by or delivered to the actor, including the date of purchase or delivery, the name, age, address, sex, and driver\'s license number of the seller or person making the delivery, the license plate number of the motor vehicle in which the part was delivered, a complete description of the part, and the vehicle identification number of the motor vehicle from which the part was removed, or in lieu of maintaining an inventory, fails to record the name and certificate of inventory number of the person who dismantled the motor vehicle from which the part was obtained; (B) fails on receipt of a motor vehicle to obtain a certificate of authority, sales receipt, or transfer document as required by Chapter 683 , Transportation Code, or a certificate of title showing that the motor vehicle is not subject to a lien or that all recorded liens on the motor vehicle have been released; or (C) fails on receipt of a motor vehicle to immediately remove an unexpired license plate from the motor vehicle, to keep the plate in a secure and locked place, or to maintain an inventory, on forms provided by the Texas Department of Motor Vehicles, of license plates kept under this paragraph, including for each plate or set of plates the license plate number and the make, motor number, and vehicle identification number of the motor vehicle from which the plate was removed; (7) an actor who purchases or receives a used or secondhand motor vehicle is presumed to know on receipt by the actor of the motor vehicle that the motor vehicle has been previously stolen from another if the actor knowingly or recklessly: (A) fails to report to the Texas Department of Motor Vehicles the failure of the person who sold or delivered the motor vehicle to the actor to deliver to the actor a properly executed certificate of title to the motor vehicle at the time the motor vehicle was delivered; or (B) fails to file with the county tax assessor-collector of the county in which the actor received the motor vehicle, not later than the 20th day after the date the actor received the motor vehicle, the registration license receipt and certificate of title or evidence of title delivered to the actor in accordance with Subchapter D, Chapter 520 , Transportation Code, at the time the motor vehicle was delivered; (8) an actor who purchases or receives from any source other than a licensed retailer or distributor of pesticides a restricted-use pesticide or a state-limited-use pesticide or a compound, mixture, or preparation containing a restricted-use or state-limited-use pesticide is presumed to know on receipt by the actor of the pesticide or compound, mixture, or preparation that the pesticide or compound, mixture, or preparation has been previously stolen from another if the actor: (A) fails to record the name, address, and physical description of the seller or pledgor; (B) fails to record a complete description of the amount and type of pesticide or compound, mixture, or preparation purchased or received; and (C) fails to obtain a signed warranty from the seller or pledgor that the seller or pledgor has the right to possess the property; (9) an actor who is subject to Section 409, Packers and Stockyards Act (7 U.S.C. Section 228b), that obtains livestock from a commission merchant by representing that the actor will make prompt payment is presumed to have induced the commission merchant\'s consent by deception if the actor fails to make full payment in accordance with Section 409, Packers and Stockyards Act (7 U.S.C. Section 228b); and (10) an actor in possession of property consisting of one or more catalytic converters that have been removed from a motor vehicle is presumed to have unlawfully appropriated the property unless the actor: (A) is the owner, as defined by Section 601.002 , Transportation Code, of each vehicle from which the catalytic converters were removed; or (B) possesses the catalytic converters in the ordinary course of the actor\'s business, including in the ordinary course of business of an entity described by Section 1956.123 (1), Occupations Code. (d) It is not a defense to prosecution under this section that: (1) the offense occurred as a result of a deception or strategy on the part of a law enforcement agency, including the use of an undercover operative or peace officer; (2) the actor was provided by a law enforcement agency with a facility in which to commit the offense or an opportunity to engage in conduct constituting the offense; or (3) the actor was solicited to commit the offense by a peace officer, and the solicitation was of a type that would encourage a person predisposed to commit the offense to actually commit the offense, but would not encourage a person not predisposed to commit the offense to actually commit the offense. (e) Except as otherwise provided by this section, an offense under this section is: (1) a Class C misdemeanor if the value of the property stolen is less than $100; (2) a Class B misdemeanor if: (A) the value of the property stolen is $100 or more but less than $750; (B) the value of the property stolen is less than $100 and the defendant has previously been convicted of any grade of theft; or (C) the property stolen is a driver\'s license, commercial driver\'s license, or personal identification certificate issued by this state or another state; (3) a Class A misdemeanor if the value of the property stolen is $750 or more but less than $2,500; (4) a state jail felony if: (A) the value of the property stolen is $2,500 or more but less than $30,000, or the property is less than 10 head of sheep, swine, or goats or any part thereof under the value of $30,000; (B) regardless of value, the property is stolen from the person of another or from a human corpse or grave, including property that is a military grave marker; (C) the property stolen is a firearm; (D) the value of the property stolen is less than $2,500 and the defendant has been previously convicted two or more times of any grade of theft; (E) the property stolen is an official ballot or official carrier envelope for an election; (F) the value of the property stolen is less than $20,000 and the property stolen is: (i) aluminum; (ii) bronze; (iii) copper; or (iv) brass; (G) the cost of replacing the property stolen is less than $30,000 and the property stolen is a catalytic converter; or (H) the value of the property stolen is less than $30,000 and the property was stolen in a disaster area and came into the actor\'s custody, possession, or control by virtue of the actor\'s status or purported status as a disaster volunteer, as that term is defined by Section 32.61 ; (5) a felony of the third degree if the value of the property stolen is $30,000 or more but less than $150,000, or the property is: (A) cattle, horses, or exotic livestock or exotic fowl as defined by Section 142.001 , Agriculture Code, stolen during a single transaction and having an aggregate value of less than $150,000; (B) 10 or more head of sheep, swine, or goats stolen during a single transaction and having an aggregate value of less than $150,000; or (C) a controlled substance, having a value of less than $150,000, if stolen from: (i) a commercial building in which a controlled substance is generally stored, including a pharmacy, clinic, hospital, nursing facility, or warehouse; or (ii) a vehicle owned or operated by a wholesale distributor of prescription drugs; (6) a felony of the second degree if: (A) the value of the property stolen is $150,000 or more but less than $300,000; or (B) the value of the property stolen is less than $300,000 and the property stolen is an automated teller machine or the contents or components of an automated teller machine; or (7) a felony of the first degree if the value of the property stolen is $300,000 or more. (f) An offense described for purposes of punishment by Subsections (e)(1)-(6) is increased to the next higher category of offense if it is shown on the trial of the offense that: (1) the actor was a public servant at the time of the offense and the property appropriated came into the actor\'s custody, possession, or control by virtue of his status as a public servant; (2) the actor was in a contractual relationship with government at the time of the offense and the property appropriated came into the actor\'s custody, possession, or control by virtue of the contractual relationship; (3) the owner of the property appropriated was at the time of the offense: (A) an elderly individual; or (B) a nonprofit organization; (4) the actor was a Medicare provider in a contractual relationship with the federal government at the time of the offense and the property appropriated came into the actor\'s custody, possession, or control by virtue of the contractual relationship; or (5) during the commission of the offense, the actor intentionally, knowingly, or recklessly: (A) caused a fire exit alarm to sound or otherwise become activated; (B) deactivated or otherwise prevented a fire exit alarm or retail theft detector from sounding; or (C) used a shielding or deactivation instrument to prevent or attempt to prevent detection of the offense by a retail theft detector. (f-1) An offense described for purposes of punishment by Subsections (e)(4)-(6) is increased to the next higher category of offense if it is shown on the trial of the offense that: (1) the property stolen is a catalytic converter; and (2) the actor possessed a firearm during the commission of the offense. (f-2) An offense described for purposes of punishment by Subsections (e)(4)-(6) is increased to the next higher category of offense if it is shown on the trial of the offense that: (1) the property stolen was copper or brass; and (2) the actor committed the offense by unlawfully appropriating the property from a critical infrastructure facility or from equipment or communication wires appurtenant to or connected to the facility or on which the facility depends to properly function, regardless of whether the equipment or communication wires are enclosed by a fence or other barrier. (f-3) The increase in the punishment provided by Section 12.50 for an offense under this section does not apply if the penalty described by Subsection (e)(4)(H) applies. (g) For the purposes of Subsection (a), a person is the owner of exotic livestock or exotic fowl as defined by Section 142.001 , Agriculture Code, only if the person qualifies to claim the animal under Section 142.0021 , Agriculture Code, if the animal is an estray. (h) In this section: (1) "Restricted-use pesticide" means a pesticide classified as a restricted-use pesticide by the administrator of the Environmental Protection Agency under 7 U.S.C. Section 136a, as that law existed on January 1, 1995, and containing an active ingredient listed in the federal regulations adopted under that law (40 C.F.R. Section 152.175) and in effect on that date. (2) "State-limited-use pesticide" means a pesticide classified as a state-limited-use pesticide by the Department of Agriculture under Section 76.003 , Agriculture Code, as that section existed on January 1, 1995, and containing an active ingredient listed in the rules adopted under that section (4 TAC Section 7.24) as that section existed on that date. (3) "Nonprofit organization" means an organization that is exempt from federal income taxation under Section 501(a), Internal Revenue Code of 1986, by being described as an exempt organization by Section 501(c)(3) of that code. (4) "Automated teller machine" means an unstaffed electronic information processing device that, at the request of a user, performs a financial transaction through the direct transmission of electronic impulses to a financial institution or through the recording of electronic impulses or other indicia of a transaction for delayed transmission to a financial institution. The term includes an automated banking machine. (5) "Controlled substance" has the meaning assigned by Section 481.002 , Health and Safety Code. (6) "Wholesale distributor of prescription drugs" means a wholesale distributor, as defined by Section 431.401 , Health and Safety Code. (7) "Catalytic converter" means a catalytic converter and any material removed from the catalytic converter. (8) "Firearm" has the meaning assigned by Section 46.01 . (9) "Disaster area" is an area that was, at the time of the offense: (A) subject to a disaster declaration issued by: (i) the president of the United States under the Robert T. Stafford Disaster Relief and Emergency Assistance Act (42 U.S.C. Section 5121 et seq.); (ii) the governor under Section 418.014 , Government Code; or (iii) the presiding officer of the governing body of a political subdivision under Section 418.108 , Government Code; or (B) subject to an emergency evacuation order. (i) For purposes of Subsection (c)(9), "livestock" and "commission merchant" have the meanings assigned by Section 147.001 , Agriculture Code. (j) With the consent of the appropriate local county or district attorney, the attorney general has concurrent jurisdiction with that consenting local prosecutor to prosecute an offense under this section that involves the state Medicaid program.\nActs 1973, 63rd Leg., p. 883, ch. 399, Sec. 1, eff. Jan. 1, 1974. Amended by Acts 1975, 64th Leg., p. 914, ch. 342, Sec. 10, eff. Sept. 1, 1975; Acts 1977, 65th Leg., p. 937, ch. 349, Sec. 1, eff. Aug. 29, 1977; Acts 1981, 67th Leg., p. 849, ch. 298, Sec. 1, eff. Sept. 1, 1981; Acts 1981, 67th Leg., p. 2065, ch. 455, Sec. 1, eff. June 11, 1981; Acts 1983, 68th Leg., p. 2918, ch. 497, Sec. 3, eff. Sept. 1, 1983; Acts 1983, 68th Leg., p. 3244, ch. 558, Sec. 11, eff. Sept. 1, 1983; Acts 1983, 68th Leg., p. 4523, ch. 741, Sec. 1, eff. Sept. 1, 1983; Acts 1985, 69th Leg., ch. 599, Sec. 1, eff. Sept. 1, 1985; Acts 1985, 69th Leg., ch. 901, Sec. 1, eff. Sept. 1, 1985; Acts 1987, 70th Leg., ch. 167, Sec. 5.01(a)(45), eff. Sept. 1, 1987; Acts 1989, 71st Leg., ch. 245, Sec. 1, eff. Sept. 1, 1989; Acts 1989, 71st Leg., ch. 724, Sec. 2, 3, eff. Sept. 1, 1989; Acts 1991, 72nd Leg., ch. 14, Sec. 284(80), eff. Sept. 1, 1991; Acts 1991, 72nd Leg., ch. 565, Sec. 1, eff. Sept. 1, 1991; Acts 1993, 73rd Leg., ch. 203, Sec. 4, 5, eff. Sept. 1, 1993; Acts 1993, 73rd Leg., ch. 900, Sec. 1.01, eff. Sept. 1, 1994; Acts 1995, 74th Leg., ch. 318, Sec. 9, eff. Sept. 1, 1995; Acts 1995, 74th Leg., ch. 734, Sec. 1, eff. Sept. 1, 1995; Acts 1995, 74th Leg., ch. 843, Sec. 1, eff. Sept. 1, 1995; Acts 1997, 75th Leg., ch. 165, Sec. 30.238, 31.01(69), eff. Sept. 1, 1997; Acts 1997, 75th Leg., ch. 1153, Sec. 7.01, eff. Sept. 1, 1997; Acts 2001, 77th Leg., ch. 1276, Sec. 1, eff. Sept. 1, 2001; Acts 2003, 78th Leg., ch. 198, Sec. 2.136, eff. Sept. 1, 2003; Acts 2003, 78th Leg., ch. 257, Sec. 13, eff. Sept. 1, 2003; Acts 2003, 78th Leg., ch. 393, Sec. 20, eff. Sept. 1, 2003; Acts 2003, 78th Leg., ch. 432, Sec. 2, eff. Sept. 1, 2003. Amended by: Acts 2007, 80th Leg., R.S., Ch. 304 (H.B. 1766 ), Sec. 1, eff. September 1, 2007. Acts 2009, 81st Leg., R.S., Ch. 70 (H.B. 1282 ), Sec. 1, eff. September 1, 2009. Acts 2009, 81st Leg., R.S., Ch. 105 (H.B. 1466 ), Sec. 1, eff. May 23, 2009. Acts 2009, 81st Leg., R.S., Ch. 139 (S.B. 1163 ), Sec. 1, eff. September 1, 2009. Acts 2009, 81st Leg., R.S., Ch. 295 (H.B. 348 ), Sec. 1, eff. September 1, 2009. Acts 2009, 81st Leg., R.S., Ch. 903 (H.B. 671 ), Sec. 1, eff. September 1, 2009. Acts 2009, 81st Leg., R.S., Ch. 903 (H.B. 671 ), Sec. 2, eff. September 1, 2009. Acts 2009, 81st Leg., R.S., Ch. 933 (H.B. 3097 ), Sec. 3J.01, eff. September 1, 2009. Acts 2011, 82nd Leg., R.S., Ch. 120 (S.B. 887 ), Sec. 1, eff. September 1, 2011. Acts 2011, 82nd Leg., R.S., Ch. 120 (S.B. 887 ), Sec. 2, eff. September 1, 2011. Acts 2011, 82nd Leg., R.S., Ch. 323 (H.B. 2482 ), Sec. 2, eff. September 1, 2011. Acts 2011, 82nd Leg., R.S., Ch. 1234 (S.B. 694 ), Sec. 21, eff. September 1, 2011. Acts 2015, 84th Leg., R.S., Ch. 1251 (H.B. 1396 ), Sec. 10, eff. September 1, 2015. Acts 2017, 85th Leg., R.S., Ch. 338 (H.B. 1178 ), Sec. 4, eff. September 1, 2017. Acts 2017, 85th Leg., R.S., Ch. 338 (H.B. 1178 ), Sec. 5, eff. September 1, 2017. Acts 2023, 88th Leg., R.S., Ch. 269 (S.B. 224 ), Sec. 2.02, eff. May 29, 2023. Acts 2023, 88th Leg., R.S., Ch. 269 (S.B. 224 ), Sec. 2.03, eff. May 29, 2023. Acts 2025, 89th Leg., R.S., Ch. 319 (S.B. 1646 ), Sec. 1.04, eff. May 30, 2025. Acts 2025, 89th Leg., 2nd C.S., Ch. 9 (H.B. 20 ), Sec. 3.01, eff. December 4, 2025. Acts 2025, 89th Leg., 2nd C.S., Ch. 9 (H.B. 20 ), Sec. 3.02, eff. December 4, 2025.',
+    'Sec. 49.04. DRIVING WHILE INTOXICATED. (a) A person commits an offense if the person is intoxicated while operating a motor vehicle in a public place. (b) Except as provided by Subsections (c), (d), and (e) and Section 49.09 , an offense under this section is a Class B misdemeanor, with a minimum term of confinement of 72 hours. (c) If it is shown on the trial of an offense under this section that at the time of the offense the person operating the motor vehicle had an open container of alcohol in the person\'s immediate possession, the offense is a Class B misdemeanor, with a minimum term of confinement of six days. (d) If it is shown on the trial of an offense under this section that an analysis of a specimen of the person\'s blood, breath, or urine showed an alcohol concentration level of 0.15 or more at the time the analysis was performed, the offense is a Class A misdemeanor. (e) If it is shown on the trial of an offense under this section that at the time of the offense the person was operating the motor vehicle in a school crossing zone during the time the reduced speed limit applies to the zone, the offense is a state jail felony. In this subsection, "school crossing zone" has the meaning assigned by Section 541.302 , Transportation Code.\nAdded by Acts 1993, 73rd Leg., ch. 900, Sec. 1.01, eff. Sept. 1, 1994. Amended by Acts 1995, 74th Leg., ch. 76, Sec. 14.55, eff. Sept. 1, 1995. Amended by: Acts 2011, 82nd Leg., R.S., Ch. 960 (H.B. 1199 ), Sec. 2, eff. September 1, 2011. Acts 2025, 89th Leg., R.S., Ch. 991 (S.B. 826 ), Sec. 1, eff. September 1, 2025.',
+    'Sec. 38.04. EVADING ARREST OR DETENTION. (a) A person commits an offense if he intentionally flees from a person he knows is a peace officer or federal special investigator attempting lawfully to arrest or detain him. Text of subsection as amended by Acts 2011, 82nd Leg., R.S., Ch. 839 (H.B. 3423 ), Sec. 4, and Ch. 391, Sec. 1 (b) An offense under this section is a Class A misdemeanor, except that the offense is: (1) a state jail felony if: (A) the actor has been previously convicted under this section; or (B) the actor uses a vehicle or watercraft while the actor is in flight and the actor has not been previously convicted under this section; (2) a felony of the third degree if: (A) the actor uses a vehicle or watercraft while the actor is in flight and the actor has been previously convicted under this section; or (B) another suffers serious bodily injury as a direct result of an attempt by the officer or investigator from whom the actor is fleeing to apprehend the actor while the actor is in flight; or (3) a felony of the second degree if another suffers death as a direct result of an attempt by the officer or investigator from whom the actor is fleeing to apprehend the actor while the actor is in flight. Text of subsection as amended by Acts 2011, 82nd Leg., R.S., Ch. 920 (S.B. 1416 ), Sec. 3 (b) An offense under this section is a Class A misdemeanor, except that the offense is: (1) a state jail felony if the actor has been previously convicted under this section; (2) a felony of the third degree if: (A) the actor uses a vehicle while the actor is in flight; (B) another suffers serious bodily injury as a direct result of an attempt by the officer from whom the actor is fleeing to apprehend the actor while the actor is in flight; or (C) the actor uses a tire deflation device against the officer while the actor is in flight; or (3) a felony of the second degree if: (A) another suffers death as a direct result of an attempt by the officer from whom the actor is fleeing to apprehend the actor while the actor is in flight; or (B) another suffers serious bodily injury as a direct result of the actor\'s use of a tire deflation device while the actor is in flight. (b-1) Notwithstanding Subsection (b), an offense under this section is a felony of the third degree if it is shown on the trial of the offense that the actor committed the offense in the course of committing an offense under Section 20.05 (a)(2). (c) In this section: (1) "Vehicle" has the meaning assigned by Section 541.201 , Transportation Code. (2) "Tire deflation device" has the meaning assigned by Section 46.01 . (3) "Watercraft" has the meaning assigned by Section 49.01 . (d) A person who is subject to prosecution under both this section and another law may be prosecuted under either or both this section and the other law.\nActs 1973, 63rd Leg., p. 883, ch. 399, Sec. 1, eff. Jan. 1, 1974. Amended by Acts 1987, 70th Leg., ch. 504, Sec. 1, eff. Sept. 1, 1987. Acts 1989, 71st Leg., ch. 126, Sec. 1, eff. Sept. 1, 1989; Acts 1993, 73rd Leg., ch. 900, Sec. 1.01, eff. Sept. 1, 1994; Acts 1995, 74th Leg., ch. 708, Sec. 1, eff. Sept. 1, 1995; Acts 1997, 75th Leg., ch. 165, Sec. 30.240, eff. Sept. 1, 1997; Acts 2001, 77th Leg., ch. 1334, Sec. 3, eff. Sept. 1, 2001; Acts 2001, 77th Leg., ch. 1480, Sec. 1, eff. Sept. 1, 2001. Amended by: Acts 2009, 81st Leg., R.S., Ch. 1400 (H.B. 221 ), Sec. 4, eff. September 1, 2009. Acts 2011, 82nd Leg., R.S., Ch. 391 (S.B. 496 ), Sec. 1, eff. September 1, 2011. Acts 2011, 82nd Leg., R.S., Ch. 839 (H.B. 3423 ), Sec. 4, eff. September 1, 2011. Acts 2011, 82nd Leg., R.S., Ch. 920 (S.B. 1416 ), Sec. 3, eff. September 1, 2011. Acts 2013, 83rd Leg., R.S., Ch. 161 (S.B. 1093 ), Sec. 22.001(38), eff. September 1, 2013. Acts 2023, 88th Leg., 3rd C.S., Ch. 2 (S.B. 4 ), Sec. 11, eff. February 6, 2024.',
+    'Sec. 30.02. BURGLARY. (a) A person commits an offense if, without the effective consent of the owner, the person: (1) enters a habitation, or a building (or any portion of a building) not then open to the public, with intent to commit a felony, theft, or an assault; or (2) remains concealed, with intent to commit a felony, theft, or an assault, in a building or habitation; or (3) enters a building or habitation and commits or attempts to commit a felony, theft, or an assault. (b) For purposes of this section, "enter" means to intrude: (1) any part of the body; or (2) any physical object connected with the body. (c) Except as provided in Subsection (c-1), (c-2), or (d), an offense under this section is a: (1) state jail felony if committed in a building other than a habitation; or (2) felony of the second degree if committed in a habitation. (c-1) An offense under this section is a felony of the third degree if: (1) the premises are a commercial building in which a controlled substance is generally stored, including a pharmacy, clinic, hospital, nursing facility, or warehouse; and (2) the person entered or remained concealed in that building with intent to commit a theft of a controlled substance. (c-2) An offense under this section is a felony of the third degree if: (1) the premises are a building other than a habitation; and (2) it is shown on the trial of the offense that the actor committed the offense in the course of committing an offense under Section 20.05 (a)(2). (d) An offense under this section is a felony of the first degree if: (1) the premises are a habitation; and (2) any party to the offense entered the habitation with intent to commit a felony other than felony theft or committed or attempted to commit a felony other than felony theft.\nActs 1973, 63rd Leg., p. 883, ch. 399, Sec. 1, eff. Jan. 1, 1974. Amended by Acts 1993, 73rd Leg., ch. 900, Sec. 1.01, eff. Sept. 1, 1994; Acts 1995, 74th Leg., ch. 318, Sec. 8, eff. Sept. 1, 1995; Acts 1999, 76th Leg., ch. 727, Sec. 1, eff. Sept. 1, 1999. Amended by: Acts 2017, 85th Leg., R.S., Ch. 338 (H.B. 1178 ), Sec. 2, eff. September 1, 2017. Acts 2023, 88th Leg., 3rd C.S., Ch. 2 (S.B. 4 ), Sec. 8, eff. February 6, 2024.',
+]
+
+CITATIONS = [
+    '545.413 3033', '547.611 3250', '661.003(a)', '501.158 3671', '547.612 3612', '521.221',
+    '547.613 3230', '502.410', '545.255 3075', '545.407(a)', '550.022', '545.302 3571',
+    '545.302 3369', '521.457(a)(2)', '601.371 3102', '504.945', '545.351', '545.302 3569',
+    '472.021(c)', '521.253(b)', '547.701 3595', '547.324 3172', '545.413 3032', '502.475(A)(3)',
+    '547.405 3218', '547.325 3178', '545.302', '621.301 3707', '522.003 116A', '545.302 3555',
+    '623.011 3724', '550.021(c)(1)(A)', '547.382 3223', '545.302 3570', '552.005(a)', '545.406 3194',
+    '545.103', '521.025', '502.146(1)', '550.022(c)(2)', '33.023(d-2)(2)(A)', '20.04(a)(5)',
+    '51.04(b)', '36.05(e-1)', '37.10(d)(2)(1)', '49.061(b)', '38.10(f)', '25.08(a)',
+    '43.05(b)', '22.07(a)', '49.09(b)', '22.01(c)(2)', '49.09(b)', '32.45(c)(7)',
+    '43.262(c)', '42.01(a)(5)', '42.07(a)', '20.04(a)(2)', '31.19(d)(1)', '21.165(c-1)',
+]
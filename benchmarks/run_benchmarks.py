@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the text-processing hot functions.
+
+Each benchmark runs one function over the fixed inputs in fixtures.py and
+records:
+- ops/sec: calls per second, best of several timeit repeats
+- allocs/op: memory blocks allocated per call (tracemalloc)
+- peak KB: tracemalloc high-water mark during one call
+
+Results are compared with baseline.json. A benchmark that is slower than the
+baseline by more than --threshold (default 25%) fails the run. Baselines are
+machine-specific: re-record with --save-baseline after changing machines, and
+re-record a function's entry in the same commit that deliberately changes it,
+so baseline.json always describes the code it checks.
+
+Usage:
+    python benchmarks/run_benchmarks.py                    # compare with the baseline
+    python benchmarks/run_benchmarks.py --save-baseline    # record a new baseline
+    python benchmarks/run_benchmarks.py fix_statute_text --threshold 0.1
+"""
+
+import argparse
+import html
+import json
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from docx import Document
+
+from benchmarks.fixtures import CITATIONS, PC_STATUTES, TN_LOOKUPS, TN_SECTIONS, clean_html_text
+from fix_statute_text_formatting import fix_statute_text
+from process_tc_sheet import extract_elements, extract_section_from_doc, parse_citation
+from section_tree import find_referenced_subsections, remove_section_header
+from statute_source import strip_html_text
+
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+DEFAULT_THRESHOLD = 0.25
+REPEATS = 5
+
+
+def pe_html(texts):
+    """PE.htm-style markup (anchors, <pre>, entities) around statute texts."""
+    parts = ['<html><head><title>PENAL CODE</title></head><body><pre>']
+    for text in texts:
+        number = text.split()[1].rstrip('.') if text.startswith('Sec.') else '1.01'
+        body = html.escape(text).replace('\n', '&nbsp;\n  ')
+        parts.append(f'<a name="{number}"></a><a name="{number}">{body[:5]}</a>{body[5:]}\n\n')
+    parts.append('</pre></body></html>')
+    return ''.join(parts)
+
+
+def tn_doc(path):
+    """A TN.doc-style chapter with one paragraph per line of TN_SECTIONS."""
+    doc = Document()
+    doc.add_paragraph('CHAPTER 545. OPERATION AND MOVEMENT OF VEHICLES')
+    for text in TN_SECTIONS.values():
+        for line in text.split('\n'):
+            doc.add_paragraph(line)
+    doc.save(path)
+
+
+def build_benchmarks(workdir):
+    doc_path = os.path.join(workdir, 'tn.545.docx')
+    tn_doc(doc_path)
+    parsed = {section: extract_section_from_doc(doc_path, section) for section in TN_SECTIONS}
+    section_texts = list(TN_SECTIONS.values())
+    html_text = pe_html(PC_STATUTES)
+
+    def run_extract_elements():
+        for section, subsection in TN_LOOKUPS:
+            full_text, subsection_paths = parsed[section]
+            extract_elements(full_text, subsection, subsection_paths)
+
+    return {
+        'parse_citation': lambda: [parse_citation(c) for c in CITATIONS],
+        'remove_section_header': lambda: [remove_section_header(t) for t in section_texts],
+        'find_referenced_subsections': lambda: [find_referenced_subsections(t) for t in section_texts],
+        'extract_elements': run_extract_elements,
+        'fix_statute_text': lambda: [fix_statute_text(t) for t in PC_STATUTES],
+        'clean_html_text': lambda: clean_html_text(html_text),
+        'strip_html_text': lambda: strip_html_text(html_text),
+        'extract_section_from_doc': lambda: extract_section_from_doc(doc_path, TN_LOOKUPS[0][0]),
+    }
+
+
+def measure(fn):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=REPEATS, number=number)) / number
+
+    fn()  # warm caches (compiled regexes etc.) before counting allocations
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocs = sum(stat.count_diff for stat in after.compare_to(before, 'filename') if stat.count_diff > 0)
+    return {'ops_per_sec': round(1 / best, 1), 'allocs_per_op': allocs, 'peak_kb': round(peak / 1024, 1)}
+
+
+def load_baseline():
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def run(names=None, threshold=DEFAULT_THRESHOLD, save_baseline=False):
+    baseline = load_baseline()
+    results = {}
+    failures = []
+    with tempfile.TemporaryDirectory() as workdir:
+        benchmarks = build_benchmarks(workdir)
+        unknown = [n for n in names or () if n not in benchmarks]
+        if unknown:
+            print(f"Unknown benchmark(s): {', '.join(unknown)}. Known: {', '.join(benchmarks)}")
+            return 2
+
+        print(f"{'benchmark':<28} {'ops/sec':>12} {'allocs/op':>10} {'peak KB':>9} {'vs baseline':>12}")
+        for name, fn in benchmarks.items():
+            if names and name not in names:
+                continue
+            result = results[name] = measure(fn)
+            base = baseline.get(name)
+            change = ''
+            if base:
+                ratio = result['ops_per_sec'] / base['ops_per_sec'] - 1
+                change = f"{ratio:+.1%}"
+                if ratio < -threshold:
+                    failures.append(name)
+                    change += ' SLOW'
+            print(f"{name:<28} {result['ops_per_sec']:>12,.1f} {result['allocs_per_op']:>10} "
+                  f"{result['peak_kb']:>9} {change:>12}")
+
+    if save_baseline:
+        baseline.update(results)
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nSaved baseline for {len(results)} benchmark(s) to {BASELINE_FILE}")
+        return 0
+
+    if failures:
+        print(f"\n{len(failures)} benchmark(s) slower than baseline by more than {threshold:.0%}: "
+              f"{', '.join(failures)}")
+        return 1
+    print(f"\nAll benchmarks within {threshold:.0%} of baseline.")
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('benchmarks', nargs='*', help='benchmarks to run (default: all)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'allowed slowdown as a fraction (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--save-baseline', action='store_true', help='record the results as the new baseline')
+    args = parser.parse_args()
+    sys.exit(run(args.benchmarks, args.threshold, args.save_baseline))
@@ -1,30 +1,32 @@
 import pandas as pd
 
+from statute_classifier import StatuteClassifier
+
 def check_blank_citations():
     file_path = r'c:\Users\pgarr\Desktop\OFFENSE_CODES\offense_codes.xlsx'
     print(f"Loading sheets from {file_path}...")
     
     # Load ALL_OFFENSES to get unique statutes
-    df_all = pd.read_excel(file_path, sheet_name='ALL_OFFENSES')
-    statutes = sorted([str(s) for s in df_all['statute'].dropna().unique() if len(str(s)) > 1], key=len, reverse=True)
-    print(f"Statutes to check: {statutes}")
+    classifier = StatuteClassifier.from_all_offenses(file_path)
+    print(f"Statutes to check: {classifier.statutes}")
     
     # Load BLANK sheet
     df_blank = pd.read_excel(file_path, sheet_name='BLANK')
     print(f"Checking {len(df_blank)} rows in BLANK sheet...")
     
-    matches = []
-    for index, row in df_blank.iterrows():
-        citation = str(row['citation']).strip()
-        for s in statutes:
-            if citation.startswith(s):
-                matches.append({
-                    'row_in_sheet': index + 2, # +1 for 0-index, +1 for header
-                    'literal': row['literal'],
-                    'citation': citation,
-                    'matching_statute': s
-                })
-                break # Found the longest match
+    # Longest matching statute for every citation in one pass
+    parts = classifier.split(df_blank['citation'])
+    classifier.report(parts)
+    found = parts['statute'].notna()
+    matches = [
+        {
+            'row_in_sheet': index + 2, # +1 for 0-index, +1 for header
+            'literal': df_blank.at[index, 'literal'],
+            'citation': str(df_blank.at[index, 'citation']).strip(),
+            'matching_statute': parts.at[index, 'statute'],
+        }
+        for index in parts.index[found]
+    ]
                 
     if matches:
         print("\nMatches found in BLANK sheet:")
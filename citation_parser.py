@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+One citation grammar for every offense sheet, parsed a whole column at a time.
+
+A citation is a section number, optionally followed by a subsection path and
+a trailing CJIS offense number:
+
+    521.342 (A)(2) 3241  ->  chapter 521, section 521.342, subsection (A)(2), cjis 3241
+    31.03(e)(6)(B)       ->  chapter 31,  section 31.03,   subsection (e)(6)(B)
+    33A.051(b)           ->  chapter 33A, section 33A.051, subsection (b)
+    547.321 3162A        ->  chapter 547, section 547.321, cjis 3162A
+    10.04.012(a)         ->  chapter 10,  section 10.04.012, subsection (a)
+    1302-5.05            ->  chapter 1302-5, section 1302-5.05
+    R109.1.6             ->  chapter R109, section R109.1.6
+    15.16CO              ->  chapter 15,  section 15.16
+
+Chapter and section numbers may carry one letter suffix (33A, 551A, 545.010A);
+two or more letters after a number are not a suffix, so 15.16CO is section
+15.16. A chapter may also have one letter prefix (IRC R109) or a hyphenated
+article number (VCS 1302-5), and ordinance sections have more than one dot.
+Subsection parts are letters, digits and hyphens ((a-1), (c-2)); a part
+with other characters, such as (A,B), ends the path. Surrounding whitespace
+is ignored. A citation that does not start with a section number gives no
+match (all columns <NA>).
+
+parse_citations() runs the grammar over a whole Series or list with one
+vectorized str.extract; parse_citation() applies the same compiled pattern
+to a single value.
+"""
+
+import re
+import pandas as pd
+
+CITATION_PATTERN = (
+    r'^\s*'
+    r'(?P<section>(?P<chapter>[A-Za-z]?\d+(?:-\d+)?(?:[A-Za-z](?![A-Za-z]))?)'
+    r'(?:\.\d+(?:[A-Za-z](?![A-Za-z]))?)+)'
+    r'\s*(?P<subsection>(?:\([A-Za-z0-9\-]+\))*)'
+    # The CJIS number is the last token, if that token is a number
+    r'(?:.*?(?<=\s)(?P<cjis>\d+[A-Za-z]?)\s*$)?'
+    r'.*$'
+)
+CITATION_RE = re.compile(CITATION_PATTERN, re.DOTALL)
+COLUMNS = ['chapter', 'section', 'subsection', 'cjis']
+
+
+def parse_citations(citations):
+    """
+    Parse a Series or list of citations. Returns a DataFrame with string
+    columns chapter, section, subsection (the path, e.g. '(A)(2)') and cjis,
+    indexed like the input. Missing parts are <NA>.
+    """
+    values = citations if isinstance(citations, pd.Series) else pd.Series(list(citations), dtype=object)
+    parts = values.astype('string').str.extract(CITATION_PATTERN, flags=re.DOTALL)[COLUMNS].astype('string')
+    parts['subsection'] = parts['subsection'].mask(parts['subsection'] == '')
+    return parts
+
+
+def parse_citation(citation):
+    """Parse one citation into {column: value or None}, like one row of parse_citations()."""
+    if not isinstance(citation, str):
+        if citation is None or pd.isna(citation):
+            return dict.fromkeys(COLUMNS)
+        citation = str(citation)
+    match = CITATION_RE.match(citation)
+    if not match:
+        return dict.fromkeys(COLUMNS)
+    chapter, section, subsection, cjis = match.group(*COLUMNS)
+    return {'chapter': chapter, 'section': section, 'subsection': subsection or None, 'cjis': cjis}
@@ -1,4 +1,4 @@
-import json
+from offense_store import OffenseStore
 
 titles_to_remove = {
     "City Warrant",
@@ -14,27 +14,17 @@ titles_to_remove = {
     "Welfare Concern"
 }
 
-file_path = 'c:\\Users\\pgarr\\Desktop\\police-report-drafter\\cjis_codes.json'
+def remove_title_case_entries(store):
+    # Remove the Title Case entries
+    removed = store.apply([('delete', title) for title in sorted(titles_to_remove)])
 
-with open(file_path, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+    # Sort by literal
+    store.sort(key=lambda x: x['literal'])
+    return sum(removed)
 
-# Remove the Title Case entries
-data = [item for item in data if item['literal'] not in titles_to_remove]
+if __name__ == "__main__":
+    store = OffenseStore.load()
+    remove_title_case_entries(store)
+    store.flush()
 
-# Sort by literal
-data.sort(key=lambda x: x['literal'])
-
-# Write back to JSON
-with open(file_path, 'w', encoding='utf-8') as f:
-    json.dump(data, f, indent=2)
-
-# Update TS file
-ts_file_path = 'c:\\Users\\pgarr\\Desktop\\police-report-drafter\\cjis_codes.ts'
-with open(ts_file_path, 'w', encoding='utf-8') as f:
-    f.write('import { Offense } from "./types";\n\n')
-    f.write('export const CJIS_CODES: Offense[] = ')
-    json.dump(data, f, indent=2)
-    f.write(';\n')
-
-print("Successfully cleaned up Title Case entries from cjis_codes.json and cjis_codes.ts")
+    print("Successfully cleaned up Title Case entries from cjis_codes.json")
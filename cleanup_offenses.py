@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Run several cjis_codes.json cleanups against one shared OffenseStore.
+
+Each step used to be a separate script that loaded and rewrote the whole
+dataset. Chaining them here loads cjis_codes.json once and writes
+it once at the end.
+
+Usage:
+    python cleanup_offenses.py                      # the default chain
+    python cleanup_offenses.py clear_misc_fields fix_statute_text_formatting
+"""
+
+import sys
+
+from clear_misc_fields import clear_misc_fields
+from cleanup_cjis import remove_title_case_entries
+from fix_statute_text_formatting import fix_all_statute_texts
+from offense_store import OffenseStore
+from run_report import current_report, run_report
+from sync_sheets import sync_sheets
+from update_cjis import add_warrant_entries
+from update_cjis_codes import update_cjis_files
+from update_tc_cjis_codes import update_tc_cjis_codes
+
+CLEANUPS = {
+    'sync_sheets': sync_sheets,
+    'update_cjis_codes': update_cjis_files,
+    'update_tc_cjis_codes': update_tc_cjis_codes,
+    'fix_statute_text_formatting': fix_all_statute_texts,
+    'clear_misc_fields': clear_misc_fields,
+    'update_cjis': add_warrant_entries,
+    'cleanup_cjis': remove_title_case_entries,
+}
+
+# The chain the data build runs after the spreadsheets are enriched.
+# extract_cjis rebuilds cjis_codes.json from the PDF, so the warrant entries
+# are added again and the Title Case duplicates removed again, in the order
+# update_cjis.py and cleanup_cjis.py were run by hand.
+DEFAULT_CHAIN = [
+    'update_cjis',
+    'cleanup_cjis',
+    'sync_sheets',
+    'fix_statute_text_formatting',
+    'clear_misc_fields',
+]
+
+def run_cleanups(names, store=None):
+    report = current_report()
+    own_store = store is None
+    if own_store:
+        with report.stage('load') as stage:
+            store = OffenseStore.load()
+            stage.rows(rows_out=len(store))
+    print(f"Loaded {len(store)} offenses from {store.json_path}.")
+
+    for name in names:
+        print(f"\n--- {name} ---")
+        with report.stage(name) as stage:
+            rows_in = len(store)
+            CLEANUPS[name](store)
+            stage.rows(rows_in=rows_in, rows_out=len(store))
+
+    if own_store:
+        with report.stage('flush') as stage:
+            written = store.flush()
+            stage.rows(rows_in=len(store), rows_out=len(store) if written else 0)
+        if written:
+            print(f"\nSaved {len(store)} offenses to {store.json_path} "
+                  f"({store.bytes_saved // 1024} KB of repeated text stored once).")
+        else:
+            print("\nNo changes; files left untouched.")
+    return store
+
+if __name__ == '__main__':
+    names = sys.argv[1:] or DEFAULT_CHAIN
+    unknown = [n for n in names if n not in CLEANUPS]
+    if unknown:
+        print(f"Unknown cleanup(s): {', '.join(unknown)}. Available: {', '.join(CLEANUPS)}")
+        sys.exit(2)
+    with run_report('cleanup_offenses'):
+        run_cleanups(names)
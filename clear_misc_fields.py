@@ -1,45 +1,36 @@
-import json
 import os
 
-def clear_misc_fields():
-    json_file = 'cjis_codes.json'
-    ts_file = 'cjis_codes.ts'
+from offense_store import JSON_FILE, OffenseStore
 
-    if not os.path.exists(json_file):
-        print(f"Error: {json_file} not found.")
-        return
+def clear_misc_fields(store=None):
+    """Clear citation, statute and level for offenses with 'MISC' in the citation."""
+    own_store = store is None
+    if own_store:
+        if not os.path.exists(JSON_FILE):
+            print(f"Error: {JSON_FILE} not found.")
+            return
 
-    # 1. Load existing JSON data
-    print(f"Loading {json_file}...")
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+        # 1. Load existing JSON data
+        print(f"Loading {JSON_FILE}...")
+        store = OffenseStore.load()
 
     # 2. Iterate and clear fields where citation contains 'MISC'
     updated_count = 0
-    for o in data:
+    for o in store:
         citation = str(o.get('citation', '')).upper()
         if 'MISC' in citation:
-            o['citation'] = ""
-            o['statute'] = ""
-            o['level'] = ""
+            store.update(o, citation="", statute="", level="")
             updated_count += 1
 
     print(f"Cleared fields for {updated_count} offenses with 'MISC' in citation.")
 
-    # 3. Save back to JSON
-    print(f"Saving to {json_file}...")
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    # 3. Save back to JSON and TS
+    if own_store:
+        print(f"Saving to {store.json_path}...")
+        store.flush()
+        print("Update complete!")
 
-    # 4. Save back to TS
-    print(f"Saving to {ts_file}...")
-    with open(ts_file, 'w', encoding='utf-8') as f:
-        f.write('import { Offense } from "./types";\n\n')
-        f.write('export const CJIS_CODES: Offense[] = ')
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write(';\n')
-
-    print("Update complete!")
+    return updated_count
 
 if __name__ == "__main__":
     clear_misc_fields()
@@ -0,0 +1,83 @@
+import React, { useEffect, useMemo, useState } from 'react';
+import { OffenseIndexEntry } from '../types';
+
+type XrefGraph = typeof import('../xref_graph');
+
+interface StatuteReferencesProps {
+  offense: OffenseIndexEntry;
+  offenses: OffenseIndexEntry[];
+  onSelect: (offense: OffenseIndexEntry) => void;
+}
+
+// The graph is a chunk of its own, fetched the first time the panel opens
+let xrefGraph: Promise<XrefGraph> | null = null;
+const loadXrefGraph = (): Promise<XrefGraph> => {
+  if (!xrefGraph) {
+    xrefGraph = import('../xref_graph');
+    // Let a failed load be retried the next time the panel opens
+    xrefGraph.catch(() => { xrefGraph = null; });
+  }
+  return xrefGraph;
+};
+
+// Statutes the offense's statute text refers to (and what those refer to),
+// leaving out subsections of its own section, which the text above shows
+export const StatuteReferences: React.FC<StatuteReferencesProps> = ({ offense, offenses, onSelect }) => {
+  const [graph, setGraph] = useState<XrefGraph | null>(null);
+
+  useEffect(() => {
+    let current = true;
+    loadXrefGraph()
+      .then(loaded => { if (current) setGraph(loaded); })
+      .catch(err => console.error('Failed to load statute references:', err));
+    return () => { current = false; };
+  }, []);
+
+  const references = useMemo(() => {
+    if (!graph) return [];
+    const node = graph.xrefNode(offense.statute, offense.citation);
+    if (!node) return [];
+    const own = node.split('(')[0];
+    return graph.transitiveReferences(node, 2).filter(ref => ref !== own && !ref.startsWith(own + '('));
+  }, [graph, offense.statute, offense.citation]);
+
+  // The first offense for each cited node and its section
+  const offensesByNode = useMemo(() => {
+    const byNode = new Map<string, OffenseIndexEntry>();
+    if (!graph) return byNode;
+    for (const entry of offenses) {
+      const id = graph.xrefNode(entry.statute, entry.citation);
+      if (!id) continue;
+      if (!byNode.has(id)) byNode.set(id, entry);
+      const section = id.split('(')[0];
+      if (!byNode.has(section)) byNode.set(section, entry);
+    }
+    return byNode;
+  }, [graph, offenses]);
+
+  if (references.length === 0) return null;
+  return (
+    <div className="mt-4">
+      <div className="text-[10px] font-bold uppercase tracking-wider text-slate-400">Referenced Statutes</div>
+      <div className="flex flex-wrap gap-2 mt-2">
+        {references.map(ref => {
+          const target = offensesByNode.get(ref) || offensesByNode.get(ref.split('(')[0]);
+          return target ? (
+            <button
+              key={ref}
+              onClick={() => onSelect(target)}
+              title={target.literal}
+              className="text-xs font-semibold px-2 py-1 rounded-md bg-blue-50 dark:bg-blue-900/20 text-primary border border-blue-100 dark:border-blue-800 hover:border-primary transition-colors"
+            >
+              {ref}
+            </button>
+          ) : (
+            <span key={ref} className="text-xs px-2 py-1 rounded-md bg-slate-100 dark:bg-slate-800 text-slate-500 border border-slate-200 dark:border-slate-700">
+              {ref}
+            </span>
+          );
+        })}
+      </div>
+    </div>
+  );
+};
@@ -0,0 +1,76 @@
+import React, { useEffect, useState } from 'react';
+import { OffenseRef, StatuteNode } from '../types';
+import { loadOffenseText } from '../offense_text';
+
+interface StatuteTextProps {
+  offense: OffenseRef;
+}
+
+// **bold** runs, as typed into custom statute text
+const renderRuns = (text: string) =>
+  text.split(/(\*\*.*?\*\*)/g).map((part, i) =>
+    part.startsWith('**') && part.endsWith('**')
+      ? <strong key={i} className="text-slate-900 dark:text-white not-italic">{part.slice(2, -2)}</strong>
+      : part
+  );
+
+const renderNodes = (text: string, nodes: StatuteNode[]) =>
+  nodes.map(node => {
+    const ownEnd = node.children.length ? node.children[0].start : node.end;
+    return (
+      <div key={node.start} className="mt-1">
+        <span className="font-semibold not-italic">{node.label}</span>
+        {renderRuns(text.slice(node.start + node.label.length, ownEnd).trimEnd())}
+        {node.children.length > 0 && <div className="pl-5">{renderNodes(text, node.children)}</div>}
+      </div>
+    );
+  });
+
+// Statute text laid out by its subsection tree, or as plain text when the
+// offense has none (e.g. custom statute text)
+const renderText = (text: string, tree?: StatuteNode[]) => {
+  if (!tree || tree.length === 0) {
+    return <div className="whitespace-pre-wrap">{renderRuns(text)}</div>;
+  }
+  return (
+    <div>
+      <div className="whitespace-pre-wrap">{renderRuns(text.slice(0, tree[0].start).trimEnd())}</div>
+      {renderNodes(text, tree)}
+    </div>
+  );
+};
+
+interface LoadedText {
+  textRef: string;
+  statuteText?: string;
+  statuteTree?: StatuteNode[];
+  failed?: boolean;
+}
+
+// The offense's statute text, fetched from its text shard first if the
+// offense is an index entry (e.g. a referenced statute)
+export const StatuteText: React.FC<StatuteTextProps> = ({ offense }) => {
+  const [loaded, setLoaded] = useState<LoadedText | null>(null);
+  const pending = offense.statuteText === undefined && offense.textRef ? offense.textRef : null;
+
+  useEffect(() => {
+    if (!pending) return;
+    let current = true;
+    loadOffenseText(offense)
+      .then(text => { if (current) setLoaded({ textRef: pending, statuteText: text.statuteText, statuteTree: text.statuteTree }); })
+      .catch(err => {
+        console.error('Failed to load statute text:', err);
+        if (current) setLoaded({ textRef: pending, failed: true });
+      });
+    return () => { current = false; };
+  }, [pending]);
+
+  if (!pending) return renderText(offense.statuteText || '', offense.statuteTree);
+  if (!loaded || loaded.textRef !== pending) {
+    return <div className="not-italic text-slate-400">Loading statute text...</div>;
+  }
+  if (loaded.failed) {
+    return <div className="not-italic text-slate-400">Statute text is not available offline yet.</div>;
+  }
+  return renderText(loaded.statuteText || '', loaded.statuteTree);
+};
@@ -1,11 +1,11 @@
 import pandas as pd
-import json
 import os
 
+from offense_store import load_records
+
 def convert_json_to_excel(json_path, excel_path):
     print(f"Reading {json_path}...")
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_records(json_path)
     
     print("Converting to DataFrame...")
     # Fields to extract: literal, citation, statute, level, elements, statuteText
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Numbered versions of the offense dataset, with deltas between them.
+
+Each time cjis_codes.json changes, this records a new version under
+data/versions/:
+
+    index.json          latest version, version hashes, available deltas
+    v{N}.json           snapshot of version N (text heap format), kept for
+                        the last KEEP_SNAPSHOTS versions
+    delta-{M}-{N}.json  what changed from version M to N
+
+The deltas are the build's record of what each data change did (--status
+lists them); apply_delta() replays one onto the previous version. The app
+does not read them, so they live outside public/ and are not deployed: it
+loads the offense index and the content-hashed text shards, which the
+service worker refreshes file by file (precache_manifest.py).
+
+Records are keyed by literal; repeated literals get '#2', '#3', ... in
+dataset order. Both versions are reduced to {key: record hash}, so the
+diff only compares fields for keys whose hash differs. A delta lists added
+records, removed keys and per-key field changes ({set: {...}, unset: [...]}).
+Records are kept in canonical order (by literal, as in cjis_codes_index.ts), so
+applying a delta and re-sorting gives exactly the new version.
+
+Usage:
+    python dataset_versions.py            # record a version if the data changed
+    python dataset_versions.py --status   # show versions and deltas
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+from offense_store import JSON_FILE, load_records, pack_records, unpack_records
+from run_report import run_report
+
+VERSIONS_DIR = os.path.join('data', 'versions')
+INDEX_FILE = 'index.json'
+KEEP_SNAPSHOTS = 2
+
+
+def canonical(records):
+    # The order generate_ts_data.py writes cjis_codes_index.ts in
+    return sorted(records, key=lambda r: r.get('literal', ''))
+
+
+def record_keys(records):
+    """Stable keys: the literal, with '#n' for its nth repeat."""
+    seen = {}
+    keys = []
+    for record in records:
+        literal = record.get('literal', '')
+        seen[literal] = seen.get(literal, 0) + 1
+        keys.append(literal if seen[literal] == 1 else f"{literal}#{seen[literal]}")
+    return keys
+
+
+def record_hash(record):
+    return hashlib.sha1(json.dumps(record, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+
+
+def hash_index(records):
+    """{key: (record hash, record)} for records in canonical order."""
+    return {key: (record_hash(r), r) for key, r in zip(record_keys(records), records)}
+
+
+def dataset_hash(records):
+    digest = hashlib.sha256()
+    for record in records:
+        digest.update(record_hash(record).encode('ascii'))
+    return digest.hexdigest()[:16]
+
+
+def diff_records(old, new):
+    """Keyed delta from old to new (both in canonical order)."""
+    old_index = hash_index(old)
+    new_index = hash_index(new)
+    added = [r for key, (_, r) in new_index.items() if key not in old_index]
+    removed = [key for key in old_index if key not in new_index]
+    changed = {}
+    for key, (digest, record) in new_index.items():
+        previous = old_index.get(key)
+        if previous is None or previous[0] == digest:
+            continue
+        before = previous[1]
+        change = {}
+        updates = {f: v for f, v in record.items() if before.get(f) != v or f not in before}
+        if updates:
+            change['set'] = updates
+        dropped = [f for f in before if f not in record]
+        if dropped:
+            change['unset'] = dropped
+        changed[key] = change
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+
+def apply_delta(records, delta):
+    """Apply a delta to records in canonical order, giving the version it leads to."""
+    removed = set(delta['removed'])
+    out = []
+    for key, record in zip(record_keys(records), records):
+        if key in removed:
+            continue
+        change = delta['changed'].get(key)
+        if change:
+            record = {f: v for f, v in record.items() if f not in change.get('unset', ())}
+            record.update(change.get('set', {}))
+        out.append(record)
+    return canonical(out + delta['added'])
+
+
+def load_index(versions_dir=VERSIONS_DIR):
+    path = os.path.join(versions_dir, INDEX_FILE)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {'latest': 0, 'versions': [], 'deltas': []}
+
+
+def _write_json(path, data, **kwargs):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, **kwargs)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def load_snapshot(version, versions_dir=VERSIONS_DIR):
+    with open(os.path.join(versions_dir, f"v{version}.json"), 'r', encoding='utf-8') as f:
+        return unpack_records(json.load(f))
+
+
+def record_version(json_path=JSON_FILE, versions_dir=VERSIONS_DIR, keep=KEEP_SNAPSHOTS):
+    """Add a version if the dataset changed. Returns the new version number, or None."""
+    records = canonical(load_records(json_path))
+    digest = dataset_hash(records)
+    index = load_index(versions_dir)
+    if index['versions'] and index['versions'][-1]['hash'] == digest:
+        print(f"Dataset unchanged; still version {index['latest']} ({digest}).")
+        return None
+
+    os.makedirs(versions_dir, exist_ok=True)
+    started = time.perf_counter()
+    version = index['latest'] + 1
+    _write_json(os.path.join(versions_dir, f"v{version}.json"), pack_records(records), separators=(',', ':'))
+    index['versions'].append({'version': version, 'hash': digest, 'records': len(records)})
+
+    previous = index['latest']
+    if previous and os.path.exists(os.path.join(versions_dir, f"v{previous}.json")):
+        delta = diff_records(load_snapshot(previous, versions_dir), records)
+        delta.update({'from': previous, 'to': version,
+                      'fromHash': index['versions'][-2]['hash'], 'toHash': digest})
+        name = f"delta-{previous}-{version}.json"
+        size = _write_json(os.path.join(versions_dir, name), delta, separators=(',', ':'))
+        index['deltas'].append({'from': previous, 'to': version, 'file': name, 'size': size,
+                                'added': len(delta['added']), 'removed': len(delta['removed']),
+                                'changed': len(delta['changed'])})
+        print(f"Delta {previous} -> {version}: {len(delta['added'])} added, {len(delta['removed'])} removed, "
+              f"{len(delta['changed'])} changed ({size // 1024} KB) in {time.perf_counter() - started:.2f}s")
+    index['latest'] = version
+
+    # Old snapshots are not needed once their deltas exist
+    for entry in index['versions'][:-keep]:
+        path = os.path.join(versions_dir, f"v{entry['version']}.json")
+        if os.path.exists(path):
+            os.remove(path)
+    for entry in index['versions']:
+        entry['snapshot'] = os.path.exists(os.path.join(versions_dir, f"v{entry['version']}.json"))
+
+    _write_json(os.path.join(versions_dir, INDEX_FILE), index, indent=2)
+    print(f"Recorded version {version} ({digest}, {len(records)} records).")
+    return version
+
+
+def print_status(versions_dir=VERSIONS_DIR):
+    index = load_index(versions_dir)
+    if not index['versions']:
+        print("No versions recorded.")
+        return
+    for entry in index['versions']:
+        print(f"v{entry['version']}: {entry['hash']} {entry['records']} records"
+              f"{' (snapshot)' if entry.get('snapshot') else ''}")
+    for delta in index['deltas']:
+        print(f"{delta['file']}: +{delta['added']} -{delta['removed']} ~{delta['changed']} ({delta['size']} bytes)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--status', action='store_true', help='list versions and deltas')
+    parser.add_argument('--keep', type=int, default=KEEP_SNAPSHOTS,
+                        help=f'full snapshots to keep (default: {KEEP_SNAPSHOTS})')
+    args = parser.parse_args()
+    if args.status:
+        print_status()
+    else:
+        with run_report('dataset_versions') as report:
+            with report.stage('record_version'):
+                record_version(keep=max(1, args.keep))
+    sys.exit(0)
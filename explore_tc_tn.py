@@ -11,10 +11,12 @@ import os
 print("=" * 60)
 print("EXPLORING TC SHEET")
 print("=" * 60)
-wb = openpyxl.load_workbook('offense_codes_updated.xlsx')
+# read_only streams rows instead of building every cell in memory
+wb = openpyxl.load_workbook('offense_codes_updated.xlsx', read_only=True)
 ws = wb['TC']
 
-print(f"Total rows in TC sheet: {ws.max_row}")
+# Count by streaming; read_only max_row trusts the stored dimension record, which can be stale
+print(f"Total rows in TC sheet: {sum(1 for _ in ws.iter_rows(values_only=True))}")
 print("\nFirst 15 rows:")
 for row_num, row in enumerate(ws.iter_rows(min_row=1, max_row=15, max_col=6, values_only=True), 1):
     print(f"Row {row_num}: {row}")
@@ -1,30 +1,125 @@
 import pdfplumber
+import argparse
 import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-data = []
-with pdfplumber.open("Texas CJIS code v20.pdf") as pdf:
-    for page in pdf.pages:
-        table = page.extract_table()
-        if table:
-            headers = table[0]
-            # Check if this page has the same headers or if it's just data
-            start_row = 1 if headers == ['Code', 'Literal', 'Citation', 'Statute', 'L/D'] else 0
-            for row in table[start_row:]:
-                if len(row) == 5:
-                    # Map to the fields requested: Literal, Citation, Statute, L/D
-                    # row format: [Code, Literal, Citation, Statute, L/D]
-                    entry = {
-                        "literal": row[1],
-                        "citation": row[2],
-                        "statute": row[3],
-                        "level": row[4]
-                    }
-                    # Basic validation to avoid empty rows
-                    if any(entry.values()):
-                        data.append(entry)
-
-# Save to json
-with open("cjis_codes.json", "w") as f:
-    json.dump(data, f, indent=2)
-
-print(f"Extracted {len(data)} records.")
+from run_report import run_report
+from statute_cache import CACHE_DIR, cached_parse, file_digest, get_default_cache
+
+PDF_FILE = "Texas CJIS code v20.pdf"
+HEADERS = ['Code', 'Literal', 'Citation', 'Statute', 'L/D']
+
+# Bump when extract_records() output changes to invalidate the cache
+TABLE_PARSER_VERSION = 1
+
+# Per-range checkpoints for --workers runs, grouped by PDF content hash
+CHECKPOINT_DIR = os.path.join(CACHE_DIR, 'cjis_ranges')
+
+def records_from_table(table):
+    data = []
+    if table:
+        headers = table[0]
+        # Check if this page has the same headers or if it's just data
+        start_row = 1 if headers == HEADERS else 0
+        for row in table[start_row:]:
+            if len(row) == 5:
+                # Map to the fields requested: Literal, Citation, Statute, L/D
+                # row format: [Code, Literal, Citation, Statute, L/D]
+                entry = {
+                    "literal": row[1],
+                    "citation": row[2],
+                    "statute": row[3],
+                    "level": row[4]
+                }
+                # Basic validation to avoid empty rows
+                if any(entry.values()):
+                    data.append(entry)
+    return data
+
+def extract_records(pdf_path):
+    data = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            data.extend(records_from_table(page.extract_table()))
+    return data
+
+def extract_page_range(pdf_path, start, end, checkpoint_path):
+    """Extract pages [start, end) and write them to a checkpoint file."""
+    data = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages[start:end]:
+            data.extend(records_from_table(page.extract_table()))
+
+    # Write atomically so an interrupted run never leaves a partial checkpoint
+    tmp_path = checkpoint_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, checkpoint_path)
+    return start, end, len(data)
+
+def extract_records_parallel(pdf_path, workers=4, range_size=4, checkpoint_dir=CHECKPOINT_DIR):
+    """
+    Extract the PDF in page ranges over a process pool.
+
+    Each finished range is checkpointed, so a re-run after a crash extracts
+    only the ranges that are missing. Ranges are stitched back in page order,
+    giving the same records as extract_records().
+    """
+    run_dir = os.path.join(checkpoint_dir, f"{file_digest(pdf_path)[:16]}-{range_size}")
+    os.makedirs(run_dir, exist_ok=True)
+
+    with pdfplumber.open(pdf_path) as pdf:
+        n_pages = len(pdf.pages)
+    ranges = [(start, min(start + range_size, n_pages)) for start in range(0, n_pages, range_size)]
+
+    def checkpoint_path(start, end):
+        return os.path.join(run_dir, f"pages_{start:05d}_{end:05d}.json")
+
+    missing = [(start, end) for start, end in ranges if not os.path.exists(checkpoint_path(start, end))]
+    print(f"{n_pages} pages in {len(ranges)} ranges; "
+          f"{len(ranges) - len(missing)} checkpointed, {len(missing)} to extract with {workers} workers...")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(extract_page_range, pdf_path, start, end, checkpoint_path(start, end))
+                   for start, end in missing]
+        for future in as_completed(futures):
+            start, end, count = future.result()
+            print(f"  pages {start + 1}-{end}: {count} records")
+
+    data = []
+    for start, end in ranges:
+        with open(checkpoint_path(start, end), 'r', encoding='utf-8') as f:
+            data.extend(json.load(f))
+
+    # Everything is stitched; the checkpoints are no longer needed
+    shutil.rmtree(run_dir, ignore_errors=True)
+    return data
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract offense records from the Texas CJIS code PDF.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="extract page ranges in N worker processes with resumable checkpoints")
+    parser.add_argument("--range-size", type=int, default=4, help="pages per checkpointed range (default: 4)")
+    args = parser.parse_args()
+
+    if args.workers > 1:
+        def parse(path):
+            return extract_records_parallel(path, args.workers, args.range_size)
+    else:
+        parse = extract_records
+    with run_report('extract_cjis') as report:
+        with report.stage('extract_tables', cache=get_default_cache()) as stage:
+            with stage.file(PDF_FILE) as entry:
+                data = cached_parse(PDF_FILE, 'cjis_tables', TABLE_PARSER_VERSION, parse)
+                entry['rows'] = len(data)
+            stage.rows(rows_out=len(data))
+
+        # Save to json
+        with report.stage('write_json') as stage:
+            with open("cjis_codes.json", "w") as f:
+                json.dump(data, f, indent=2)
+            stage.rows(rows_in=len(data), rows_out=len(data))
+
+    print(f"Extracted {len(data)} records.")
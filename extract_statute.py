@@ -1,20 +1,120 @@
 import pypdfium2 as pdfium
-import sys
+import argparse
+import bisect
+import json
 import re
 
-def extract_statute_sections(pdf_path, statute_numbers):
+from statute_cache import cached_parse
+
+# Bump when read_page_texts() output changes to invalidate the cache
+PAGE_TEXT_VERSION = 1
+
+def read_page_texts(pdf_path):
+    """Return the text of every page of a PDF, in page order."""
     pdf = pdfium.PdfDocument(pdf_path)
-    n_pages = len(pdf)
+    texts = []
+    for i in range(len(pdf)):
+        page = pdf.get_page(i)
+        textpage = page.get_textpage()
+        texts.append(textpage.get_text_range())
+    return texts
+
+# Section header such as "Sec. 545.001." or "Sec. 22.041." at the start of a
+# line; mid-line notes such as "..., Sec. 2, see other Sec. 32.56." are not headers
+SECTION_HEADER_RE = re.compile(r"(?m)^Sec\. (\d+\.\d+[A-Za-z]?)\.")
+
+# Version notes between sections when a section has several texts, e.g.
+# "Text of section as added by Acts 2025, ..." or
+# "For text of section as added by Acts 2025, ..., see other Sec. 32.56."
+VERSION_NOTE_RE = re.compile(r"(?m)^(?:For text|Text) of section as ")
+
+# Running footer printed at the bottom of every page, e.g.
+# "PENAL CODE\r\nStatute text rendered on: 10/2/2025 - 11 -"
+PAGE_FOOTER_RE = re.compile(r"\s*[A-Z][A-Z ]* CODE\r?\nStatute text rendered on:[^\n]*\s*$")
+
+# Title/chapter/subchapter headings that precede the next section header
+TRAILING_HEADINGS_RE = re.compile(r"(?:\r?\n(?:TITLE|CHAPTER|SUBCHAPTER) [0-9A-Z-]+\.[^\n]*)+\s*$")
+
+class SectionIndex:
+    """
+    Every section of a statute PDF, found in a single pass.
+
+    Page texts are concatenated (minus the running footer) into one buffer
+    with a page-offset table, and one compiled scan records where each
+    "Sec. N." header starts. A section runs to the next header, so sections
+    that cross a page break come back whole, and each lookup is a slice.
+    """
+
+    def __init__(self, page_texts):
+        parts = []
+        self.page_offsets = []
+        offset = 0
+        for text in page_texts:
+            text = PAGE_FOOTER_RE.sub('', text)
+            self.page_offsets.append(offset)
+            parts.append(text)
+            offset += len(text) + 2
+        self.text = '\r\n'.join(parts)
+
+        # Start offset of every header, and the first one for each number
+        self.starts = []
+        self.first = {}
+        for m in SECTION_HEADER_RE.finditer(self.text):
+            self.first.setdefault(m.group(1), len(self.starts))
+            self.starts.append(m.start())
+
+    @classmethod
+    def from_pdf(cls, pdf_path):
+        return cls(cached_parse(pdf_path, 'pdfium_pages', PAGE_TEXT_VERSION, read_page_texts))
+
+    def numbers(self):
+        """Section numbers in document order (first occurrence only)."""
+        return list(self.first)
+
+    def span(self, num):
+        """Return (start, end) offsets of a section in the buffer, or None."""
+        i = self.first.get(num)
+        if i is None:
+            return None
+        start = self.starts[i]
+        end = self.starts[i + 1] if i + 1 < len(self.starts) else len(self.text)
+        note = VERSION_NOTE_RE.search(self.text, start, end)
+        return start, note.start() if note else end
+
+    def get(self, num):
+        span = self.span(num)
+        if span is None:
+            return None
+        return TRAILING_HEADINGS_RE.sub('', self.text[span[0]:span[1]]).strip()
+
+    def pages(self, num):
+        """Return the 0-based (first, last) pages a section appears on."""
+        span = self.span(num)
+        if span is None:
+            return None
+        first = bisect.bisect_right(self.page_offsets, span[0]) - 1
+        last = bisect.bisect_right(self.page_offsets, max(span[0], span[1] - 1)) - 1
+        return first, last
+
+    def all_sections(self):
+        return {num: self.get(num) for num in self.first}
+
+def extract_all_sections(pdf_path):
+    """Extract every section of a statute PDF in one pass."""
+    return SectionIndex.from_pdf(pdf_path).all_sections()
+
+def extract_statute_sections(pdf_path, statute_numbers, single_pass=False):
+    if single_pass:
+        index = SectionIndex.from_pdf(pdf_path)
+        return {num: index.get(num) for num in statute_numbers}
+
+    page_texts = cached_parse(pdf_path, 'pdfium_pages', PAGE_TEXT_VERSION, read_page_texts)
     
     results = {}
     for num in statute_numbers:
         results[num] = None
 
-    for i in range(n_pages):
-        page = pdf.get_page(i)
-        textpage = page.get_textpage()
-        text = textpage.get_text_range()
-        
+    for text in page_texts:
         for num in statute_numbers:
             if results[num] is not None:
                 continue
@@ -41,10 +141,27 @@ def extract_statute_sections(pdf_path, statute_numbers):
     return results
 
 if __name__ == "__main__":
-    pdf_file = "TRANSPORTATION CODE.pdf"
-    nums = sys.argv[1:]
-    res = extract_statute_sections(pdf_file, nums)
-    for num, text in res.items():
-        print(f"=== STATUTE {num} ===")
-        print(text)
-        print("=====================")
+    parser = argparse.ArgumentParser(description="Extract statute sections from a code PDF.")
+    parser.add_argument("numbers", nargs="*", help="section numbers such as 545.001")
+    parser.add_argument("--pdf", default="TRANSPORTATION CODE.pdf", help="statute PDF to read")
+    parser.add_argument("--single-pass", action="store_true",
+                        help="use the single-pass index so sections crossing a page break are not truncated")
+    parser.add_argument("--all", action="store_true",
+                        help="extract every section in one pass, including ones that cross pages")
+    parser.add_argument("--json", metavar="FILE", help="write {section: text} to FILE instead of printing")
+    args = parser.parse_args()
+
+    if args.all:
+        res = extract_all_sections(args.pdf)
+    else:
+        res = extract_statute_sections(args.pdf, args.numbers, single_pass=args.single_pass)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(res, f, indent=2, ensure_ascii=False)
+        print(f"Wrote {len(res)} sections to {args.json}")
+    else:
+        for num, text in res.items():
+            print(f"=== STATUTE {num} ===")
+            print(text)
+            print("=====================")
@@ -1,9 +1,8 @@
-import json
+from offense_store import load_records
 
 def find_misc_citations():
     try:
-        with open('cjis_codes.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_records('cjis_codes.json')
         
         results = [f"{o['literal']} (Citation: {o['citation']})" for o in data if 'MISC' in str(o.get('citation', '')).upper()]
         
@@ -1,14 +1,14 @@
 import pandas as pd
 import os
-import re
+
+from statute_classifier import StatuteClassifier
 
 def fix_missing_statutes(file_path):
     print(f"Loading {file_path} (ALL_OFFENSES sheet)...")
     df = pd.read_excel(file_path, sheet_name='ALL_OFFENSES')
     
-    # 1. Get unique existing statutes to use as a dictionary
-    # Filter out NaN/invalid values
-    statutes = sorted([str(s) for s in df['statute'].dropna().unique() if len(str(s)) > 1], key=len, reverse=True)
+    # 1. Build a prefix classifier from the existing statutes
+    classifier = StatuteClassifier.from_statute_column(df['statute'])
     
     # 2. Identify rows with missing statute
     # We clean statute column first
@@ -17,20 +17,14 @@ def fix_missing_statutes(file_path):
     
     print(f"Checking {mask.sum()} rows with missing statute...")
     
-    updates_count = 0
-    for idx in df[mask].index:
-        citation = str(df.at[idx, 'citation']).strip()
-        for s in statutes:
-            if citation.startswith(s):
-                # Update statute
-                df.at[idx, 'statute'] = s
-                # Remove prefix from citation
-                # Pattern: start of string, the statute code, followed by optional whitespace
-                new_citation = re.sub(f'^{re.escape(s)}\\s*', '', citation)
-                df.at[idx, 'citation'] = new_citation
-                updates_count += 1
-                break
-                
+    # Split every missing-statute citation into statute and remainder at once
+    parts = classifier.split(df.loc[mask, 'citation'])
+    classifier.report(parts)
+    parts = parts[parts['statute'].notna()]
+    df.loc[parts.index, 'statute'] = parts['statute']
+    df.loc[parts.index, 'citation'] = parts['remainder']
+    updates_count = len(parts)
+    
     print(f"Updated {updates_count} rows with extracted statutes.")
     
     # 3. Reorganize sheets
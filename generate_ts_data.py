@@ -1,17 +1,36 @@
-import json
+import argparse
 
-with open("cjis_codes.json", "r") as f:
-    data = json.load(f)
+from offense_store import OffenseStore
+from precache_manifest import MANIFEST_FILE, write_precache_manifest
+from run_report import run_report
+from search_index import SEARCH_INDEX_FILE, generated_order, write_search_index
 
-# Sort by literal
-data.sort(key=lambda x: x['literal'])
+parser = argparse.ArgumentParser(description="Generate the app's offense index, search index and text shards from cjis_codes.json.")
+parser.add_argument('--shard-by', choices=['statute', 'chapter'], default='statute',
+                    help='group text shards by statute (default) or statute chapter')
+args = parser.parse_args()
 
-content = "import { Offense } from './types';\n\n"
-content += "export const CJIS_CODES: Offense[] = "
-content += json.dumps(data, indent=2)
-content += ";\n"
+with run_report('generate_ts_data') as report:
+    with report.stage('load') as stage:
+        store = OffenseStore.load()
+        stage.rows(rows_out=len(store))
 
-with open("cjis_codes.ts", "w") as f:
-    f.write(content)
+    # Sort by literal
+    data = generated_order(store)
 
-print("Generated cjis_codes.ts with all records.")
+    # The search index follows the record order of cjis_codes_index.ts,
+    # so it is written here too
+    with report.stage('search_index') as stage:
+        size = write_search_index(data)
+        stage.rows(rows_in=len(data))
+    print(f"Generated {SEARCH_INDEX_FILE} ({size // 1024} KB).")
+
+    # The app bundles the slim index and fetches statute text from the shards
+    with report.stage('write_split') as stage:
+        size, shards = store.write_split(data, shard_by=args.shard_by)
+        stage.rows(rows_in=len(data), rows_out=shards)
+    print(f"Generated cjis_codes_index.ts ({size // 1024} KB) and {shards} text shard(s) by {args.shard_by}.")
+    with report.stage('precache_manifest') as stage:
+        count, total = write_precache_manifest()
+        stage.rows(rows_out=count)
+    print(f"Generated {MANIFEST_FILE}: {count} file(s), {total // 1024} KB.")
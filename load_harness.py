@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test: run the whole data build over synthetic corpora of
+increasing size and chart time and memory against size.
+
+For each size, synth_corpus.py writes a fresh corpus (cold caches) and
+pipeline.py --report builds it. The per-stage run reports give wall time
+and the max RSS of each stage's processes (workers included). tracemalloc
+is left off (RUN_TRACE_MEMORY=0) because it slows the PDF and workbook
+parsers several times over; pass --trace-memory to record its peaks as
+well. Results go to load_report.json in the work directory, with the charts
+printed at the end. The scaling column is the exponent k in time ~ size^k
+between the smallest and largest sizes: 1 is linear, 2 quadratic.
+
+Usage:
+    python load_harness.py                 # 1x, 10x and 100x today's data
+    python load_harness.py 0.5 1 2 --jobs 2 --keep
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from run_report import PIPELINE_REPORT, TRACE_MEMORY_ENV
+from synth_corpus import generate
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZES = [1, 10, 100]
+DEFAULT_WORKDIR = os.path.join('.cache', 'load')
+BAR_WIDTH = 40
+
+
+def run_size(size, workdir, jobs, seed, keep, trace_memory=False):
+    corpus_dir = os.path.join(workdir, f"x{size:g}")
+    shutil.rmtree(corpus_dir, ignore_errors=True)
+    print(f"\n=== {size:g}x ===")
+    started = time.perf_counter()
+    corpus = generate(corpus_dir, size, seed)
+    generate_s = time.perf_counter() - started
+    print(f"Generated corpus in {generate_s:.1f}s: {corpus['offenses']} offenses, "
+          f"{corpus['pc_sections'] + corpus['tc_sections']} sections, {corpus['cjis_pages']} PDF pages")
+
+    command = [sys.executable, os.path.join(REPO_DIR, 'pipeline.py'), '--workdir', corpus_dir,
+               '--report', '-j', str(jobs)]
+    env = dict(os.environ, **{TRACE_MEMORY_ENV: '1' if trace_memory else '0'})
+    started = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True, env=env)
+    wall_s = time.perf_counter() - started
+    if result.returncode != 0:
+        print((result.stdout + result.stderr).rstrip())
+        print(f"Pipeline failed at {size:g}x (exit code {result.returncode}).")
+
+    report_path = os.path.join(corpus_dir, PIPELINE_REPORT)
+    report = {'runs': []}
+    if os.path.exists(report_path):
+        with open(report_path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    stages = {}
+    peak_kb = max_rss_kb = 0
+    for run in report['runs']:
+        stages[run['stage']] = run['wall_s']
+        if run.get('report'):
+            peak_kb = max(peak_kb, run['report']['peak_kb'] or 0)
+            max_rss_kb = max(max_rss_kb, run['report']['max_rss_kb'] or 0)
+    print(f"Pipeline {'ok' if result.returncode == 0 else 'FAILED'} in {wall_s:.1f}s, "
+          f"max RSS {max_rss_kb // 1024} MB")
+
+    if not keep:
+        shutil.rmtree(corpus_dir, ignore_errors=True)
+    return {'size': size, 'ok': result.returncode == 0, 'corpus': corpus, 'generate_s': round(generate_s, 3),
+            'wall_s': round(wall_s, 3), 'stages': stages, 'peak_kb': peak_kb, 'max_rss_kb': max_rss_kb}
+
+
+def bar_chart(title, results, key, unit, scale=1):
+    print(f"\n{title}")
+    top = max((r[key] for r in results), default=0) or 1
+    for r in results:
+        value = r[key] / scale
+        bar = '#' * max(1, round(BAR_WIDTH * r[key] / top))
+        print(f"  {r['size']:>6g}x |{bar:<{BAR_WIDTH}} {value:,.1f} {unit}")
+
+
+def growth(results, values):
+    """Exponent k of value ~ size^k between the first and last size."""
+    first, last = results[0], results[-1]
+    a, b = values(first), values(last)
+    if len(results) < 2 or not a or not b or first['size'] == last['size']:
+        return None
+    return math.log(b / a) / math.log(last['size'] / first['size'])
+
+
+def print_charts(results):
+    bar_chart("Pipeline wall time", results, 'wall_s', 's')
+    bar_chart("Memory: max RSS of any stage", results, 'max_rss_kb', 'MB', 1024)
+    if any(r['peak_kb'] for r in results):
+        bar_chart("Memory: tracemalloc peak of any stage", results, 'peak_kb', 'MB', 1024)
+
+    stage_names = list(dict.fromkeys(name for r in results for name in r['stages']))
+    header = ''.join(f"{r['size']:>10g}x" for r in results)
+    print(f"\n{'stage (s)':<22}{header}   scaling")
+    for name in stage_names + ['total']:
+        if name == 'total':
+            values = lambda r: r['wall_s']
+        else:
+            values = lambda r, name=name: r['stages'].get(name, 0)
+        cells = ''.join(f"{values(r):>11.1f}" for r in results)
+        k = growth(results, values)
+        print(f"{name:<22}{cells}   {'-' if k is None else f'n^{k:.2f}'}")
+
+
+def main(sizes, workdir, jobs, seed, keep, trace_memory=False):
+    os.makedirs(workdir, exist_ok=True)
+    results = [run_size(size, workdir, jobs, seed, keep, trace_memory) for size in sorted(sizes)]
+    report_path = os.path.join(workdir, 'load_report.json')
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print_charts(results)
+    print(f"\nResults written to {report_path}")
+    return 0 if all(r['ok'] for r in results) else 1
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('sizes', nargs='*', type=float, default=DEFAULT_SIZES,
+                        help="corpus sizes as multiples of today's data (default: 1 10 100)")
+    parser.add_argument('--workdir', default=DEFAULT_WORKDIR, help=f'where corpora are built (default: {DEFAULT_WORKDIR})')
+    parser.add_argument('-j', '--jobs', type=int, default=4, help='pipeline stages to run concurrently (default: 4)')
+    parser.add_argument('--seed', type=int, default=1, help='corpus random seed (default: 1)')
+    parser.add_argument('--keep', action='store_true', help='keep the generated corpora and build outputs')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='also record tracemalloc peaks (slows every stage)')
+    args = parser.parse_args()
+    sys.exit(main(args.sizes, os.path.abspath(args.workdir), args.jobs, args.seed, args.keep, args.trace_memory))
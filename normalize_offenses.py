@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+One-pass normalization of offense_codes.xlsx.
+
+The normalizations used to be separate scripts, each loading the workbook,
+changing one thing and writing it back. Here they are declared as data in
+RULES and applied to the offense sheet in order, each as one vectorized
+update, with a single load and a single save. A rule is a dict with:
+
+- name:         used to select rules and in the hit counts
+- column:       the column to match on
+- prefix:       match rows whose value starts with this (leading space ignored)
+- equals:       or match rows whose value is exactly this
+- set:          {column: value} to write on matching rows
+- default:      {column: value} to write on matching rows where it is blank
+- strip_prefix: remove the prefix and any following space from column
+- as_text:      [columns] to store as text (blank -> ''), on every row
+
+Usage:
+    python normalize_offenses.py [offense_codes.xlsx] [--rule NAME ...] [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+from statute_classifier import StatuteClassifier
+
+EXCEL_FILE = 'offense_codes.xlsx'
+
+RULES = [
+    {'name': 'text_columns', 'as_text': ['citation', 'statute']},
+    {'name': 'trc_citation', 'column': 'citation', 'prefix': 'TRC',
+     'set': {'statute': 'TC'}, 'default': {'level': 'MC'}, 'strip_prefix': True},
+    {'name': 'hsc_citation', 'column': 'citation', 'prefix': 'HSC',
+     'set': {'statute': 'HSC'}, 'strip_prefix': True},
+    {'name': 'trc_statute', 'column': 'statute', 'equals': 'TRC',
+     'set': {'statute': 'TC'}},
+    {'name': 'co_statute', 'column': 'statute', 'equals': 'CO',
+     'set': {'statute': 'ORD'}},
+    {'name': 'ord_citation', 'column': 'citation', 'prefix': 'ORD',
+     'set': {'statute': 'ORD'}, 'strip_prefix': True},
+]
+
+
+def select_rules(names=None):
+    if not names:
+        return RULES
+    by_name = {rule['name']: rule for rule in RULES}
+    unknown = [n for n in names if n not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown rule(s): {', '.join(unknown)}. Known: {', '.join(by_name)}")
+    return [by_name[n] for n in names]
+
+
+def match_rule(df, rule):
+    """Return (mask, remainder) for a rule; remainder is None unless it matches a prefix."""
+    column = df[rule['column']]
+    if 'prefix' in rule:
+        parts = StatuteClassifier([rule['prefix']]).split(column)
+        return parts['statute'].notna(), parts['remainder']
+    return column == rule['equals'], None
+
+
+def _writable(df, column):
+    # Numeric columns (e.g. an all-blank level column) cannot take strings
+    if column in df.columns and df[column].dtype.kind in 'biuf':
+        df[column] = df[column].astype(object)
+
+
+def as_text(df, columns):
+    """Store columns as text, e.g. a citation read as the number 545.104. Returns cells converted."""
+    converted = 0
+    for column in columns:
+        values = df[column]
+        converted += int((values.notna() & ~values.map(lambda v: isinstance(v, str))).sum())
+        df[column] = values.fillna('').astype(str)
+    return converted
+
+
+def apply_rules(df, rules):
+    """
+    Apply rules to df in place, in order. Returns {rule name: hits}: rows
+    matched, or cells converted for an as_text rule.
+    """
+    hits = {}
+    for rule in rules:
+        if 'as_text' in rule:
+            hits[rule['name']] = as_text(df, rule['as_text'])
+            continue
+        mask, remainder = match_rule(df, rule)
+        hits[rule['name']] = int(mask.sum())
+        if not hits[rule['name']]:
+            continue
+        for column, value in rule.get('default', {}).items():
+            blank = df[column].isna() | (df[column].astype(str).str.strip() == '')
+            _writable(df, column)
+            df.loc[mask & blank, column] = value
+        for column, value in rule.get('set', {}).items():
+            _writable(df, column)
+            df.loc[mask, column] = value
+        if rule.get('strip_prefix') and remainder is not None:
+            _writable(df, rule['column'])
+            df.loc[mask, rule['column']] = remainder[mask]
+    return hits
+
+
+def normalize_workbook(file_path, rule_names=None, dry_run=False):
+    """Normalize the first (offense) sheet; any other sheets are written back unchanged."""
+    rules = select_rules(rule_names)
+    print(f"Loading {file_path}...")
+    sheets = pd.read_excel(file_path, sheet_name=None)
+    first = next(iter(sheets))
+
+    hits = apply_rules(sheets[first], rules)
+    for rule in rules:
+        print(f"  {rule['name']:<14} {hits[rule['name']]} hit(s)")
+
+    if dry_run:
+        print("Dry run; workbook not saved.")
+        return hits
+    print(f"Saving changes to {file_path}...")
+    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+    print("Normalization complete!")
+    return hits
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('file', nargs='?', default=EXCEL_FILE, help=f'workbook to normalize (default: {EXCEL_FILE})')
+    parser.add_argument('--rule', action='append', dest='rules', metavar='NAME',
+                        help=f"apply only this rule (repeatable): {', '.join(r['name'] for r in RULES)}")
+    parser.add_argument('--dry-run', action='store_true', help='report hit counts without saving')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.file):
+        print(f"Error: {args.file} does not exist.")
+        sys.exit(1)
+    try:
+        normalize_workbook(args.file, args.rules, args.dry_run)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
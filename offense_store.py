@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Shared in-memory store for cjis_codes.json.
+
+The cleanup and sync scripts used to each load the whole file, scan the list
+for the records they care about, and dump both cjis_codes.json and
+cjis_codes.ts again. OffenseStore loads the file once, keeps hash indexes by
+literal, citation, statute and level, applies edits in memory, and writes
+cjis_codes.json once in flush(). Several scripts can share one store, so a
+chain of cleanups costs one load and one write. The app reads none of this
+directly: generate_ts_data.py turns the file into the slim index and text
+shards (write_split()).
+
+Many offenses cite the same section, so the same statuteText (or elements,
+or statuteTree) body used to be repeated dozens of times. The file is
+written as a text heap: each unique body is stored once in a table and
+records refer to it by index. load_records() resolves the references, and also reads the plain list
+extract_cjis.py writes, so readers never see the heap.
+
+    store = OffenseStore.load()
+    store.apply([
+        ('set', 'CITY WARRANT', {'level': ''}),
+        ('delete', 'Welfare Concern'),
+        ('filter', lambda o: 'MISC' not in o.get('citation', '')),
+    ])
+    store.flush()
+"""
+
+import json
+import os
+import re
+from collections import defaultdict
+
+from precache_manifest import hashed_name
+
+JSON_FILE = 'cjis_codes.json'
+
+INDEXED_FIELDS = ('literal', 'citation', 'statute', 'level')
+
+HEAP_FORMAT = 'offense-heap/1'
+HEAP_FIELDS = ('statuteText', 'elements', 'statuteTree')
+
+# Split output: a slim index for the bundle plus statute text shards that
+# the app fetches on demand (see offense_text.ts)
+INDEX_TS_FILE = 'cjis_codes_index.ts'
+SHARD_DIR = os.path.join('public', 'data', 'offense_text')
+TEXT_FIELDS = ('elements', 'statuteText', 'statuteTree')
+INDEX_TS_HEADER = "import { OffenseIndexEntry } from './types';\n\nexport const CJIS_INDEX: OffenseIndexEntry[] = "
+
+
+def index_key(value):
+    """Normalize a field value the way the scripts compare them."""
+    return str(value or '').strip()
+
+
+def _heap_key(value):
+    """The key a heap body is shared by: the text itself, or a tree's JSON."""
+    if isinstance(value, str) and value:
+        return value
+    if isinstance(value, list) and value:
+        return json.dumps(value, separators=(',', ':'))
+    return None
+
+
+def pack_records(records):
+    """Heap payload: each unique HEAP_FIELDS body once, records holding its index."""
+    texts = {field: [] for field in HEAP_FIELDS}
+    refs = {field: {} for field in HEAP_FIELDS}
+    packed = []
+    for record in records:
+        record = dict(record)
+        for field in HEAP_FIELDS:
+            value = record.get(field)
+            key = _heap_key(value)
+            if key is not None:
+                ref = refs[field].get(key)
+                if ref is None:
+                    ref = refs[field][key] = len(texts[field])
+                    texts[field].append(value)
+                record[field] = ref
+        packed.append(record)
+    return {'format': HEAP_FORMAT, 'texts': texts, 'records': packed}
+
+
+def unpack_records(payload):
+    """Records from a heap payload, or the payload itself if it is a plain list."""
+    if isinstance(payload, list):
+        return payload
+    texts = payload['texts']
+    records = []
+    for record in payload['records']:
+        for field, table in texts.items():
+            ref = record.get(field)
+            if isinstance(ref, int):
+                record[field] = table[ref]
+        records.append(record)
+    return records
+
+
+def load_records(json_path=JSON_FILE):
+    """Read cjis_codes.json as a list of plain records, in either format."""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return unpack_records(json.load(f))
+
+
+def heap_savings(payload):
+    """Bytes of text the heap avoids repeating (UTF-8)."""
+    saved = 0
+    for field, table in payload['texts'].items():
+        sizes = [len(_heap_key(text).encode('utf-8')) for text in table]
+        for record in payload['records']:
+            ref = record.get(field)
+            if isinstance(ref, int):
+                saved += sizes[ref]
+        saved -= sum(sizes)
+    return saved
+
+
+def shard_key(record, shard_by='statute'):
+    """Shard name for a record's text: its statute, or statute-chapter (PC-22)."""
+    key = index_key(record.get('statute')) or 'NONE'
+    if shard_by == 'chapter':
+        chapter = re.match(r'\s*(\d+)', str(record.get('citation') or ''))
+        if chapter:
+            key += '-' + chapter.group(1)
+    return re.sub(r'[^A-Za-z0-9_-]', '_', key)
+
+
+class OffenseStore:
+    def __init__(self, records=(), json_path=JSON_FILE):
+        self.json_path = json_path
+        self._records = {}
+        self._next_id = 0
+        self._indexes = {field: defaultdict(set) for field in INDEXED_FIELDS}
+        self.dirty = False
+        self.bytes_saved = 0
+        for record in records:
+            self._insert(record)
+
+    @classmethod
+    def load(cls, json_path=JSON_FILE):
+        return cls(load_records(json_path), json_path)
+
+    # -- Reading -----------------------------------------------------------
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(list(self._records.values()))
+
+    def records(self):
+        """All records in file order."""
+        return list(self._records.values())
+
+    def find(self, field, value):
+        """Records whose indexed field equals value (stripped), in file order."""
+        ids = self._indexes[field].get(index_key(value))
+        if not ids:
+            return []
+        return [self._records[i] for i in sorted(ids)]
+
+    def get(self, literal):
+        """First record with this literal, or None."""
+        found = self.find('literal', literal)
+        return found[0] if found else None
+
+    def literals(self):
+        return [k for k, ids in self._indexes['literal'].items() if ids]
+
+    # -- Editing -----------------------------------------------------------
+
+    def _insert(self, record):
+        record_id = self._next_id
+        self._next_id += 1
+        self._records[record_id] = record
+        for field in INDEXED_FIELDS:
+            self._indexes[field][index_key(record.get(field))].add(record_id)
+        return record_id
+
+    def _remove(self, record_id):
+        record = self._records.pop(record_id)
+        for field in INDEXED_FIELDS:
+            self._indexes[field][index_key(record.get(field))].discard(record_id)
+
+    def _ids(self, field, value):
+        return sorted(self._indexes[field].get(index_key(value), ()))
+
+    def _id_of(self, record):
+        # Records are looked up by literal first to avoid a full scan
+        for record_id in self._ids('literal', record.get('literal')):
+            if self._records[record_id] is record:
+                return record_id
+        for record_id, candidate in self._records.items():
+            if candidate is record:
+                return record_id
+        raise KeyError(record.get('literal'))
+
+    def update(self, record, **fields):
+        """Set fields on one record, keeping the indexes current."""
+        record_id = self._id_of(record)
+        changed = False
+        for field, value in fields.items():
+            if record.get(field) == value and field in record:
+                continue
+            if field in self._indexes:
+                self._indexes[field][index_key(record.get(field))].discard(record_id)
+                self._indexes[field][index_key(value)].add(record_id)
+            record[field] = value
+            changed = True
+        if changed:
+            self.dirty = True
+        return changed
+
+    def add(self, record):
+        self._insert(record)
+        self.dirty = True
+
+    def set(self, literal, fields):
+        """Set fields on every record with this literal. Returns the count."""
+        count = 0
+        for record in self.find('literal', literal):
+            self.update(record, **fields)
+            count += 1
+        return count
+
+    def delete(self, literal):
+        """Remove every record with this literal. Returns the count."""
+        ids = self._ids('literal', literal)
+        for record_id in ids:
+            self._remove(record_id)
+        if ids:
+            self.dirty = True
+        return len(ids)
+
+    def filter(self, predicate):
+        """Keep only records for which predicate(record) is true. Returns the number removed."""
+        drop = [i for i, record in self._records.items() if not predicate(record)]
+        for record_id in drop:
+            self._remove(record_id)
+        if drop:
+            self.dirty = True
+        return len(drop)
+
+    def sort(self, key):
+        ordered = sorted(self._records.items(), key=lambda item: key(item[1]))
+        if [i for i, _ in ordered] != list(self._records):
+            self._records = dict(ordered)
+            self.dirty = True
+
+    def apply(self, edits):
+        """
+        Apply a batch of edits in order and return the count for each one.
+
+        Each edit is ('set', literal, {field: value}), ('delete', literal),
+        ('filter', predicate) or ('add', record).
+        """
+        counts = []
+        for edit in edits:
+            op = edit[0]
+            if op == 'set':
+                counts.append(self.set(edit[1], edit[2]))
+            elif op == 'delete':
+                counts.append(self.delete(edit[1]))
+            elif op == 'filter':
+                counts.append(self.filter(edit[1]))
+            elif op == 'add':
+                self.add(edit[1])
+                counts.append(1)
+            else:
+                raise ValueError(f"Unknown edit: {op!r}")
+        return counts
+
+    # -- Writing -----------------------------------------------------------
+
+    def write_split(self, records=None, index_path=INDEX_TS_FILE, shard_dir=SHARD_DIR, shard_by='statute'):
+        """
+        Write a slim index TS (every field but the text bodies, plus a
+        textRef 'SHARD:slot') and one JSON array of text bodies per shard.
+        Shard files are named by content hash (PC.1f3a9c0b2e.json) and the
+        index maps shard names to them in TEXT_SHARDS, so an unchanged shard
+        keeps its URL. Files no longer produced are removed. Returns
+        (index bytes, shards).
+        """
+        records = self.records() if records is None else records
+        index = []
+        shards = defaultdict(list)
+        slots = defaultdict(dict)
+        for record in records:
+            entry = {k: v for k, v in record.items() if k not in TEXT_FIELDS and k != 'id'}
+            text = {k: record[k] for k in TEXT_FIELDS if record.get(k)}
+            if text:
+                shard = shard_key(record, shard_by)
+                # Offenses citing the same section share one slot
+                key = json.dumps(text, sort_keys=True)
+                if key not in slots[shard]:
+                    slots[shard][key] = len(shards[shard])
+                    shards[shard].append(text)
+                entry['textRef'] = f"{shard}:{slots[shard][key]}"
+            index.append(entry)
+
+        os.makedirs(shard_dir, exist_ok=True)
+        files = {}
+        for shard in sorted(shards):
+            data = json.dumps(shards[shard], ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            files[shard] = hashed_name(shard, data)
+            path = os.path.join(shard_dir, files[shard])
+            if not os.path.exists(path):
+                with open(path, 'wb') as f:
+                    f.write(data)
+        for name in os.listdir(shard_dir):
+            if name.endswith('.json') and name not in files.values():
+                os.remove(os.path.join(shard_dir, name))
+
+        # One compact record per line keeps the index small but diffable
+        body = ',\n'.join(json.dumps(e, ensure_ascii=False, separators=(',', ':')) for e in index)
+        with open(index_path, 'w', encoding='utf-8') as f:
+            f.write(INDEX_TS_HEADER)
+            f.write('[\n' + body + '\n];\n\n')
+            f.write('export const TEXT_SHARDS: Record<string, string> = ')
+            f.write(json.dumps(files, indent=2))
+            f.write(';\n')
+        return os.path.getsize(index_path), len(shards)
+
+    def flush(self, force=False):
+        """Write cjis_codes.json once, if anything changed."""
+        if not (self.dirty or force or not os.path.exists(self.json_path)):
+            return False
+        payload = pack_records(self.records())
+        with open(self.json_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+        self.bytes_saved = heap_savings(payload)
+        self.dirty = False
+        return True
@@ -0,0 +1,46 @@
+import { Offense, OffenseIndexEntry } from './types';
+import { TEXT_SHARDS } from './cjis_codes_index';
+
+// Text shards written by generate_ts_data.py into public/. The app bundles
+// only the slim CJIS_INDEX and fetches an offense's elements and statute text
+// from its shard when the offense is added, edited or viewed.
+// File names carry a content hash (TEXT_SHARDS), so they are cached forever.
+export const OFFENSE_TEXT_BASE = '/data/offense_text/';
+
+type OffenseText = Pick<Offense, 'elements' | 'statuteText' | 'statuteTree'>;
+
+const shardCache = new Map<string, Promise<OffenseText[]>>();
+
+const loadShard = (shard: string): Promise<OffenseText[]> => {
+  let pending = shardCache.get(shard);
+  if (!pending) {
+    pending = fetch(`${OFFENSE_TEXT_BASE}${TEXT_SHARDS[shard]}`).then(res => {
+      if (!res.ok) throw new Error(`Failed to load offense text shard ${shard}: ${res.status}`);
+      return res.json() as Promise<OffenseText[]>;
+    });
+    // Let a failed shard be retried on the next request
+    pending.catch(() => shardCache.delete(shard));
+    shardCache.set(shard, pending);
+  }
+  return pending;
+};
+
+export const loadOffenseText = async (entry: OffenseIndexEntry): Promise<OffenseText> => {
+  if (!entry.textRef) return {};
+  const sep = entry.textRef.lastIndexOf(':');
+  const texts = await loadShard(entry.textRef.slice(0, sep));
+  return texts[Number(entry.textRef.slice(sep + 1))] || {};
+};
+
+// Full Offense for an index entry, fetching its shard the first time. An
+// entry without a textRef (e.g. a custom override) is returned as it is.
+export const hydrateOffense = async (entry: OffenseIndexEntry): Promise<Offense> => {
+  const { textRef, ...offense } = entry;
+  return { ...offense, ...(await loadOffenseText(entry)) };
+};
+
+// Warm the shards for entries likely to be opened (e.g. current search results)
+export const prefetchOffenseText = (entries: OffenseIndexEntry[]): void => {
+  const shards = new Set(entries.map(e => e.textRef?.slice(0, e.textRef.lastIndexOf(':'))).filter(Boolean));
+  shards.forEach(shard => { loadShard(shard as string).catch(() => undefined); });
+};
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Incremental runner for the offense data build.
+
+Each stage is one of the existing scripts with its declared input and output
+files. Stages are ordered by the files they share: a stage runs after the
+last earlier stage that writes any file it reads or writes. A stage is re-run
+only when something it depends on changed:
+- its script or a local module it imports changed
+- an external input changed (a source file no earlier stage produces)
+- an upstream stage re-ran in this build
+- one of its outputs is missing or was edited outside the pipeline
+- it failed, or was skipped after an upstream failure, in the last build
+
+Fingerprints are content hashes, re-hashed only when a file's mtime or size
+moves, and are kept in .cache/pipeline_state.json in the work directory.
+Independent stages (e.g. the CJIS PDF and PE.htm passes) run concurrently.
+
+With --report, each stage that runs writes a run report (run_report.py:
+wall/CPU time, rows, cache hits and memory per phase and input file) and
+the build collects them in .cache/run_report.json. --profile NAME runs the
+stage (or a phase within a stage) of that name under cProfile.
+
+Usage:
+    python pipeline.py                 # build whatever is out of date
+    python pipeline.py --dry-run       # show what would run
+    python pipeline.py --force TARGET  # re-run TARGET; its upstream stages only if out of date
+    python pipeline.py --report        # also write .cache/run_report.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+from run_report import PIPELINE_REPORT, PROFILE_ENV, REPORT_ENV, load_report
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_FILE = os.path.join('.cache', 'pipeline_state.json')
+STAGE_REPORT_DIR = os.path.join('.cache', 'reports')
+
+
+class Stage:
+    """
+    One script with the files it reads and writes. Optional inputs are
+    fingerprinted like the others (so the stage re-runs when one appears,
+    changes or goes away) but a missing one does not fail the stage.
+    """
+
+    def __init__(self, name, script, inputs, outputs, args=(), optional=()):
+        self.name = name
+        self.script = script
+        self.inputs = list(inputs) + list(optional)
+        self.optional = set(optional)
+        self.outputs = list(outputs)
+        self.args = list(args)
+
+
+# Declaration order is build order for stages that share files
+STAGES = [
+    Stage('extract_cjis', 'extract_cjis.py',
+          inputs=['Texas CJIS code v20.pdf'],
+          outputs=['cjis_codes.json'],
+          args=['--workers', '4']),
+    # PC text comes from PE.htm or, failing that, PENALCODE.pdf (statute_source.py)
+    Stage('update_statute_text', 'update_statute_text.py',
+          inputs=['offense_codes.xlsx'],
+          outputs=['offense_codes_updated.xlsx'],
+          optional=['PE.htm', 'PENALCODE.pdf', 'statutes']),
+    Stage('xref_graph', 'xref_graph.py',
+          inputs=['TN.doc'],
+          outputs=['xref_graph.json', 'xref_graph.ts'],
+          optional=['PE.htm']),
+    Stage('process_tc_sheet', 'process_tc_sheet.py',
+          inputs=['TN.doc', 'offense_codes_updated.xlsx', 'xref_graph.json'],
+          outputs=['offense_codes_updated.xlsx'],
+          args=['--workers', '4'],
+          optional=['TRANSPORTATION CODE.pdf', 'statutes']),
+    Stage('cleanup_offenses', 'cleanup_offenses.py',
+          inputs=['offense_codes_updated.xlsx', 'cjis_codes.json'],
+          outputs=['cjis_codes.json']),
+    Stage('generate_ts_data', 'generate_ts_data.py',
+          inputs=['cjis_codes.json'],
+          outputs=['cjis_search_index.ts', 'cjis_codes_index.ts',
+                   os.path.join('public', 'data', 'offense_text'),
+                   os.path.join('public', 'data', 'precache-manifest.json')]),
+    Stage('dataset_versions', 'dataset_versions.py',
+          inputs=['cjis_codes.json'],
+          outputs=[os.path.join('data', 'versions')]),
+]
+
+
+def build_graph(stages):
+    """
+    Return ({stage name: set of upstream stage names}, {stage name: external inputs}).
+
+    A stage depends on the last earlier writer of every file it touches, and
+    on earlier readers of files it overwrites.
+    """
+    deps = {}
+    external = {}
+    last_writer = {}
+    readers = {}
+    for stage in stages:
+        needs = set()
+        for path in stage.inputs + stage.outputs:
+            if path in last_writer:
+                needs.add(last_writer[path])
+        for path in stage.outputs:
+            needs.update(readers.get(path, ()))
+        needs.discard(stage.name)
+        deps[stage.name] = needs
+        external[stage.name] = [p for p in stage.inputs
+                                if p not in last_writer and p not in stage.outputs]
+        for path in stage.inputs:
+            readers.setdefault(path, set()).add(stage.name)
+        for path in stage.outputs:
+            last_writer[path] = stage.name
+            readers[path] = set()
+    return deps, external
+
+
+def local_modules(script, seen=None):
+    """The script plus every repo module it imports, recursively."""
+    if seen is None:
+        seen = set()
+    if script in seen:
+        return seen
+    seen.add(script)
+    with open(os.path.join(REPO_DIR, script), 'r', encoding='utf-8') as f:
+        source = f.read()
+    for m in re.finditer(r'^\s*(?:from|import)\s+(\w+)', source, re.MULTILINE):
+        module = m.group(1) + '.py'
+        if os.path.exists(os.path.join(REPO_DIR, module)):
+            local_modules(module, seen)
+    return seen
+
+
+class Fingerprinter:
+    """Content hashes for files and directories, memoized by (mtime, size)."""
+
+    def __init__(self, stat_cache):
+        self.stat_cache = stat_cache
+
+    def file(self, path):
+        st = os.stat(path)
+        key = os.path.abspath(path)
+        cached = self.stat_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        self.stat_cache[key] = [st.st_mtime_ns, st.st_size, digest.hexdigest()]
+        return digest.hexdigest()
+
+    def path(self, path):
+        """Fingerprint a file or directory; None if it does not exist."""
+        if os.path.isdir(path):
+            digest = hashlib.sha256()
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for filename in sorted(files):
+                    full = os.path.join(root, filename)
+                    digest.update(os.path.relpath(full, path).encode('utf-8'))
+                    digest.update(self.file(full).encode('ascii'))
+            return 'dir:' + digest.hexdigest()
+        if os.path.exists(path):
+            return self.file(path)
+        return None
+
+
+def load_state():
+    if os.path.exists(STATE_FILE):
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {'stages': {}, 'files': {}, 'stat': {}}
+
+
+def save_state(state):
+    os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+    tmp_path = STATE_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, STATE_FILE)
+
+
+def stage_signature(stage, fingerprints):
+    """Hash of the stage's command line and the code it runs."""
+    digest = hashlib.sha256(json.dumps([stage.script] + stage.args).encode('utf-8'))
+    for module in sorted(local_modules(stage.script)):
+        digest.update(module.encode('utf-8'))
+        digest.update(fingerprints.file(os.path.join(REPO_DIR, module)).encode('ascii'))
+    return digest.hexdigest()
+
+
+def why_dirty(stage, state, fingerprints, external, ran_upstream, tampered, force):
+    """Return the reason a stage must run, or None if it is up to date."""
+    if force:
+        return 'forced'
+    record = state['stages'].get(stage.name)
+    if record is None:
+        return 'never built'
+    if record.get('failed'):
+        return 'failed or skipped last build'
+    if record['signature'] != stage_signature(stage, fingerprints):
+        return 'code changed'
+    for path in external:
+        if record['inputs'].get(path) != fingerprints.path(path):
+            return f'{path} changed'
+    if ran_upstream:
+        return f'{", ".join(sorted(ran_upstream))} re-ran'
+    for path in stage.outputs:
+        if not os.path.exists(path):
+            return f'{path} missing'
+        if path in tampered:
+            return f'{path} edited outside the pipeline'
+    return None
+
+
+def run_stage(stage, env=None):
+    command = [sys.executable, os.path.join(REPO_DIR, stage.script)] + stage.args
+    started = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True, env=env)
+    return result, time.perf_counter() - started
+
+
+def stage_env(stage, report, profile):
+    """Environment for a stage's run report (RUN_REPORT) and profile (RUN_PROFILE)."""
+    if not report and not profile:
+        return None
+    env = dict(os.environ)
+    if report:
+        path = os.path.join(STAGE_REPORT_DIR, f"{stage.name}.json")
+        if os.path.exists(path):
+            os.remove(path)
+        env[REPORT_ENV] = path
+    if profile:
+        env[PROFILE_ENV] = profile
+    return env
+
+
+def write_pipeline_report(started_at, wall_s, runs):
+    """Collect the stage reports of this build into PIPELINE_REPORT."""
+    for run in runs:
+        path = os.path.join(STAGE_REPORT_DIR, f"{run['stage']}.json")
+        run['report'] = load_report(path) if run['status'] in ('done', 'failed') and os.path.exists(path) else None
+    os.makedirs(os.path.dirname(PIPELINE_REPORT), exist_ok=True)
+    tmp_path = PIPELINE_REPORT + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'started': started_at, 'wall_s': round(wall_s, 3), 'runs': runs}, f, indent=2)
+    os.replace(tmp_path, PIPELINE_REPORT)
+
+
+def select(stages, deps, targets):
+    """Restrict to the target stages and everything upstream of them."""
+    if not targets:
+        return stages
+    wanted = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in wanted:
+            wanted.add(name)
+            pending.extend(deps[name])
+    return [s for s in stages if s.name in wanted]
+
+
+def build(targets=(), jobs=4, force=False, dry_run=False, verbose=False, report=False, profile=None):
+    started = time.perf_counter()
+    started_at = datetime.now().isoformat(timespec='seconds')
+    names = {s.name for s in STAGES}
+    unknown = [t for t in targets if t not in names]
+    if unknown:
+        print(f"Unknown stage(s): {', '.join(unknown)}. Known: {', '.join(sorted(names))}")
+        return 2
+
+    deps, external = build_graph(STAGES)
+    stages = select(STAGES, deps, targets)
+    forced = set(targets) if targets else names
+    state = load_state()
+    fingerprints = Fingerprinter(state.setdefault('stat', {}))
+
+    # Pipeline-produced files that changed since the end of the last build
+    tampered = {path for path, fp in state.get('files', {}).items()
+                if fingerprints.path(path) != fp}
+
+    ran = set()
+    runs = []
+    up_to_date = 0
+    failed = set()
+    done = set()
+    remaining = {s.name: s for s in stages}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        while remaining or running:
+            for name, stage in list(remaining.items()):
+                if deps[name] & (remaining.keys() | {s.name for s, _, _ in running.values()}):
+                    continue
+                del remaining[name]
+                if deps[name] & failed:
+                    failed.add(name)
+                    # Upstream changed under it, so it must run next time
+                    state['stages'][name] = {'failed': True}
+                    runs.append({'stage': name, 'status': 'skipped', 'reason': 'upstream stage failed', 'wall_s': 0})
+                    print(f"[skip] {name}: upstream stage failed")
+                    continue
+                missing = [p for p in external[name] if not os.path.exists(p) and p not in stage.optional]
+                if missing:
+                    failed.add(name)
+                    runs.append({'stage': name, 'status': 'failed', 'reason': f"missing {', '.join(missing)}",
+                                 'wall_s': 0})
+                    print(f"[fail] {name}: missing input {', '.join(missing)}")
+                    continue
+                reason = why_dirty(stage, state, fingerprints, external[name],
+                                   deps[name] & ran, tampered, force and name in forced)
+                if reason is None:
+                    done.add(name)
+                    up_to_date += 1
+                    runs.append({'stage': name, 'status': 'up to date', 'reason': 'up to date', 'wall_s': 0})
+                    if verbose:
+                        print(f"[ok]   {name}")
+                    continue
+                ran.add(name)
+                if dry_run:
+                    done.add(name)
+                    print(f"[run]  {name}: {reason} (dry run)")
+                    continue
+                print(f"[run]  {name}: {reason}")
+                # Fingerprint external inputs as they were when the stage started
+                inputs = {p: fingerprints.path(p) for p in external[name]}
+                runs.append({'stage': name, 'status': 'running', 'reason': reason, 'wall_s': 0})
+                env = stage_env(stage, report, profile)
+                running[executor.submit(run_stage, stage, env)] = (stage, inputs, runs[-1])
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, inputs, run = running.pop(future)
+                result, elapsed = future.result()
+                run['wall_s'] = round(elapsed, 3)
+                run['status'] = 'failed' if result.returncode != 0 else 'done'
+                output = (result.stdout + result.stderr).rstrip()
+                if verbose or result.returncode != 0:
+                    for line in output.splitlines():
+                        print(f"    {stage.name} | {line}")
+                if result.returncode != 0:
+                    failed.add(stage.name)
+                    # Forget the last good build so the next one re-runs it
+                    state['stages'][stage.name] = {'failed': True}
+                    print(f"[fail] {stage.name}: exit code {result.returncode} after {elapsed:.1f}s")
+                    continue
+                done.add(stage.name)
+                state['stages'][stage.name] = {
+                    'signature': stage_signature(stage, fingerprints),
+                    'inputs': inputs,
+                    'elapsed': round(elapsed, 3),
+                }
+                print(f"[done] {stage.name} in {elapsed:.1f}s")
+
+    if not dry_run:
+        # Remember produced files as the build left them, to spot outside edits
+        produced = {p for s in STAGES for p in s.outputs}
+        state['files'] = {p: fingerprints.path(p) for p in sorted(produced) if os.path.exists(p)}
+        save_state(state)
+
+    total = time.perf_counter() - started
+    print(f"\n{len(ran)} stage(s) {'would run' if dry_run else 'ran'}, "
+          f"{up_to_date} up to date, {len(failed)} failed or skipped ({total:.2f}s)")
+    if report and not dry_run:
+        write_pipeline_report(started_at, total, runs)
+        print(f"Run report written to {PIPELINE_REPORT} (python {os.path.join(REPO_DIR, 'run_report.py')})")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('targets', nargs='*', help='stages to build (default: all)')
+    parser.add_argument('-j', '--jobs', type=int, default=4, help='stages to run concurrently (default: 4)')
+    parser.add_argument('--force', action='store_true', help='re-run the selected stages even if up to date')
+    parser.add_argument('--dry-run', action='store_true', help='report what would run without running it')
+    parser.add_argument('--workdir', default='.', help='directory holding the data files (default: current)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='show stage output and up-to-date stages')
+    parser.add_argument('--report', action='store_true',
+                        help=f'record timings, rows, cache hits and memory per stage in {PIPELINE_REPORT}')
+    parser.add_argument('--profile', metavar='NAME',
+                        help='run the stage or phase NAME under cProfile (use --force if it is up to date)')
+    args = parser.parse_args()
+
+    os.chdir(args.workdir)
+    sys.exit(build(args.targets, args.jobs, args.force, args.dry_run, args.verbose, args.report, args.profile))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Write public/data/precache-manifest.json for the service worker.
+
+Generated data files under public/data/ carry a content hash in their names
+(e.g. offense_text/PC.1f3a9c0b2e.json), so a URL always means the same bytes.
+The manifest lists every such file; sw.js downloads the ones it has not
+cached yet and drops the ones no longer listed. A dataset refresh therefore
+re-downloads only the files whose content changed.
+
+The offense text shards (offense_text/) are what the app reads elements and
+statute text from, so caching them all keeps every offense usable offline.
+
+Usage:
+    python precache_manifest.py     # after generate_ts_data.py
+"""
+
+import hashlib
+import json
+import os
+
+PUBLIC_DIR = 'public'
+DATA_DIR = os.path.join(PUBLIC_DIR, 'data')
+MANIFEST_FILE = os.path.join(DATA_DIR, 'precache-manifest.json')
+HASH_LENGTH = 10
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(stem, data, ext='.json'):
+    """File name for data that changes whenever its content does."""
+    return f"{stem}.{content_hash(data)}{ext}"
+
+
+def write_precache_manifest(data_dir=DATA_DIR, manifest_path=MANIFEST_FILE, public_dir=PUBLIC_DIR):
+    """List every file under data_dir (URLs relative to public_dir). Returns (files, bytes)."""
+    files = []
+    for root, dirs, names in os.walk(data_dir):
+        dirs[:] = sorted(dirs)
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            if os.path.abspath(path) == os.path.abspath(manifest_path):
+                continue
+            url = os.path.relpath(path, public_dir).replace(os.sep, '/')
+            files.append({'url': url, 'size': os.path.getsize(path)})
+
+    version = content_hash(json.dumps(files, sort_keys=True).encode('utf-8'))
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': version, 'files': files}, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+    return len(files), sum(entry['size'] for entry in files)
+
+
+if __name__ == '__main__':
+    count, total = write_precache_manifest()
+    print(f"Wrote {MANIFEST_FILE}: {count} file(s), {total // 1024} KB.")
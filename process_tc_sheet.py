@@ -4,15 +4,25 @@ Process the TC sheet in offense_codes_updated.xlsx by extracting statute text
 from TN.doc files and populating columns E (elements) and F (statuteText).
 """
 
-import openpyxl
-from docx import Document
+import argparse
 import os
-import re
+import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from citation_parser import parse_citation as parse_one_citation, parse_citations
+from run_report import current_report, run_report
+from section_tree import SectionTree, remove_section_header
+from statute_source import TN_DOC_FOLDER, DocxSource, StatuteSource, parse_chapter_sections
+from statute_xref import XREF_GRAPH_FILE, XrefGraph, node_id
+from workbook_io import iter_rows, rewrite_workbook
 
-TN_DOC_FOLDER = 'TN.doc'
 EXCEL_FILE = 'offense_codes_updated.xlsx'
 
+# References followed from an offense's elements: what they cite and what
+# that cites, as far as the statute view's StatuteReferences.tsx goes
+XREF_ELEMENT_DEPTH = 2
+
 
 def parse_citation(citation):
     """
@@ -24,324 +34,257 @@ def parse_citation(citation):
     - "550.021 3319" -> chapter=550, section="550.021", subsection=None
     - "521.342 (A)(2) 3241" -> chapter=521, section="521.342", subsection="(A)(2)"
     - "601.004(i)" -> chapter=601, section="601.004", subsection="(i)"
+    - "545.157(b)(1)(A)" -> chapter=545, section="545.157", subsection="(b)(1)(A)"
+
+    Whole columns go through citation_parser.parse_citations() instead.
     """
     if not citation:
         return None, None, None
-    
-    citation = str(citation).strip()
-    
-    # Extract the main section part (before any space or with subsection)
-    # Match patterns like: 545.001, 547.614(c), 521.342 (A)(2) 3241
-    match = re.match(r'^(\d+)\.(\d+[A-Za-z]?)', citation)
-    if not match:
-        return None, None, None
-    
-    chapter = match.group(1)
-    section = f"{match.group(1)}.{match.group(2)}"
-    
-    # Look for subsection in parentheses
-    # Handle both "547.614(c)" and "521.342 (A)(2)"
-    subsection_match = re.search(r'\(([a-zA-Z0-9\-]+)\)(?:\(([a-zA-Z0-9\-]+)\))?', citation)
-    subsection = None
-    if subsection_match:
-        subsection = f"({subsection_match.group(1)})"
-        if subsection_match.group(2):
-            subsection += f"({subsection_match.group(2)})"
-    
-    return chapter, section, subsection
+    parts = parse_one_citation(citation)
+    return parts['chapter'], parts['section'], parts['subsection']
 
 
-def get_tn_doc_path(chapter):
+def get_tn_doc_path(chapter, source=None):
     """Find the TN.doc file for a given chapter."""
-    if not chapter:
-        return None
-    
-    # Try different filename patterns
-    patterns = [
-        f"tn.{chapter}.docx",
-        f"TN.{chapter}.docx",
-    ]
-    
-    for pattern in patterns:
-        path = os.path.join(TN_DOC_FOLDER, pattern)
-        if os.path.exists(path):
-            return path
-    
-    # Case-insensitive search
-    for filename in os.listdir(TN_DOC_FOLDER):
-        if filename.lower() == f"tn.{chapter}.docx":
-            return os.path.join(TN_DOC_FOLDER, filename)
-    
-    return None
+    if source is None:
+        source = DocxSource(TN_DOC_FOLDER)
+    return source.chapter_path(chapter)
 
 
 def extract_section_from_doc(doc_path, section_number):
     """
     Extract a section from a TN.doc file.
     
-    Returns (full_statute_text, all_subsection_texts) where:
+    Returns (full_statute_text, subsection_paths) where:
     - full_statute_text: The complete section text with \n between paragraphs
-    - all_subsection_texts: Dict mapping subsection letters to their text
+    - subsection_paths: Its subsections by full path (see section_tree.subsection_paths)
+
+    This parses the whole chapter; use a statute_source.StatuteSource when
+    extracting more than one section.
     """
-    doc = Document(doc_path)
-    
-    # Build section pattern to match "Sec. 545.001" etc.
-    # Handle variations like "Sec. 545.001." or "Sec.545.001"
-    section_pattern = rf"Sec\.\s*{re.escape(section_number)}\b"
-    
-    paragraphs_text = []
-    in_section = False
-    current_subsection = None
-    subsection_texts = defaultdict(list)
-    
-    for para in doc.paragraphs:
-        text = para.text.strip()
-        if not text:
-            continue
-        
-        # Check if this is the start of our section
-        if re.match(section_pattern, text, re.IGNORECASE):
-            in_section = True
-            paragraphs_text.append(text)
-            
-            # Check for subsection in the same paragraph
-            subsection_match = re.search(r'\([a-z]\)', text)
-            if subsection_match:
-                current_subsection = subsection_match.group()
-                subsection_texts[current_subsection].append(text)
-            continue
-        
-        # Check if we've hit the next section
-        if in_section and re.match(r'Sec\.\s*\d+\.\d+', text, re.IGNORECASE):
-            break
-        
-        # Check if we've hit the Acts section (legislative history)
-        if in_section and re.match(r'^(Acts|Added by Acts|Amended by)', text, re.IGNORECASE):
-            break
-        
-        if in_section:
-            paragraphs_text.append(text)
-            
-            # Track subsections
-            subsection_match = re.match(r'^(\([a-z](?:-\d+)?\))', text)
-            if subsection_match:
-                current_subsection = subsection_match.group(1)
-                subsection_texts[current_subsection].append(text)
-            elif current_subsection:
-                subsection_texts[current_subsection].append(text)
-    
-    if not paragraphs_text:
-        return None, {}
-    
-    # Join paragraphs with newlines
-    full_text = '\n'.join(paragraphs_text)
-    
-    # Convert subsection dict values to joined text
-    subsections = {k: '\n'.join(v) for k, v in subsection_texts.items()}
-    
-    return full_text, subsections
+    sections = parse_chapter_sections(doc_path)
+    return sections.get(str(section_number).lower(), (None, {}))
 
 
-def remove_section_header(text):
+def extract_elements(full_text, subsection, subsection_paths=None):
     """
-    Remove the section number and title from the beginning of text.
-    E.g., "Sec. 550.026.  IMMEDIATE REPORT OF COLLISION.  (a)..." -> "(a)..."
-    E.g., "Sec. 545.054.  PASSING TO THE LEFT:  SAFE DISTANCE.  (a)..." -> "(a)..."
+    Extract the elements (offense definition) for a subsection path such as
+    "(a)" or "(b)(1)(A)" of a section's full text.
+
+    Referenced subsections (e.g. "under Subsection (a)") come first, then the
+    cited subsection with the lead-in of each enclosing one. subsection_paths
+    is the parsed index from extract_section_from_doc(). Rows citing the same
+    section share one section_tree.SectionTree from the StatuteSource instead.
     """
-    if not text:
-        return text
-    
-    # Pattern to match "Sec. XXX.XXX.  TITLE IN CAPS.  " at the start
-    # Title can contain: uppercase letters, spaces, commas, dashes, semicolons, 
-    # colons, slashes, apostrophes, parentheses, numbers
-    # The title ends with a period followed by optional whitespace
-    pattern = r'^Sec\.\s*\d+\.\d+[A-Za-z]?\.\s+[A-Z][A-Z0-9\s,\-;:/\'\(\)]+\.\s*'
-    cleaned = re.sub(pattern, '', text, count=1)
-    
-    # If the first pattern didn't work, try a more aggressive approach
-    if cleaned == text and re.match(r'^Sec\.', text):
-        # Find where (a), (b), etc. starts and remove everything before it
-        subsection_match = re.search(r'\s+(\([a-z]\)\s+)', text)
-        if subsection_match:
-            cleaned = text[subsection_match.start():].strip()
-    
-    return cleaned.strip()
+    if not full_text:
+        return None
+    return SectionTree(full_text, subsection_paths).elements(subsection)
+
+
+def load_xref_graph(path=XREF_GRAPH_FILE):
+    """The cross-reference graph built by xref_graph.py, or None if there is none."""
+    return XrefGraph.load(path) if os.path.exists(path) else None
 
 
-def find_referenced_subsections(text):
+def referenced_text(source, node):
     """
-    Find all subsection references in text like "Subsection (a)" or "Subsection (b)(1)".
-    Returns a list of referenced subsection identifiers like ['(a)', '(b)'].
+    "Sec. N. " and the target text of a subsection node such as
+    "TC 545.157(b)(1)", or None if no source has it.
     """
-    # Match patterns like "Subsection (a)", "Subsection (a)(1)", "Subsections (a) and (b)"
-    references = []
-    
-    # Pattern for "Subsection (x)" or "Subsection (x)(y)"
-    pattern = r'[Ss]ubsection[s]?\s+\(([a-z](?:-\d+)?)\)(?:\s*(?:,|and|or)\s*\(([a-z](?:-\d+)?)\))?'
-    matches = re.finditer(pattern, text)
-    
-    for match in matches:
-        if match.group(1):
-            references.append(f"({match.group(1)})")
-        if match.group(2):
-            references.append(f"({match.group(2)})")
-    
-    # Also handle "under Subsection (x)" pattern
-    pattern2 = r'under\s+[Ss]ubsection\s+\(([a-z](?:-\d+)?)\)'
-    for match in re.finditer(pattern2, text):
-        ref = f"({match.group(1)})"
-        if ref not in references:
-            references.append(ref)
-    
-    return references
+    statute, _, rest = node.partition(' ')
+    section, _, path = rest.partition('(')
+    tree = source.section_tree(statute, section)
+    if tree is None or not tree.find('(' + path):
+        return None
+    return f"Sec. {section}. {remove_section_header(tree.target_text('(' + path))}"
 
 
-def extract_elements(full_text, subsection, subsection_texts):
+def cross_referenced_elements(source, graph, section, tree, subsection):
     """
-    Extract the elements (offense definition) for a specific subsection.
-    
-    Improved logic:
-    1. Remove section headers (e.g., "Sec. 550.026. TITLE.")
-    2. Find referenced subsections (e.g., "under Subsection (a)")
-    3. Include referenced subsections FIRST, then the current subsection
-    4. Focus on the specific offense elements
+    The TC subsections of other sections that the elements of a cited
+    subsection refer to, directly or through each other (at most
+    XREF_ELEMENT_DEPTH references away), as texts.
     """
-    if not full_text:
-        return None
-    
-    # Determine which subsection to look for
-    target_subsection = subsection.lower() if subsection else None
-    
-    # Find the target subsection text
-    target_text = None
-    if target_subsection and subsection_texts:
-        for key, text in subsection_texts.items():
-            if key.lower() == target_subsection:
-                target_text = text
-                break
-    
-    # If no specific subsection found, try to find the one with "commits an offense"
-    if not target_text:
-        # Look for "commits an offense" pattern
-        for sub_key in sorted(subsection_texts.keys()):
-            sub_text = subsection_texts[sub_key]
-            if re.search(r'commits\s+an\s+offense', sub_text, re.IGNORECASE):
-                target_text = sub_text
-                target_subsection = sub_key
-                break
-    
-    # If still no target, use full text
-    if not target_text:
-        target_text = full_text
-    
-    # Find any referenced subsections in the target text
-    referenced_subs = find_referenced_subsections(target_text)
-    
-    # Build the elements text
-    elements_parts = []
-    included_subs = set()
-    
-    # First, add any referenced subsections
-    for ref_sub in referenced_subs:
-        ref_sub_lower = ref_sub.lower()
-        if ref_sub_lower not in included_subs:
-            for key, text in subsection_texts.items():
-                if key.lower() == ref_sub_lower:
-                    # Remove section header from the referenced subsection
-                    cleaned_text = remove_section_header(text)
-                    elements_parts.append(cleaned_text)
-                    included_subs.add(ref_sub_lower)
-                    break
-    
-    # Then add the target subsection (if not already included)
-    if target_subsection and target_subsection not in included_subs:
-        cleaned_target = remove_section_header(target_text)
-        elements_parts.append(cleaned_target)
-    elif not target_subsection:
-        # If no specific subsection, clean and add full text
-        cleaned_target = remove_section_header(target_text)
-        elements_parts.append(cleaned_target)
-    
-    # Join parts with newlines
-    elements = '\n'.join(elements_parts) if elements_parts else remove_section_header(full_text)
-    
-    return elements
+    own = f"TC {section.lower()}("
+    nodes = [node_id('TC', section, path) for path in tree.element_paths(subsection) if path]
+    # Whole sections and chapters are too broad to copy into elements
+    referenced = graph.closure(nodes, follow=lambda node: node.startswith('TC ') and '(' in node
+                               and not node.startswith(own), max_depth=XREF_ELEMENT_DEPTH)
+    return [text for text in (referenced_text(source, node) for node in referenced) if text]
+
+
+def process_chapter_rows(doc_path, rows, source=None, graph=None):
+    """
+    Extract elements and statute text for rows that all cite one chapter file.
+
+    rows is a list of (row_num, citation, section, subsection). Returns a list
+    of (row_num, elements, full_text, error) in the same order, where error is
+    None on success. With graph (an XrefGraph), subsections of other sections
+    that the elements refer to are put in front of them.
+    """
+    if source is None:
+        source = StatuteSource()
+
+    results = []
+    for row_num, citation, section, subsection in rows:
+        try:
+            # Extract section
+            tree = source.section_tree('TC', section)
+
+            if tree is None:
+                results.append((row_num, None, None, f"Section {section} not found in {doc_path}"))
+                continue
+
+            # Extract elements, shared by every row citing the same path
+            elements = tree.elements(subsection)
+            if graph is not None:
+                elements = '\n'.join(cross_referenced_elements(source, graph, section, tree, subsection)
+                                     + [elements])
+            results.append((row_num, elements, tree.full_text, None))
+        except Exception as e:
+            results.append((row_num, None, None, str(e)))
+    return results
+
+
+# Per-process source and graph so a worker reuses parsed chapters across groups
+_worker_source = None
+_worker_graph = None
+
 
+def _process_chapter_group(task):
+    """Process pool entry point: (doc_path, rows) -> (results, source stats, wall s, CPU s)."""
+    global _worker_source, _worker_graph
+    if _worker_source is None:
+        _worker_source = StatuteSource()
+        _worker_graph = load_xref_graph()
+    doc_path, rows = task
+    before = dict(_worker_source.stats)
+    started, cpu_started = time.perf_counter(), time.process_time()
+    results = process_chapter_rows(doc_path, rows, _worker_source, _worker_graph)
+    stats = {k: v - before[k] for k, v in _worker_source.stats.items()}
+    return results, stats, time.perf_counter() - started, time.process_time() - cpu_started
 
-def main():
+
+def run_chapter_groups(groups, source, workers=1, graph=None):
+    """
+    Process {doc_path: rows} groups serially or over a process pool (whose
+    workers load the cross-reference graph themselves).
+
+    Returns {row_num: (elements, full_text, error)}. Results are keyed by row
+    so the caller can apply them in sheet order regardless of which worker
+    finished first.
+    """
+    results = {}
+    with current_report().stage('extract_elements', cache=source) as stage:
+        if workers <= 1 or len(groups) <= 1:
+            for doc_path, rows in groups.items():
+                with stage.file(doc_path) as entry:
+                    for row_num, elements, full_text, error in process_chapter_rows(doc_path, rows, source, graph):
+                        results[row_num] = (elements, full_text, error)
+                    entry['rows'] = len(rows)
+        else:
+            # Largest chapters first so one big group doesn't finish last
+            tasks = sorted(groups.items(), key=lambda item: len(item[1]), reverse=True)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for (doc_path, rows), (group_results, stats, wall_s, cpu_s) in zip(
+                        tasks, executor.map(_process_chapter_group, tasks)):
+                    for row_num, elements, full_text, error in group_results:
+                        results[row_num] = (elements, full_text, error)
+                    for key, value in stats.items():
+                        source.stats[key] += value
+                    stage.add_file(doc_path, wall_s, cpu_s, len(rows))
+        stage.rows(rows_in=sum(len(rows) for rows in groups.values()),
+                   rows_out=sum(1 for _, _, error in results.values() if not error))
+    return results
+
+
+def main(workers=1):
     print("=" * 60)
     print("PROCESSING TC SHEET")
     print("=" * 60)
     
-    # Load the Excel file
-    wb = openpyxl.load_workbook(EXCEL_FILE)
-    ws = wb['TC']
-    
     # Tracking stats
     total_rows = 0
     successful = 0
     failed = []
     no_doc_file = []
     
-    # Cache for loaded documents to avoid reloading
-    doc_cache = {}
-    
-    # Process each row (skip header)
-    for row_num in range(2, ws.max_row + 1):
-        citation = ws.cell(row=row_num, column=2).value  # Column B
-        literal = ws.cell(row=row_num, column=1).value   # Column A (for debugging)
-        
-        if not citation:
+    # Each chapter is parsed once and shared by every row citing it
+    source = StatuteSource()
+    
+    # Rows are grouped by chapter file; failures found while grouping are
+    # keyed by row so they are reported in sheet order with the rest
+    groups = defaultdict(list)
+    citations = {}
+    early_failures = {}
+    
+    # Column B and F of the first rows, for the sample printed at the end
+    sample_rows = {}
+    
+    with current_report().stage('read_rows') as stage:
+        # Stream each row (skip header) without loading the whole workbook
+        for row_num, values in iter_rows(EXCEL_FILE, 'TC', min_row=2, max_col=6):
+            citation = values[1]  # Column B
+            if row_num < 50:
+                sample_rows[row_num] = (citation, values[5])
+            if citation:
+                citations[row_num] = citation
+        total_rows = len(citations)
+
+        # Parse every citation in one vectorized pass
+        parts = parse_citations(list(citations.values()))
+        parts = parts.astype(object).where(parts.notna(), None)
+
+        for (row_num, citation), chapter, section, subsection in zip(
+                citations.items(), parts['chapter'], parts['section'], parts['subsection']):
+            if not chapter or not section:
+                early_failures[row_num] = (failed, "Could not parse citation")
+                continue
+
+            # Get the TN.doc file (or the TC source that has the chapter)
+            _, doc_path = source.locate('TC', section)
+
+            if not doc_path:
+                early_failures[row_num] = (no_doc_file, f"No TN.doc file for chapter {chapter}")
+                continue
+
+            groups[doc_path].append((row_num, citation, section, subsection))
+        stage.rows(rows_in=total_rows, rows_out=sum(len(rows) for rows in groups.values()))
+    
+    if workers > 1:
+        print(f"Extracting {len(groups)} chapters with {workers} workers...")
+    graph = load_xref_graph()
+    if graph is None:
+        print(f"No {XREF_GRAPH_FILE}; elements will not include other sections' subsections.")
+    results = run_chapter_groups(groups, source, workers, graph)
+    
+    # Apply results in row order so serial and parallel runs write the same sheet
+    updates = {}
+    for row_num, citation in citations.items():
+        if row_num in early_failures:
+            bucket, reason = early_failures[row_num]
+            bucket.append((row_num, citation, reason))
             continue
         
-        total_rows += 1
-        
-        # Parse the citation
-        chapter, section, subsection = parse_citation(citation)
-        
-        if not chapter or not section:
-            failed.append((row_num, citation, "Could not parse citation"))
+        elements, full_text, error = results[row_num]
+        if error:
+            failed.append((row_num, citation, error))
             continue
         
-        # Get the TN.doc file
-        doc_path = get_tn_doc_path(chapter)
+        # Update the Excel cells: column E (elements) and F (statuteText)
+        updates[row_num] = {5: elements, 6: full_text}
         
-        if not doc_path:
-            no_doc_file.append((row_num, citation, f"No TN.doc file for chapter {chapter}"))
-            continue
+        successful += 1
         
-        try:
-            # Load document (use cache if available)
-            if doc_path not in doc_cache:
-                doc_cache[doc_path] = doc_path  # Store path for now
-            
-            # Extract section
-            full_text, subsection_texts = extract_section_from_doc(doc_path, section)
-            
-            if not full_text:
-                failed.append((row_num, citation, f"Section {section} not found in {doc_path}"))
-                continue
-            
-            # Extract elements
-            elements = extract_elements(full_text, subsection, subsection_texts)
-            
-            # Update the Excel cells
-            ws.cell(row=row_num, column=5).value = elements      # Column E
-            ws.cell(row=row_num, column=6).value = full_text     # Column F
-            
-            successful += 1
-            
-            # Print progress every 100 rows
-            if successful % 100 == 0:
-                print(f"Processed {successful} rows...")
-                
-        except Exception as e:
-            failed.append((row_num, citation, str(e)))
+        # Print progress every 100 rows
+        if successful % 100 == 0:
+            print(f"Processed {successful} rows...")
     
-    # Save the file
+    # Save the file, setting only columns E and F of the processed rows
     print("\nSaving Excel file...")
-    wb.save(EXCEL_FILE)
-    wb.close()
+    with current_report().stage('save_workbook') as stage:
+        rewrite_workbook(EXCEL_FILE, {'TC': updates})
+        stage.rows(rows_in=len(updates), rows_out=len(updates))
     
     # Print summary
     print("\n" + "=" * 60)
@@ -351,6 +294,11 @@ def main():
     print(f"Successful: {successful}")
     print(f"Failed: {len(failed)}")
     print(f"No doc file: {len(no_doc_file)}")
+    print(f"Chapter cache: {source.stats['chapter_hits']} hits, "
+          f"{source.stats['chapter_misses']} misses (files parsed), "
+          f"{source.stats['chapter_evictions']} evicted")
+    print(f"TN.doc path lookups: {source.stats['path_hits']} found, "
+          f"{source.stats['path_misses']} missing")
     
     if no_doc_file:
         print("\n--- Missing TN.doc files (first 20) ---")
@@ -364,12 +312,11 @@ def main():
     
     # Show a sample of successful entries
     print("\n--- Sample of updated entries ---")
-    ws = openpyxl.load_workbook(EXCEL_FILE)['TC']
     sample_count = 0
-    for row_num in range(2, min(50, ws.max_row + 1)):
-        statute_text = ws.cell(row=row_num, column=6).value
+    for row_num, (citation, statute_text) in sorted(sample_rows.items()):
+        if row_num in updates:
+            statute_text = updates[row_num][6]
         if statute_text:
-            citation = ws.cell(row=row_num, column=2).value
             print(f"\nRow {row_num} ({citation}):")
             print(f"  StatuteText (first 200 chars): {statute_text[:200]}...")
             sample_count += 1
@@ -378,4 +325,9 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='extract chapters in N worker processes (default: 1, serial)')
+    args = parser.parse_args()
+    with run_report('process_tc_sheet'):
+        main(workers=args.workers)
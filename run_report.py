@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Run reports: where a data rebuild spends its time and memory.
+
+A script wraps its main body in run_report(name) and marks its phases with
+report.stage(name). Each stage records:
+- wall and CPU seconds
+- rows in and rows out, when the stage sets them
+- cache hit/miss counts (the change in a cache's .stats while the stage ran)
+- the tracemalloc peak during the stage
+- per input file: wall and CPU seconds and rows, via stage.file(path)
+
+Reporting is opt-in. Nothing is written, and tracemalloc (which slows
+allocation-heavy code) stays off, unless RUN_REPORT names the JSON file to
+write. RUN_TRACE_MEMORY=0 keeps tracemalloc off in a report too, leaving
+max RSS (which includes worker processes) as the memory figure; timings
+are then undistorted. RUN_PROFILE=<name> also runs the run or stage of
+that name under cProfile and dumps the stats under .cache/profiles/.
+
+    RUN_REPORT=.cache/reports/tc.json python process_tc_sheet.py
+    RUN_PROFILE=extract_elements python process_tc_sheet.py
+    python pipeline.py --report --profile process_tc_sheet
+
+Library code reports through current_report(), which outside a run returns
+a report that records nothing.
+
+Usage:
+    python run_report.py [REPORT.json]   # summarize a report (default: the last pipeline run)
+"""
+
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPORT_ENV = 'RUN_REPORT'
+PROFILE_ENV = 'RUN_PROFILE'
+TRACE_MEMORY_ENV = 'RUN_TRACE_MEMORY'
+PROFILE_DIR = os.path.join('.cache', 'profiles')
+PIPELINE_REPORT = os.path.join('.cache', 'run_report.json')
+
+
+def _timers():
+    return time.perf_counter(), time.process_time()
+
+
+def _max_rss_kb():
+    # The largest of this process and its (finished) worker processes, or
+    # None where there is no resource module.
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    if resource is None:
+        return None
+    rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+              resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+class StageRecord(dict):
+    """One stage's measurements; a dict so it serializes as is."""
+
+    def __init__(self, name):
+        super().__init__(name=name, wall_s=0.0, cpu_s=0.0, rows_in=None, rows_out=None,
+                         cache={}, peak_kb=None, files=[])
+
+    def rows(self, rows_in=None, rows_out=None):
+        if rows_in is not None:
+            self['rows_in'] = rows_in
+        if rows_out is not None:
+            self['rows_out'] = rows_out
+
+    def add_file(self, path, wall_s, cpu_s, rows=None):
+        self['files'].append({'path': path, 'wall_s': round(wall_s, 4), 'cpu_s': round(cpu_s, 4), 'rows': rows})
+
+    @contextmanager
+    def file(self, path):
+        """Time work on one input file; set entry['rows'] in the block."""
+        entry = {'rows': None}
+        wall, cpu = _timers()
+        try:
+            yield entry
+        finally:
+            now_wall, now_cpu = _timers()
+            self.add_file(path, now_wall - wall, now_cpu - cpu, entry['rows'])
+
+
+def _cache_delta(before, cache):
+    return {key: value - before.get(key, 0) for key, value in cache.stats.items()
+            if isinstance(value, (int, float)) and value - before.get(key, 0)}
+
+
+class RunReport:
+    """Stages of one script run, written to path (if any) when the run ends."""
+
+    def __init__(self, name, path=None, profile=None, trace_memory=True):
+        self.name = name
+        self.path = path
+        self.profile = profile
+        self.enabled = path is not None
+        self.trace_memory = self.enabled and trace_memory
+        self.stages = []
+        self.peak_kb = None
+
+    @contextmanager
+    def _profiled(self, name):
+        if self.profile != name:
+            yield
+            return
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            # Stage names repeat across scripts (e.g. 'load'), so prefix the run
+            label = name if name == self.name else f"{self.name}.{name}"
+            path = os.path.join(PROFILE_DIR, f"{label}.prof")
+            profiler.dump_stats(path)
+            print(f"Profile of {name} written to {path} (python -m pstats {path})")
+
+    @contextmanager
+    def stage(self, name, cache=None):
+        """
+        Measure one phase. cache is any object with a .stats dict of counters
+        (StatuteCache, StatuteSource); the counts that changed are recorded.
+        Stages do not nest: each one resets the tracemalloc peak.
+        """
+        record = StageRecord(name)
+        before = dict(cache.stats) if cache is not None else None
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        wall, cpu = _timers()
+        try:
+            with self._profiled(name):
+                yield record
+        finally:
+            now_wall, now_cpu = _timers()
+            record['wall_s'] = round(now_wall - wall, 4)
+            record['cpu_s'] = round(now_cpu - cpu, 4)
+            if cache is not None:
+                record['cache'] = _cache_delta(before, cache)
+            if self.trace_memory:
+                record['peak_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+                self.peak_kb = max(self.peak_kb or 0, record['peak_kb'])
+            self.stages.append(record)
+
+    def to_dict(self, wall_s, cpu_s, status):
+        return {
+            'name': self.name,
+            'status': status,
+            'wall_s': round(wall_s, 4),
+            'cpu_s': round(cpu_s, 4),
+            'peak_kb': self.peak_kb,
+            'max_rss_kb': _max_rss_kb(),
+            'stages': self.stages,
+        }
+
+    def write(self, data):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+_current = None
+
+
+def current_report():
+    """The report of the run in progress, or one that records nothing."""
+    return _current or RunReport('untracked')
+
+
+@contextmanager
+def run_report(name):
+    """Report on a whole script run; configured by RUN_REPORT / RUN_PROFILE."""
+    global _current
+    report = RunReport(name, os.environ.get(REPORT_ENV) or None, os.environ.get(PROFILE_ENV) or None,
+                       os.environ.get(TRACE_MEMORY_ENV, '1') != '0')
+    previous, _current = _current, report
+    started_tracing = report.trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    wall, cpu = _timers()
+    status = 'failed'
+    try:
+        with report._profiled(name):
+            yield report
+        status = 'ok'
+    finally:
+        now_wall, now_cpu = _timers()
+        if report.trace_memory:
+            # Peak since the last stage ended, for work outside any stage
+            report.peak_kb = max(report.peak_kb or 0, round(tracemalloc.get_traced_memory()[1] / 1024, 1))
+        if report.enabled:
+            report.write(report.to_dict(now_wall - wall, now_cpu - cpu, status))
+        if started_tracing:
+            tracemalloc.stop()
+        _current = previous
+
+
+def load_report(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _kb(value):
+    return '-' if value is None else f"{value:,.0f}"
+
+
+def print_run(run, indent=''):
+    print(f"{indent}{run['name']}: {run['status']}, {run['wall_s']:.2f}s wall, {run['cpu_s']:.2f}s CPU, "
+          f"peak {_kb(run['peak_kb'])} KB traced, {_kb(run['max_rss_kb'])} KB max RSS")
+    for stage in run['stages']:
+        rows = ''
+        if stage['rows_in'] is not None or stage['rows_out'] is not None:
+            rows = f"  rows {stage['rows_in'] if stage['rows_in'] is not None else '-'}" \
+                   f" -> {stage['rows_out'] if stage['rows_out'] is not None else '-'}"
+        cache = ''.join(f"  {key}={value}" for key, value in stage['cache'].items())
+        print(f"{indent}  {stage['name']:<28} {stage['wall_s']:8.3f}s {stage['cpu_s']:8.3f}s CPU "
+              f"{_kb(stage['peak_kb']):>9} KB{rows}{cache}")
+        slowest = sorted(stage['files'], key=lambda f: f['wall_s'], reverse=True)[:5]
+        for entry in slowest:
+            rows = '' if entry['rows'] is None else f"  {entry['rows']} rows"
+            print(f"{indent}      {entry['path']:<30} {entry['wall_s']:8.3f}s{rows}")
+        if len(stage['files']) > len(slowest):
+            print(f"{indent}      ... {len(stage['files']) - len(slowest)} more file(s)")
+
+
+def print_report(report):
+    """Print a script report, or a pipeline report of several scripts."""
+    if 'runs' not in report:
+        print_run(report)
+        return
+    print(f"Pipeline run {report['started']}: {report['wall_s']:.2f}s")
+    for stage in report['runs']:
+        print(f"\n[{stage['status']}] {stage['stage']} ({stage['reason']}) {stage['wall_s']:.2f}s")
+        if stage.get('report'):
+            print_run(stage['report'], indent='  ')
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else PIPELINE_REPORT
+    if not os.path.exists(path):
+        print(f"No report at {path}. Run with {REPORT_ENV}=<path> or python pipeline.py --report.")
+        sys.exit(1)
+    print_report(load_report(path))
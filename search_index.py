@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Build cjis_search_index.ts, a prebuilt offense search index for the app.
+
+The offense search in App.tsx lower-cases and scans every offense's literal
+and citation on every keystroke. This index maps each lower-cased trigram of
+literal, citation and statute to the positions (in CJIS_INDEX order) of the
+offenses containing it. A lookup intersects the posting lists of the query's
+trigrams and checks only those candidates, so it returns exactly what the
+substring scan would. Queries shorter than a trigram fall back to the scan.
+
+Posting lists are delta-encoded base-36 numbers; a run of consecutive
+positions is written as 'delta+extra' (offenses are sorted by literal, so
+neighbours share many trigrams).
+
+The index must follow the record order of cjis_codes_index.ts, so
+generate_ts_data.py writes them together. The module also
+records sample literals and disables itself (falling back to the scan) if
+cjis_codes_index.ts is ever out of step with it.
+
+Usage:
+    python search_index.py      # index cjis_codes.json in generated order
+"""
+
+import json
+from collections import defaultdict
+
+from offense_store import OffenseStore
+
+SEARCH_INDEX_FILE = 'cjis_search_index.ts'
+SEARCH_FIELDS = ('literal', 'citation', 'statute')
+GRAM = 3
+SAMPLES = 16
+
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+TS_TEMPLATE = """// Generated by search_index.py from cjis_codes.json; do not edit.
+import {{ OffenseIndexEntry }} from './types';
+import {{ CJIS_INDEX }} from './cjis_codes_index';
+
+const GRAM = {gram};
+const RECORD_COUNT = {count};
+const SAMPLES: [number, string][] = {samples};
+
+// Trigram -> posting list (delta-encoded base-36 positions, 'delta+run')
+const POSTINGS: Record<string, string> = {postings};
+
+const INDEX_READY = CJIS_INDEX.length === RECORD_COUNT &&
+  SAMPLES.every(([i, literal]) => CJIS_INDEX[i].literal === literal);
+
+const decoded = new Map<string, number[]>();
+
+const postingList = (gram: string): number[] => {{
+  let list = decoded.get(gram);
+  if (!list) {{
+    list = [];
+    const encoded = POSTINGS[gram];
+    if (encoded) {{
+      let pos = 0;
+      for (const token of encoded.split(',')) {{
+        const [delta, run] = token.split('+');
+        pos += parseInt(delta, 36);
+        list.push(pos);
+        for (let extra = run ? parseInt(run, 36) : 0; extra > 0; extra--) list.push(++pos);
+      }}
+    }}
+    decoded.set(gram, list);
+  }}
+  return list;
+}};
+
+const intersect = (a: number[], b: number[]): number[] => {{
+  const out: number[] = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length && j < b.length) {{
+    if (a[i] === b[j]) {{ out.push(a[i]); i++; j++; }}
+    else if (a[i] < b[j]) i++;
+    else j++;
+  }}
+  return out;
+}};
+
+// Positions where a list built from CJIS_INDEX (e.g. with custom overrides
+// applied) holds a different record; those are always checked directly
+const changedCache = new WeakMap<OffenseIndexEntry[], number[]>();
+const changedPositions = (codes: OffenseIndexEntry[]): number[] => {{
+  let changed = changedCache.get(codes);
+  if (!changed) {{
+    changed = [];
+    for (let i = 0; i < codes.length; i++) if (codes[i] !== CJIS_INDEX[i]) changed.push(i);
+    changedCache.set(codes, changed);
+  }}
+  return changed;
+}};
+
+/**
+ * Offenses in `codes` whose literal or citation (or any of `fields`) contains
+ * `query`, case-insensitively, in list order. `codes` must be CJIS_INDEX or a
+ * same-length copy of it with some records replaced.
+ */
+export const searchOffenses = <T extends OffenseIndexEntry>(
+  query: string,
+  codes: T[] = CJIS_INDEX as T[],
+  fields: ('literal' | 'citation' | 'statute')[] = ['literal', 'citation'],
+): T[] => {{
+  const search = query.trim().toLowerCase();
+  if (!search) return [];
+  const matches = (offense: T) =>
+    fields.some(field => (offense[field] || '').toLowerCase().includes(search));
+
+  if (!INDEX_READY || search.length < GRAM || codes.length !== RECORD_COUNT) {{
+    return codes.filter(matches);
+  }}
+
+  const grams = new Set<string>();
+  for (let i = 0; i + GRAM <= search.length; i++) grams.add(search.slice(i, i + GRAM));
+  // Shortest posting lists first keeps the intersections small
+  const lists = [...grams].map(postingList).sort((a, b) => a.length - b.length);
+  let candidates = lists[0];
+  for (let k = 1; k < lists.length && candidates.length; k++) candidates = intersect(candidates, lists[k]);
+
+  const changed = changedPositions(codes);
+  const positions = changed.length
+    ? [...new Set([...candidates, ...changed])].sort((a, b) => a - b)
+    : candidates;
+  return positions.map(i => codes[i]).filter(matches);
+}};
+"""
+
+
+def base36(n):
+    digits = ''
+    while True:
+        n, r = divmod(n, 36)
+        digits = DIGITS[r] + digits
+        if not n:
+            return digits
+
+
+def encode_postings(positions):
+    """Delta-encode ascending positions, collapsing runs of consecutive ones."""
+    tokens = []
+    prev = 0
+    i = 0
+    while i < len(positions):
+        start = positions[i]
+        run = 0
+        while i + run + 1 < len(positions) and positions[i + run + 1] == start + run + 1:
+            run += 1
+        token = base36(start - prev)
+        if run:
+            token += '+' + base36(run)
+        tokens.append(token)
+        prev = start + run
+        i += run + 1
+    return ','.join(tokens)
+
+
+def trigrams(record):
+    grams = set()
+    for field in SEARCH_FIELDS:
+        value = str(record.get(field) or '').lower()
+        grams.update(value[i:i + GRAM] for i in range(len(value) - GRAM + 1))
+    return grams
+
+
+def build_postings(records):
+    postings = defaultdict(list)
+    for position, record in enumerate(records):
+        for gram in trigrams(record):
+            postings[gram].append(position)
+    return postings
+
+
+def write_search_index(records, path=SEARCH_INDEX_FILE):
+    """Write the index for records, in the order cjis_codes_index.ts lists them. Returns its size in bytes."""
+    postings = build_postings(records)
+    step = max(1, len(records) // SAMPLES)
+    samples = [[i, records[i]['literal']] for i in range(0, len(records), step)]
+    encoded = {gram: encode_postings(postings[gram]) for gram in sorted(postings)}
+    source = TS_TEMPLATE.format(
+        gram=GRAM,
+        count=len(records),
+        samples=json.dumps(samples, ensure_ascii=False),
+        postings=json.dumps(encoded, ensure_ascii=False, separators=(',', ':')),
+    )
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    return len(source.encode('utf-8'))
+
+
+def generated_order(store):
+    # The order generate_ts_data.py writes cjis_codes_index.ts in
+    return sorted(store, key=lambda x: x['literal'])
+
+
+if __name__ == '__main__':
+    store = OffenseStore.load()
+    size = write_search_index(generated_order(store))
+    print(f"Generated {SEARCH_INDEX_FILE} for {len(store)} offenses ({size // 1024} KB).")
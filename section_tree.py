@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Subsection trees for TN.doc sections, and element extraction over them.
+
+subsection_tree() parses a section once, when its chapter is parsed: every
+paragraph that starts with a label ((a), (a-1), (1), (A), (i)) opens a
+subsection, nested the way statute_text_normalizer.build_tree() nests
+them. subsection_paths() flattens the tree to a dict keyed by full path,
+so in a SectionTree (b)(1)(A) is one dict lookup (case-insensitive, since
+sheet citations write (A)(2) for (a)(2)).
+
+elements() picks the cited subsection (or, failing that, the first
+subsection defining "commits an offense"), puts any subsections it refers
+to in front of it and strips the section header. Results are memoized per
+path, and each subsection's references are found once, so every offense
+citing the same section shares the work.
+
+    tree = SectionTree(full_text, subsection_paths(full_text))
+    tree.find('(b)(1)(A)')
+    tree.elements('(A)(2)')
+"""
+
+import re
+
+from statute_text_normalizer import build_tree
+
+# A label at the start of a paragraph
+PARAGRAPH_LABEL_RE = re.compile(r'\((?P<name>[a-z]|[ivx]+|\d+|[A-Z])(?:-\d+)?\)')
+# A subsection opened inside a "Sec. N.  TITLE.  (a) ..." paragraph
+HEADER_LABEL_RE = re.compile(r'\((?P<name>[a-z])\)')
+PATH_PART_RE = re.compile(r'\([^)]*\)')
+OFFENSE_RE = re.compile(r'commits\s+an\s+offense', re.IGNORECASE)
+
+
+def remove_section_header(text):
+    """
+    Remove the section number and title from the beginning of text.
+    E.g., "Sec. 550.026.  IMMEDIATE REPORT OF COLLISION.  (a)..." -> "(a)..."
+    E.g., "Sec. 545.054.  PASSING TO THE LEFT:  SAFE DISTANCE.  (a)..." -> "(a)..."
+    """
+    if not text:
+        return text
+    
+    # Pattern to match "Sec. XXX.XXX.  TITLE IN CAPS.  " at the start
+    # Title can contain: uppercase letters, spaces, commas, dashes, semicolons, 
+    # colons, slashes, apostrophes, parentheses, numbers
+    # The title ends with a period followed by optional whitespace
+    pattern = r'^Sec\.\s*\d+\.\d+[A-Za-z]?\.\s+[A-Z][A-Z0-9\s,\-;:/\'\(\)]+\.\s*'
+    cleaned = re.sub(pattern, '', text, count=1)
+    
+    # If the first pattern didn't work, try a more aggressive approach
+    if cleaned == text and re.match(r'^Sec\.', text):
+        # Find where (a), (b), etc. starts and remove everything before it
+        subsection_match = re.search(r'\s+(\([a-z]\)\s+)', text)
+        if subsection_match:
+            cleaned = text[subsection_match.start():].strip()
+    
+    return cleaned.strip()
+
+
+def find_referenced_subsections(text):
+    """
+    Find all subsection references in text like "Subsection (a)" or "Subsection (b)(1)".
+    Returns a list of referenced subsection identifiers like ['(a)', '(b)'].
+    """
+    # Match patterns like "Subsection (a)", "Subsection (a)(1)", "Subsections (a) and (b)"
+    references = []
+    
+    # Pattern for "Subsection (x)" or "Subsection (x)(y)"
+    pattern = r'[Ss]ubsection[s]?\s+\(([a-z](?:-\d+)?)\)(?:\s*(?:,|and|or)\s*\(([a-z](?:-\d+)?)\))?'
+    matches = re.finditer(pattern, text)
+    
+    for match in matches:
+        if match.group(1):
+            references.append(f"({match.group(1)})")
+        if match.group(2):
+            references.append(f"({match.group(2)})")
+    
+    # Also handle "under Subsection (x)" pattern
+    pattern2 = r'under\s+[Ss]ubsection\s+\(([a-z](?:-\d+)?)\)'
+    for match in re.finditer(pattern2, text):
+        ref = f"({match.group(1)})"
+        if ref not in references:
+            references.append(ref)
+    
+    return references
+
+
+def subsection_tree(full_text):
+    """
+    The subsection tree of a section's full text ("\\n" between paragraphs):
+    nodes {'label', 'start', 'end', 'children'} as statuteTree uses, with
+    full_text[start:end] the whole subsection.
+    """
+    labels = []
+    position = 0
+    for paragraph in full_text.split('\n'):
+        if paragraph.startswith('Sec.'):
+            match = HEADER_LABEL_RE.search(paragraph)
+        else:
+            match = PARAGRAPH_LABEL_RE.match(paragraph)
+        if match:
+            labels.append((position, match.group('name'), match.group()))
+        position += len(paragraph) + 1
+    return build_tree(full_text, labels)
+
+
+def subsection_paths(full_text):
+    """
+    The subsection tree flattened to {lower-cased path: [start, end,
+    lead_in_end]} in document order, where full_text[start:lead_in_end] is
+    the subsection's own text before its first child.
+    """
+    return flatten_tree(subsection_tree(full_text))
+
+
+def flatten_tree(tree):
+    """Flatten a subsection tree (as built by build_tree) the way subsection_paths() does."""
+    paths = {}
+
+    def add(nodes, prefix):
+        previous = None
+        for node in nodes:
+            path = prefix + node['label'].lower()
+            children = node['children']
+            if path == previous:
+                # The same label again (e.g. after a repeated section header)
+                # continues the subsection
+                paths[path][1] = node['end']
+            elif path not in paths:
+                # Otherwise the first subsection with a path wins
+                paths[path] = [node['start'], node['end'], children[0]['start'] if children else node['end']]
+            previous = path
+            if children:
+                add(children, path)
+
+    add(tree, '')
+    return paths
+
+
+class SectionTree:
+    """
+    The subsections of one section's full text, by lower-cased path.
+    paths is the section's subsection_paths(), if already parsed.
+    """
+
+    def __init__(self, full_text, paths=None):
+        self.full_text = full_text
+        self.paths = subsection_paths(full_text) if paths is None else paths
+        self._references = {}
+        self._elements = {}
+
+    def find(self, path):
+        """[start, end, lead_in_end] of the subsection at exactly this path, e.g. '(b)(1)(A)', or None."""
+        return self.paths.get(path.lower()) if path else None
+
+    def resolve(self, path):
+        """The longest prefix of path that is a subsection, or None."""
+        found = None
+        prefix = ''
+        for part in PATH_PART_RE.findall(path.lower() if path else ''):
+            prefix += part
+            if prefix not in self.paths:
+                break
+            found = prefix
+        return found
+
+    def text(self, path):
+        """A subsection's text, children included."""
+        start, end, _ = self.paths[path]
+        return self.full_text[start:end]
+
+    def target_text(self, path):
+        """
+        The text of the subsection at path, preceded by the lead-in of each
+        enclosing subsection, e.g. "(a) ... if the person:" before "(2) ...".
+        """
+        parts = []
+        prefix = ''
+        for part in PATH_PART_RE.findall(path)[:-1]:
+            prefix += part
+            start, _, lead_in_end = self.paths[prefix]
+            parts.append(self.full_text[start:lead_in_end].rstrip())
+        parts.append(self.text(path))
+        return '\n'.join(parts)
+
+    def offense_subsection(self):
+        """Path of the first top-level subsection (by label) defining an offense."""
+        top_level = sorted(path for path in self.paths if path.count('(') == 1)
+        for path in top_level:
+            if OFFENSE_RE.search(self.text(path)):
+                return path
+        return None
+
+    def references(self, path):
+        """Top-level subsections referred to by the target text at path (None: whole section)."""
+        refs = self._references.get(path)
+        if refs is None:
+            text = self.target_text(path) if path else self.full_text
+            refs = self._references[path] = find_referenced_subsections(text)
+        return refs
+
+    def element_paths(self, subsection=None):
+        """
+        The paths elements() joins for a cited subsection path: referenced
+        top-level subsections first, then the cited one (None for the whole
+        section) unless a reference already covers it.
+        """
+        path = self.resolve(subsection) or self.offense_subsection()
+        paths = []
+        for ref in self.references(path):
+            ref = ref.lower()
+            if ref in self.paths and ref not in paths:
+                paths.append(ref)
+        if path is None or path[:path.index(')') + 1] not in paths:
+            paths.append(path)
+        return paths
+
+    def elements(self, subsection=None):
+        """
+        The elements text for a cited subsection path (None for the whole
+        section): referenced subsections first, then the cited one.
+        """
+        key = subsection.lower() if subsection else None
+        if key in self._elements:
+            return self._elements[key]
+
+        # A top-level reference has no lead-in, so its target text is its text
+        elements = '\n'.join(remove_section_header(self.target_text(path) if path else self.full_text)
+                              for path in self.element_paths(key))
+        self._elements[key] = elements
+        return elements
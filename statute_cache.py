@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk cache for parsed statute sources.
+
+Parsing PE.htm, TN.doc and the statute PDFs dominates every data refresh, yet
+the sources rarely change. Parsed results are stored in a SQLite file under
+the cache directory (STATUTE_CACHE_DIR, default ".cache"), one entry per
+(source file, parser). An entry is reused only while the file's SHA-256 and
+the parser version both match, so replacing one chapter re-parses only that
+chapter. Set STATUTE_CACHE=0 to bypass the cache entirely.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+
+CACHE_DIR = os.environ.get('STATUTE_CACHE_DIR', '.cache')
+CACHE_FILE = 'statute_corpus.sqlite'
+
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StatuteCache:
+    """
+    SQLite-backed cache of parser output keyed by source path + content hash.
+
+    Payloads are stored as JSON, so cached values come back with lists in
+    place of tuples. The file's mtime and size are stored alongside the hash;
+    when they are unchanged the stored hash is trusted and the file is not
+    re-read.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CACHE_DIR, CACHE_FILE)
+        self._conn = None
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            # Worker processes share the file, so wait on locks instead of failing
+            self._conn = sqlite3.connect(self.path, timeout=60)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                ' source TEXT NOT NULL,'
+                ' parser TEXT NOT NULL,'
+                ' version INTEGER NOT NULL,'
+                ' sha256 TEXT NOT NULL,'
+                ' mtime_ns INTEGER NOT NULL,'
+                ' size INTEGER NOT NULL,'
+                ' payload TEXT NOT NULL,'
+                ' PRIMARY KEY (source, parser))'
+            )
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get_or_parse(self, source_path, parser, version, parse_fn):
+        """
+        Return parse_fn(source_path), reusing the cached result when the file
+        content and parser version are unchanged.
+        """
+        source = os.path.abspath(source_path)
+        st = os.stat(source)
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT version, sha256, mtime_ns, size, payload FROM entries'
+            ' WHERE source = ? AND parser = ?', (source, parser)
+        ).fetchone()
+
+        sha256 = None
+        if row and row[0] == version:
+            if (row[2], row[3]) == (st.st_mtime_ns, st.st_size):
+                self.stats['hits'] += 1
+                return json.loads(row[4])
+            sha256 = file_digest(source)
+            if sha256 == row[1]:
+                # Touched but not changed: refresh the stat fingerprint
+                with conn:
+                    conn.execute(
+                        'UPDATE entries SET mtime_ns = ?, size = ?'
+                        ' WHERE source = ? AND parser = ?',
+                        (st.st_mtime_ns, st.st_size, source, parser))
+                self.stats['hits'] += 1
+                return json.loads(row[4])
+
+        self.stats['misses'] += 1
+        value = parse_fn(source_path)
+        if sha256 is None:
+            sha256 = file_digest(source)
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO entries'
+                ' (source, parser, version, sha256, mtime_ns, size, payload)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (source, parser, version, sha256, st.st_mtime_ns, st.st_size,
+                 json.dumps(value, ensure_ascii=False)))
+        return value
+
+
+# One cache per process, opened on first use
+_default_cache = None
+
+
+def get_default_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = StatuteCache()
+    return _default_cache
+
+
+def cached_parse(source_path, parser, version, parse_fn):
+    """
+    Parse source_path through the default cache.
+
+    parser names the extraction (e.g. "tn_chapter") and version must be bumped
+    whenever that parser's output changes. With STATUTE_CACHE=0 this simply
+    calls parse_fn(source_path).
+    """
+    if os.environ.get('STATUTE_CACHE', '1') == '0':
+        return parse_fn(source_path)
+    return get_default_cache().get_or_parse(source_path, parser, version, parse_fn)
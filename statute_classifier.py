@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Longest-prefix statute classifier for citation columns.
+
+The citation cleanup scripts used to find a citation's statute by trying
+every known statute code with startswith() on every row. StatuteClassifier
+compiles the statute vocabulary into one regex shaped like a prefix trie
+(e.g. ED, EDC, EC -> E(?:C|D(?:C)?)), so a whole citation column is split
+into (statute, remainder) in one vectorized str.extract pass. The trie's
+greedy optional branches always take the longest matching code.
+
+Codes that are prefixes of other codes (ED / EDC) are ambiguous: a citation
+that starts with EDC also starts with ED. These are listed by
+ambiguous_prefixes() and counted per row by report().
+
+    classifier = StatuteClassifier.from_all_offenses('offense_codes.xlsx')
+    parts = classifier.split(df['citation'])   # columns: statute, remainder
+"""
+
+import re
+import sys
+
+import pandas as pd
+
+# Sentinel for an empty vocabulary: a pattern that never matches
+NEVER = r'(?!)'
+
+
+def trie_pattern(words):
+    """A regex matching any of words, preferring the longest."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def walk(node):
+        branches = [re.escape(ch) + walk(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A word ends here: the longer branches are optional (and greedy)
+        return f'(?:{body})?' if '' in node else body
+
+    return walk(trie) if words else NEVER
+
+
+class StatuteClassifier:
+    def __init__(self, statutes):
+        self.statutes = sorted({str(s) for s in statutes if str(s)}, key=lambda s: (-len(s), s))
+        self.pattern = re.compile(
+            r'^(?P<statute>' + trie_pattern(self.statutes) + r')\s*(?P<remainder>.*)$', re.DOTALL)
+        self._shadowed = {
+            s: [t for t in self.statutes if len(t) < len(s) and s.startswith(t)]
+            for s in self.statutes
+        }
+
+    @classmethod
+    def from_statute_column(cls, statutes):
+        """Vocabulary from a statute column, ignoring blanks and one-letter codes."""
+        return cls(s for s in statutes.dropna().astype(str).unique() if len(s) > 1)
+
+    @classmethod
+    def from_all_offenses(cls, file_path, sheet_name='ALL_OFFENSES'):
+        df = pd.read_excel(file_path, sheet_name=sheet_name, usecols=['statute'])
+        return cls.from_statute_column(df['statute'])
+
+    def split(self, citations):
+        """
+        Split a citation Series into a DataFrame with statute and remainder
+        columns, on the same index. Citations are stripped first; rows with
+        no known prefix get NaN in both columns.
+        """
+        return citations.astype(str).str.strip().str.extract(self.pattern)
+
+    def classify(self, citation):
+        """(statute, remainder) for one citation, or (None, citation)."""
+        citation = str(citation).strip()
+        m = self.pattern.match(citation)
+        return (m.group('statute'), m.group('remainder')) if m else (None, citation)
+
+    def ambiguous_prefixes(self):
+        """{longer code: [shorter codes it also starts with]}"""
+        return {s: shorter for s, shorter in self._shadowed.items() if shorter}
+
+    def report(self, parts):
+        """Print match counts and how many rows an ambiguous prefix decided."""
+        matched = parts['statute'].dropna()
+        print(f"Matched {len(matched)} of {len(parts)} citations to {matched.nunique()} statute(s).")
+        ambiguous = self.ambiguous_prefixes()
+        if not ambiguous:
+            return
+        counts = matched.value_counts()
+        print("Ambiguous prefixes (longest match wins):")
+        for code, shorter in ambiguous.items():
+            print(f"  {code} also starts with {', '.join(shorter)}: {int(counts.get(code, 0))} row(s)")
+
+
+if __name__ == "__main__":
+    file_path = sys.argv[1] if len(sys.argv) > 1 else 'offense_codes.xlsx'
+    df = pd.read_excel(file_path, sheet_name='ALL_OFFENSES')
+    classifier = StatuteClassifier.from_statute_column(df['statute'])
+    print(f"Statutes: {', '.join(classifier.statutes)}")
+    classifier.report(classifier.split(df['citation']))
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+One resolver for statute text, whatever format a code comes in.
+
+    source = StatuteSource()
+    source.resolve('TC', '545.157(b)(1) 3241')
+    # {'statute': 'TC', 'section': '545.157', 'subsection': '(b)(1)',
+    #  'text': 'Sec. 545.157. ...', 'source': 'TN.doc/tn.545.docx'}
+
+Each statute has an ordered list of backends, and the first one holding the
+section answers:
+
+    HtmlSource  a folder of chapter pages with <a name="N.NN"> anchors (PE.htm/pe.N.htm)
+    DocxSource  a folder of chapter documents of "Sec. N." paragraphs (TN.doc/tn.N.docx)
+    PdfSource   a whole-code PDF with "Sec. N." headers (PENALCODE.pdf)
+
+A backend lists its folder (or reads its PDF's page texts) the first time it
+is asked for something, and keeps the last max_chapters parsed chapters in an
+LRU, so enriching every sheet holds a bounded number of chapters however many
+it touches. Parsing goes through the statute cache, so an evicted chapter
+comes back from SQLite rather than being parsed again. A section's
+section_tree.SectionTree is built once and evicted with its chapter.
+
+STATUTE_SOURCES is the default registry; any statute can also have a
+whole-code PDF at statutes/<STATUTE>.pdf, tried last. Backends whose files
+do not exist are left out.
+"""
+
+import argparse
+import html
+import os
+import re
+from collections import OrderedDict
+
+from docx import Document
+
+from citation_parser import parse_citation
+from section_tree import SectionTree, subsection_paths
+from statute_cache import cached_parse
+
+TN_DOC_FOLDER = 'TN.doc'
+PE_HTML_FOLDER = 'PE.htm'
+STATUTE_PDF_FOLDER = 'statutes'
+
+# Backends tried in order for each statute, as (kind, path)
+STATUTE_SOURCES = {
+    'PC': [('html', PE_HTML_FOLDER), ('pdf', 'PENALCODE.pdf')],
+    'TC': [('docx', TN_DOC_FOLDER), ('pdf', 'TRANSPORTATION CODE.pdf')],
+}
+
+# Parsed chapters each backend keeps in memory
+DEFAULT_MAX_CHAPTERS = 32
+
+# Bump when extract_sections_from_file() output changes to invalidate the cache
+HTML_PARSER_VERSION = 2
+
+# Bump when parse_chapter_sections() output changes to invalidate the cache
+CHAPTER_PARSER_VERSION = 2
+
+# Only match TRUE statute sections like 39.02, 22.041, etc.
+# NOT internal reference IDs like 62261.53562 (5+ digit prefix)
+# Statute format: 1-3 digit chapter, dot, 1-4 digit section (e.g., 39.02, 22.041)
+STATUTE_ANCHOR_RE = re.compile(r'<a name="(\d{1,3}\.\d{1,4})">', re.IGNORECASE)
+
+# Markup (tags, comments, doctype) that strip_html_text() replaces with a space
+TAG_RE = re.compile(r'<(?:[A-Za-z/!?][^>]*)>')
+SPACES_RE = re.compile(r' +')
+
+# Whitespace that html.parser collapses in whitespace-only text nodes
+ASCII_SPACES = ' \n\t\x0c\r'
+
+SECTION_HEADER_RE = re.compile(r'Sec\.\s*(\d+\.\w+)', re.IGNORECASE)
+NEXT_SECTION_RE = re.compile(r'Sec\.\s*\d+\.\d+', re.IGNORECASE)
+HISTORY_RE = re.compile(r'^(Acts|Added by Acts|Amended by)', re.IGNORECASE)
+
+# The chapter in a chapter file's name, e.g. "pe.22.htm" or "tn.545.docx"
+CHAPTER_FILE_RE = re.compile(r'^[^.]+\.(\w+)\.(htm|html|docx)$', re.IGNORECASE)
+
+
+def strip_html_text(html_content):
+    """Text of an HTML fragment, as BeautifulSoup's get_text() would give it, without building a DOM."""
+    if not html_content: return ""
+    chunks = []
+    for chunk in TAG_RE.split(html_content):
+        chunk = html.unescape(chunk)
+        if chunk and not chunk.strip(ASCII_SPACES):
+            # Whitespace-only text between tags becomes a newline or a space
+            chunk = '\n' if '\n' in chunk else ' '
+        chunks.append(chunk)
+    text = ' '.join(chunks)
+    lines = [line.strip() for line in text.split('\n')]
+    cleaned = '\n'.join([line for line in lines if line])
+    cleaned = SPACES_RE.sub(' ', cleaned)
+    return cleaned
+
+
+def extract_sections_from_file(path):
+    """
+    Extract every statute section from one PE.htm file in a single pass.
+
+    A section starts at its first anchor and ends at the next anchor with a
+    DIFFERENT section number (repeated anchors for the same number are part
+    of the same section), or at </pre> / </body> for the last one.
+    """
+    sections = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    def keep(section_num, start_pos, end_pos):
+        cleaned = strip_html_text(content[start_pos:end_pos])
+        if section_num not in sections or len(cleaned) > len(sections[section_num]):
+            sections[section_num] = cleaned
+
+    current = None
+    run_starts = []
+    for m in STATUTE_ANCHOR_RE.finditer(content):
+        section_num = m.group(1)
+        if section_num == current:
+            run_starts.append(m.start())
+            continue
+        if current is not None:
+            # The run's first anchor covers every later anchor in the run
+            keep(current, run_starts[0], m.start())
+        current = section_num
+        run_starts = [m.start()]
+
+    # The last run ends at the </pre> or </body> after each of its anchors,
+    # which can differ when the run spans several <pre> blocks
+    for start_pos in run_starts:
+        end_pos = content.find('</pre>', start_pos)
+        if end_pos == -1: end_pos = content.find('</body>', start_pos)
+        if end_pos == -1: end_pos = len(content)
+        keep(current, start_pos, end_pos)
+
+    return sections
+
+
+def parse_chapter_sections(doc_path):
+    """
+    Parse a TN.doc chapter once and index every section in it.
+
+    Returns a dict mapping the lower-cased section number (e.g. "545.001") to
+    (full_statute_text, subsection_paths), with the same boundaries that
+    extract_section_from_doc() has always used: a section starts at the first
+    "Sec. N" paragraph for that number and ends at the next different section
+    header or at the legislative history ("Acts ...").
+    """
+    doc = Document(doc_path)
+
+    sections = {}
+    current = None          # Section number currently being collected
+    paragraphs_text = []
+
+    def close_section():
+        if current is not None and paragraphs_text:
+            full_text = '\n'.join(paragraphs_text)
+            sections[current] = (full_text, subsection_paths(full_text))
+
+    for para in doc.paragraphs:
+        text = para.text.strip()
+        if not text:
+            continue
+
+        header = SECTION_HEADER_RE.match(text) if NEXT_SECTION_RE.match(text) else None
+        if header:
+            number = header.group(1).lower()
+            if number != current:
+                close_section()
+                # Only the first occurrence of a section is used
+                current = number if number not in sections else None
+                paragraphs_text = []
+            if current is None:
+                continue
+
+            paragraphs_text.append(text)
+            continue
+
+        if current is None:
+            continue
+
+        # Legislative history ends the section
+        if HISTORY_RE.match(text):
+            close_section()
+            current = None
+            continue
+
+        paragraphs_text.append(text)
+
+    close_section()
+    return sections
+
+
+def chapter_of(section):
+    """The chapter of a section number: "545.157" -> "545"."""
+    return str(section).split('.')[0].lower()
+
+
+def new_stats():
+    return {
+        'chapter_hits': 0,
+        'chapter_misses': 0,
+        'chapter_evictions': 0,
+        'path_hits': 0,
+        'path_misses': 0,
+        'tree_hits': 0,
+        'tree_misses': 0,
+    }
+
+
+class ChapterSource:
+    """
+    A statute source read a chapter at a time.
+
+    Subclasses build the chapter index ({chapter: file}) in _list_chapters()
+    and parse one chapter into {section: (full_text, subsection_paths or
+    None)} in _parse_chapter(). The index is built on first use; parsed
+    chapters (with the SectionTrees built from them) are kept in an LRU of
+    max_chapters. Counters go to `stats`, which a StatuteSource shares
+    between its backends.
+    """
+
+    def __init__(self, path, max_chapters=DEFAULT_MAX_CHAPTERS, stats=None):
+        self.path = path
+        self.max_chapters = max_chapters
+        self.stats = new_stats() if stats is None else stats
+        self._files = None
+        self._chapters = OrderedDict()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path!r})"
+
+    def files(self):
+        """{chapter: file} for every chapter the source has."""
+        if self._files is None:
+            self._files = self._list_chapters()
+        return self._files
+
+    def chapter_files(self):
+        """(chapter, file) pairs in file name order."""
+        return sorted(self.files().items(), key=lambda item: (item[1].lower(), item[0]))
+
+    def chapter_path(self, chapter):
+        """The file holding a chapter, or None."""
+        path = self.files().get(str(chapter).lower()) if chapter else None
+        self.stats['path_hits' if path else 'path_misses'] += 1
+        return path
+
+    def _chapter_files(self, extensions):
+        """
+        {chapter: file} for the files in the folder with one of extensions,
+        named by CHAPTER_FILE_RE. Files that name no chapter, or a chapter an
+        earlier file already has, are skipped and listed.
+        """
+        files = {}
+        skipped = []
+        if os.path.isdir(self.path):
+            for filename in sorted(os.listdir(self.path)):
+                if not filename.lower().endswith(extensions):
+                    continue
+                m = CHAPTER_FILE_RE.match(filename)
+                if m and m.group(1).lower() not in files:
+                    files[m.group(1).lower()] = os.path.join(self.path, filename)
+                else:
+                    skipped.append(filename)
+        if skipped:
+            print(f"Skipping {len(skipped)} file(s) in {self.path} that do not name a chapter of their own "
+                  f"(expected <name>.<chapter>{extensions[0]}): {', '.join(skipped)}")
+        return files
+
+    def _entry(self, chapter):
+        """(sections, trees) of a chapter, parsed on a miss and evicting the least recently used."""
+        entry = self._chapters.get(chapter)
+        if entry is not None:
+            self.stats['chapter_hits'] += 1
+            self._chapters.move_to_end(chapter)
+            return entry
+        self.stats['chapter_misses'] += 1
+        path = self.files().get(chapter)
+        entry = self._chapters[chapter] = (self._parse_chapter(chapter, path) if path else {}, {})
+        if len(self._chapters) > self.max_chapters:
+            self._chapters.popitem(last=False)
+            self.stats['chapter_evictions'] += 1
+        return entry
+
+    def chapter(self, chapter):
+        """{section: (full_text, subsection_paths or None)} for a chapter ({} if there is none)."""
+        return self._entry(str(chapter).lower())[0]
+
+    def section(self, section):
+        """(full_text, subsection_paths or None) for a section number, or None."""
+        return self.chapter(chapter_of(section)).get(str(section).lower())
+
+    def section_tree(self, section):
+        """The SectionTree of a section, or None if the source does not have it."""
+        number = str(section).lower()
+        sections, trees = self._entry(chapter_of(number))
+        if number in trees:
+            self.stats['tree_hits'] += 1
+            return trees[number]
+        self.stats['tree_misses'] += 1
+        found = sections.get(number)
+        tree = trees[number] = SectionTree(*found) if found and found[0] else None
+        return tree
+
+
+class HtmlSource(ChapterSource):
+    """A folder of chapter pages such as PE.htm/pe.22.htm."""
+
+    def _list_chapters(self):
+        return self._chapter_files(('.htm', '.html'))
+
+    def _parse_chapter(self, chapter, path):
+        parsed = cached_parse(path, 'pe_html', HTML_PARSER_VERSION, extract_sections_from_file)
+        return {number.lower(): (text, None) for number, text in parsed.items()}
+
+
+class DocxSource(ChapterSource):
+    """A folder of chapter documents such as TN.doc/tn.545.docx."""
+
+    def _list_chapters(self):
+        return self._chapter_files(('.docx',))
+
+    def _parse_chapter(self, chapter, path):
+        parsed = cached_parse(path, 'tn_chapter', CHAPTER_PARSER_VERSION, parse_chapter_sections)
+        return {number: (full_text, paths) for number, (full_text, paths) in parsed.items()}
+
+
+class PdfSource(ChapterSource):
+    """
+    A whole-code PDF. Its page texts are read once (through the statute
+    cache) into an extract_statute.SectionIndex, and a chapter is every
+    section numbered in it; the chapter's file is the PDF itself.
+    """
+
+    def __init__(self, path, max_chapters=DEFAULT_MAX_CHAPTERS, stats=None):
+        super().__init__(path, max_chapters, stats)
+        self._index = None
+        self._numbers = None
+
+    def _section_index(self):
+        if self._index is None:
+            # Imported here so the HTML and docx backends do not need pypdfium2
+            from extract_statute import SectionIndex
+            self._index = SectionIndex.from_pdf(self.path) if os.path.exists(self.path) else SectionIndex([])
+            self._numbers = {}
+            for number in self._index.numbers():
+                self._numbers.setdefault(chapter_of(number), []).append(number)
+        return self._index
+
+    def _list_chapters(self):
+        self._section_index()
+        return {chapter: self.path for chapter in self._numbers}
+
+    def _parse_chapter(self, chapter, path):
+        index = self._section_index()
+        # Page text breaks lines with \r\n; PE.htm and TN.doc text uses \n
+        return {number.lower(): (index.get(number).replace('\r\n', '\n').replace('\r', '\n'), None)
+                for number in self._numbers.get(chapter, [])}
+
+
+BACKENDS = {'html': HtmlSource, 'docx': DocxSource, 'pdf': PdfSource}
+
+
+class StatuteSource:
+    """
+    The backends of every statute, created on first use, with one `stats`
+    dict shared between them.
+
+    sources maps a statute to [(kind, path), ...] tried in order (kind is a
+    key of BACKENDS); a statute may also have pdf_folder/<STATUTE>.pdf,
+    tried last.
+    """
+
+    def __init__(self, sources=None, pdf_folder=STATUTE_PDF_FOLDER, max_chapters=DEFAULT_MAX_CHAPTERS):
+        self.sources = STATUTE_SOURCES if sources is None else sources
+        self.pdf_folder = pdf_folder
+        self.max_chapters = max_chapters
+        self.stats = new_stats()
+        self._backends = {}
+
+    def backends(self, statute):
+        """The backends for a statute whose files exist, in the order they are tried."""
+        statute = (statute or '').upper()
+        if statute not in self._backends:
+            paths = list(self.sources.get(statute, []))
+            if self.pdf_folder:
+                paths.append(('pdf', os.path.join(self.pdf_folder, f"{statute}.pdf")))
+            self._backends[statute] = [BACKENDS[kind](path, self.max_chapters, self.stats)
+                                       for kind, path in paths if statute and os.path.exists(path)]
+        return self._backends[statute]
+
+    def locate(self, statute, section):
+        """(backend, file) of the first backend with the section's chapter, or (None, None)."""
+        chapter = chapter_of(section) if section else None
+        for backend in self.backends(statute):
+            path = backend.chapter_path(chapter)
+            if path:
+                return backend, path
+        return None, None
+
+    def section(self, statute, section):
+        """(full_text, subsection_paths or None, backend) for a section, or None."""
+        for backend in self.backends(statute):
+            found = backend.section(section)
+            if found and found[0]:
+                return found[0], found[1], backend
+        return None
+
+    def section_text(self, statute, section):
+        """A section's full text, or None."""
+        found = self.section(statute, section) if section else None
+        return found[0] if found else None
+
+    def section_tree(self, statute, section):
+        """The SectionTree of a section from the first backend that has it, or None."""
+        for backend in self.backends(statute):
+            tree = backend.section_tree(section)
+            if tree is not None:
+                return tree
+        return None
+
+    def resolve(self, statute, citation):
+        """
+        The section a citation such as "545.157(b)(1) 3241" cites:
+        {'statute', 'section', 'subsection', 'text', 'source'} with source
+        the file the text came from, or None if no backend has it.
+        """
+        parts = parse_citation(citation)
+        found = self.section(statute, parts['section']) if parts['section'] else None
+        if found is None:
+            return None
+        text, _, backend = found
+        return {
+            'statute': statute.upper(),
+            'section': parts['section'],
+            'subsection': parts['subsection'],
+            'text': text,
+            'source': backend.chapter_path(chapter_of(parts['section'])),
+        }
+
+
+_default_source = None
+
+
+def get_default_source():
+    """The process-wide StatuteSource behind resolve()."""
+    global _default_source
+    if _default_source is None:
+        _default_source = StatuteSource()
+    return _default_source
+
+
+def resolve(statute, citation):
+    """StatuteSource.resolve() on the process-wide source."""
+    return get_default_source().resolve(statute, citation)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve statute citations to their text.")
+    parser.add_argument('statute', help='statute abbreviation, e.g. PC or TC')
+    parser.add_argument('citations', nargs='+', help='citations, e.g. "22.01(a)(1)"')
+    args = parser.parse_args()
+
+    source = get_default_source()
+    print(f"{args.statute}: {', '.join(map(repr, source.backends(args.statute))) or 'no sources'}")
+    for citation in args.citations:
+        found = source.resolve(args.statute, citation)
+        if found is None:
+            print(f"\n{citation}: not found")
+            continue
+        print(f"\n{citation}: Sec. {found['section']}{found['subsection'] or ''} from {found['source']}")
+        print(found['text'][:500])
+
+
+if __name__ == '__main__':
+    main()
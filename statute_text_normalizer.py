@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Normalize statute text in one pass and index its subsections.
+
+normalize_statute_text() reads a statuteText once with a single tokenizer
+and returns the same text fix_statute_text() always produced:
+- legislative history ("Acts 1973, 63rd Leg...", "Added by Acts ...",
+  "Amended by: Acts ...") is cut off
+- (a) markers after a period, (1) after a colon, and (A) or (i) after a
+  colon or semicolon start a new line
+
+It also returns the subsection tree of the result, so later stages and the
+app never split the text again. A node is
+
+    {'label': '(a)', 'start': 57, 'end': 140, 'children': [...]}
+
+where text[start:end] is the whole subsection, children included. A label
+is a subsection when it starts a line or follows a period, colon or
+semicolon and spaces (optionally with "or" / "and"). A bare (b) in "Subsection (b)"
+is a reference, not a subsection. So is a label that only starts a line
+because the text is hard-wrapped: one at the start of a line that does not
+follow a period, colon or semicolon is a subsection only if it comes next
+in sequence ((3) after (2), or (1) opening a level). That keeps the (8) of
+"under Subsection (a)(7) or\n(8) and:" out of the tree. Levels nest in the
+order the labels appear: (a) > (1) > (A) > (i) in the Penal Code, but any order works.
+Whether (i), (v) or (x) is a letter or a roman numeral depends on its
+neighbours: (i) after (h) is a letter, (i) under (A) is a numeral.
+"""
+
+import re
+
+LABEL = r'(?P<label>\((?P<name>[a-z]|[ivx]+|\d+|[A-Z])(?P<suffix>-\d+)?\))'
+# Every token starts at a newline, period, colon or semicolon, so the
+# scanner skips ahead to those characters
+TOKEN_RE = re.compile(
+    r'(?P<punct>[\n.:;])(?:'
+    # Legislative history runs from here to the end of the text
+    r'(?P<history> ?(?:Added by |Amended by: |)Acts \d{4})'
+    # A subsection label and what leads into it
+    r'|(?P<gap>[ \xa0]+(?:(?:or|and)[ \xa0]+)?|)' + LABEL + r')'
+)
+LABEL_RE = re.compile(LABEL)
+ROMAN = ['i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+         'xi', 'xii', 'xiii', 'xiv', 'xv', 'xvi', 'xvii', 'xviii', 'xix', 'xx']
+
+
+def _breaks_line(punct, gap, name, suffix):
+    """Whether the gap before a label becomes a new line (the old formatting rules)."""
+    if gap != ' ' or suffix:
+        return False
+    if punct == '.':
+        return len(name) == 1 and name.islower()
+    if punct == ':' and name.isdigit():
+        return True
+    return name.isupper() or not name.strip('ivx')
+
+
+def _kind(name, stack):
+    """'lower', 'digit', 'upper' or 'roman' for a label, given the open subsections."""
+    if name.isdigit():
+        return 'digit'
+    if name.isupper():
+        return 'upper'
+    if len(name) > 1:
+        return 'roman'
+    if name not in 'ivx':
+        return 'lower'
+    open_names = {kind: open_name for kind, open_name, _ in stack}
+    roman = open_names.get('roman')
+    if roman in ROMAN and ROMAN.index(roman) + 1 == ROMAN.index(name):
+        return 'roman'
+    if name == 'i' and stack and stack[-1][0] == 'upper':
+        return 'roman'
+    lower = open_names.get('lower')
+    if lower and ord(lower) + 1 == ord(name):
+        return 'lower'
+    return 'roman' if 'upper' in open_names else 'lower'
+
+
+def _in_sequence(kind, name, label, previous):
+    """Whether a label comes right after previous (the open sibling's name, or None for a new level)."""
+    if previous is None:
+        return name in ('1', 'a', 'A', 'i')
+    if name == previous:
+        return label != f'({name})'  # (a-1) after (a)
+    if kind == 'digit':
+        return int(name) == int(previous) + 1
+    if kind == 'roman':
+        return previous in ROMAN and name in ROMAN and ROMAN.index(name) == ROMAN.index(previous) + 1
+    return len(name) == len(previous) == 1 and ord(name) == ord(previous) + 1
+
+
+def build_tree(text, labels, tentative=()):
+    """
+    Nest subsection starts into a tree over text. labels are (position,
+    name, label) in text order, e.g. (57, 'a', '(a)'). A label whose
+    position is in tentative is skipped unless it is next in sequence.
+    """
+    tree = []
+    stack = []  # (kind, name, node) from the outermost open subsection in
+
+    def close(node, end):
+        while end > node['start'] and text[end - 1].isspace():
+            end -= 1
+        node['end'] = end
+
+    for position, name, label in labels:
+        kind = _kind(name, stack)
+        # A label of an open kind is a sibling there; otherwise it nests
+        depth = len(stack)
+        for i, (open_kind, _, _) in enumerate(stack):
+            if open_kind == kind:
+                depth = i
+                break
+        if position in tentative and not _in_sequence(
+                kind, name, label, stack[depth][1] if depth < len(stack) else None):
+            continue
+        for _, _, node in stack[depth:]:
+            close(node, position)
+        del stack[depth:]
+        node = {'label': label, 'start': position, 'end': None, 'children': []}
+        (stack[-1][2]['children'] if stack else tree).append(node)
+        stack.append((kind, name, node))
+    for _, _, node in stack:
+        close(node, len(text))
+    return tree
+
+
+def normalize_statute_text(text):
+    """Return (formatted text, subsection tree) for one statuteText."""
+    if not text or not text.strip():
+        return text, []
+
+    pieces = []
+    labels = []
+    tentative = set()
+    # Positions in the output, which starts after the leading whitespace
+    size = -(len(text) - len(text.lstrip()))
+    copied = 0  # how much of text is in pieces
+    end = len(text)
+    first = LABEL_RE.match(text)
+    if first:
+        labels.append((0, first.group('name'), first.group('label')))
+    for match in TOKEN_RE.finditer(text):
+        punct, history, gap, label, name, suffix = match.groups()
+        if history is not None:
+            if punct == '\n' and history[0] != ' ':
+                end = match.start()
+                break
+            if punct == '.':
+                end = match.start() + 1
+                break
+            continue
+        if (punct == '\n') != (gap == ''):
+            continue  # e.g. "(a)(1)" or ".(2)"; only a line start needs no gap
+        label_start = match.start('label')
+        piece = text[copied:label_start]
+        if _breaks_line(punct, gap, name, suffix):
+            piece = piece[:-1] + '\n'
+        pieces.append(piece)
+        size += len(piece)
+        copied = label_start
+        if punct == '\n':
+            before = match.start()
+            while before and text[before - 1].isspace():
+                before -= 1
+            if before and text[before - 1] not in '.:;':
+                # The line may just be wrapped mid-sentence
+                tentative.add(size)
+        labels.append((size, name, label))
+    pieces.append(text[copied:end])
+
+    formatted = ''.join(pieces).strip()
+    return formatted, build_tree(formatted, labels, tentative)
+
+
+def subsection_text(text, node):
+    """A node's own text: its label up to its first child."""
+    end = node['children'][0]['start'] if node['children'] else node['end']
+    return text[node['start']:end].rstrip()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Statute cross-references: the reference grammar and the built graph.
+
+find_references() finds the statutes a section's text refers to:
+
+    Section 49.04                     -> PC 49.04
+    Sections 28.03 or 31.03           -> PC 28.03, PC 31.03
+    Section 22.011 (a)(2)             -> PC 22.011(a)(2)
+    Section 42.01 (a)(7) or (8)       -> PC 42.01(a)(7), PC 42.01(a)(8)
+    Section 481.1022 , Health and Safety Code  -> HSC 481.1022
+    Chapter 20A , 21 , or 22          -> PC 20a, PC 21, PC 22
+    Sections 22.01 through 22.04      -> PC 22.01, PC 22.011, PC 22.02, ... PC 22.04
+    Chapters 19 through 22            -> PC 19, PC 20, PC 21, PC 22
+    Subsection (b)                    -> (b) of this section
+    Subdivision (1)                   -> (1) of this subsection
+    Subsection (d) of that section    -> (d) of the last section named
+
+A node is "<statute> <section><path>" with the statute abbreviation the
+offense sheets use (PC, TC, HSC, ...) and the section and path lower-cased,
+e.g. "TC 545.157(b)(1)"; a whole chapter is "<statute> <chapter>" (a
+chapter number has no dot). A reference is an edge from the subsection it
+appears in, and from each enclosing subsection and the section, unless it
+points inside that node. So the edges of "PC 22.01(b)" are everything the
+text of 22.01(b) refers to outside itself, one dict lookup away.
+
+A section range becomes one "PC 22.01..22.04" target while sections are
+scanned; expand_ranges() then replaces it with every section of that
+statute known to fall in the range (sections such as 22.011 sort between
+22.01 and 22.02), or with just its ends for a statute whose sections are
+not known. A chapter range is expanded right away when both ends are plain
+numbers. A range of subsections ("Subdivisions (1) through (4)") gives
+only its ends.
+
+xref_graph.py builds the graph for PE.htm and TN.doc; XrefGraph loads it.
+"""
+
+import json
+import re
+from collections import deque
+
+from citation_parser import parse_citation
+from section_tree import PATH_PART_RE
+
+XREF_GRAPH_FILE = 'xref_graph.json'
+
+CODE_ABBREVIATIONS = {
+    'Agriculture Code': 'AGC',
+    'Alcoholic Beverage Code': 'ABC',
+    'Business & Commerce Code': 'BCC',
+    'Business and Commerce Code': 'BCC',
+    'Business Organizations Code': 'BOC',
+    'Civil Practice and Remedies Code': 'CPR',
+    'Code of Criminal Procedure': 'CCP',
+    'Education Code': 'EDC',
+    'Election Code': 'EC',
+    'Estates Code': 'EST',
+    'Family Code': 'FC',
+    'Finance Code': 'FNC',
+    'Government Code': 'GC',
+    'Health and Safety Code': 'HSC',
+    'Human Resources Code': 'HRC',
+    'Insurance Code': 'IC',
+    'Labor Code': 'LC',
+    'Local Government Code': 'LGC',
+    'Natural Resources Code': 'NRC',
+    'Occupations Code': 'OC',
+    'Parks and Wildlife Code': 'PWC',
+    'Penal Code': 'PC',
+    'Property Code': 'PRC',
+    'Special District Local Laws Code': 'SDL',
+    'Transportation Code': 'TC',
+    'Utilities Code': 'TUC',
+    'Water Code': 'WC',
+}
+
+LABEL = r'\((?:[A-Za-z]|[ivx]+|\d+)(?:-[0-9A-Za-z]+)?\)'
+PATH = rf'(?:{LABEL})+'
+SECTION = r'\d+[A-Za-z]?(?:\.\d+[A-Za-z]?)+'
+CHAPTER = r'\d+[A-Za-z]?'
+# ", ", " or ", ", and ", " through " ... between the items of a list
+LIST_SEP = r'(?:\s*,\s*(?:(?:or|and)\s+)?|\s+(?:or|and|through)\s+)'
+CODE = r'(?:[A-Z][a-z]+\s+(?:(?:and|&)\s+)?)*Code(?:\s+of\s+Criminal\s+Procedure)?'
+REFERENCE_RE = re.compile(
+    r'\b(?:'
+    rf'Sections?\s+(?P<sections>{SECTION}(?:\s?{PATH})?(?:{LIST_SEP}(?:{SECTION}(?:\s?{PATH})?|{PATH}))*)'
+    rf'|Chapters?\s+(?P<chapters>{CHAPTER}(?:{LIST_SEP}{CHAPTER})*)(?!\.\d|\d)'
+    rf'|(?P<local>Subsection|Subdivision|Paragraph|Subparagraph)s?\s+(?P<paths>{PATH}(?:{LIST_SEP}{PATH})*)'
+    rf'(?:\s+of\s+(?:(?P<of_that>that\s+section)|Section\s+(?P<of_section>{SECTION})))?'
+    r')'
+    # "Chapter 5, Title 47, United States Code"
+    r'(?:\s*,\s*(?:Subtitle|Title)\s+\w+)*'
+    rf'(?:\s*,\s*(?P<code>{CODE})|\s+of\s+(?P<of_code>that|this)\s+code)?'
+)
+SECTION_ITEM_RE = re.compile(rf'(?P<section>{SECTION})(?:\s?(?P<path>{PATH}))?|{PATH}')
+CHAPTER_ITEM_RE = re.compile(CHAPTER)
+PATH_ITEM_RE = re.compile(PATH)
+THROUGH_RE = re.compile(r'\bthrough\b')
+# Between the ends of a section range target, e.g. "PC 22.01..22.04"
+RANGE_SEP = '..'
+# How many parts of the citing path a local reference keeps: a subdivision
+# is (1) within the current subsection, a paragraph (A) within the
+# current subdivision, and so on
+LOCAL_DEPTH = {'Subsection': 0, 'Subdivision': 1, 'Paragraph': 2, 'Subparagraph': 3}
+
+
+def node_id(statute, section, path=None):
+    """'PC', '22.01', '(A)(1)' -> 'PC 22.01(a)(1)'."""
+    return f"{statute} {section.lower()}{(path or '').lower()}"
+
+
+def citation_node(statute, citation):
+    """The node for an offense's statute and citation, e.g. ('TC', '545.157(b) 3241'), or None."""
+    parts = parse_citation(citation)
+    if not statute or not parts['section']:
+        return None
+    return node_id(statute, parts['section'], parts['subsection'])
+
+
+def section_key(section):
+    """Sort key putting sections in code order: 22.01 < 22.011 < 22.02 < 22.02a."""
+    chapter, _, rest = section.lower().partition('.')
+    digits = re.match(r'\d*', chapter).group()
+    return int(digits or 0), chapter, rest
+
+
+def expand_ranges(graph, sections):
+    """
+    Replace the section range targets in graph ({node: set of targets})
+    with the sections in each range. sections is {statute: section
+    numbers} for the statutes scanned; a range in any other statute keeps
+    just its two ends.
+    """
+    known = {statute: sorted({number.lower() for number in numbers}, key=section_key)
+             for statute, numbers in sections.items()}
+    for node, targets in graph.items():
+        for target in [t for t in targets if RANGE_SEP in t]:
+            targets.discard(target)
+            statute, _, span = target.partition(' ')
+            first, _, last = span.partition(RANGE_SEP)
+            low, high = section_key(first), section_key(last)
+            found = [n for n in known.get(statute, ()) if low <= section_key(n) <= high] or [first, last]
+            for number in found:
+                expanded = node_id(statute, number)
+                if expanded != node and not expanded.startswith(node + '('):
+                    targets.add(expanded)
+
+
+def _label_kind(label):
+    name = label[1]
+    return 'digit' if name.isdigit() else 'upper' if name.isupper() else 'lower'
+
+
+def _sibling_path(previous, path):
+    """
+    A path listed after another, as (2) in "(a)(1) or (2)": it replaces the
+    previous path from its last label of the same kind, giving (a)(2).
+    """
+    parts = PATH_PART_RE.findall(previous or '')
+    kind = _label_kind(path)
+    for i in range(len(parts) - 1, -1, -1):
+        if _label_kind(parts[i]) == kind:
+            return ''.join(parts[:i]) + path
+    return path
+
+
+def _source_path(paths, position):
+    """The deepest subsection path whose span contains position ('' if none)."""
+    found = ''
+    for path, (start, end, _) in paths.items():
+        if start <= position < end and path.count('(') > found.count('('):
+            found = path
+    return found
+
+
+def find_references(statute, section, text, paths):
+    """
+    The references in one section's text, as (citing path, target node)
+    pairs in text order. paths is the section's subsection index
+    ({path: [start, end, lead_in_end]}, as section_tree.subsection_paths()).
+    """
+    references = []
+    last_section = None  # (statute, section) of the last section named
+    last_statute = statute
+    for match in REFERENCE_RE.finditer(text):
+        source = _source_path(paths, match.start())
+        code = match.group('code')
+        if code:
+            target_statute = CODE_ABBREVIATIONS.get(' '.join(code.split()), ' '.join(code.split()))
+        elif match.group('of_code') == 'that':
+            target_statute = last_statute
+        else:
+            target_statute = statute
+
+        targets = []
+        if match.group('sections'):
+            sections = match.group('sections')
+            path = None
+            end = 0
+            for item in SECTION_ITEM_RE.finditer(sections):
+                through = THROUGH_RE.search(sections, end, item.start())
+                end = item.end()
+                if item.group('section'):
+                    if through and path is None and not item.group('path') and targets:
+                        # "Sections 22.01 through 22.04": expanded by expand_ranges()
+                        targets[-1] += RANGE_SEP + item.group('section').lower()
+                        last_section = (target_statute, item.group('section'))
+                        continue
+                    last_section = (target_statute, item.group('section'))
+                    path = item.group('path')
+                else:
+                    path = _sibling_path(path, item.group())
+                targets.append(node_id(*last_section, path))
+        elif match.group('chapters'):
+            chapters = match.group('chapters')
+            end = 0
+            for item in CHAPTER_ITEM_RE.finditer(chapters):
+                chapter = item.group()
+                through = THROUGH_RE.search(chapters, end, item.start())
+                end = item.end()
+                first = targets[-1].partition(' ')[2] if targets else ''
+                if through and first.isdigit() and chapter.isdigit() and int(first) < int(chapter):
+                    targets.extend(node_id(target_statute, str(n)) for n in range(int(first) + 1, int(chapter) + 1))
+                else:
+                    targets.append(node_id(target_statute, chapter))
+        else:
+            if match.group('of_section'):
+                base = node_id(target_statute, match.group('of_section'))
+            elif match.group('of_that') and last_section:
+                base = node_id(*last_section)
+            else:
+                depth = LOCAL_DEPTH[match.group('local')]
+                base = node_id(statute, section, ''.join(PATH_PART_RE.findall(source)[:depth]))
+            path = None
+            for item in PATH_ITEM_RE.findall(match.group('paths')):
+                path = _sibling_path(path, item)
+                targets.append(base + path.lower())
+
+        if code:
+            last_statute = target_statute
+        references.extend((source, target) for target in targets)
+    return references
+
+
+def add_section(graph, statute, section, text, paths):
+    """Add one section's references to graph ({node: set of targets})."""
+    for source, target in find_references(statute, section, text, paths):
+        # The citing subsection, each enclosing one and the section itself
+        prefix = node_id(statute, section)
+        nodes = [prefix]
+        for part in PATH_PART_RE.findall(source):
+            prefix += part
+            nodes.append(prefix)
+        for node in nodes:
+            if target != node and not target.startswith(node + '('):
+                graph.setdefault(node, set()).add(target)
+
+
+class XrefGraph:
+    """
+    The cross-reference graph loaded from xref_graph.json. Nodes are as
+    node_id() builds them; lookups lower-case the section and path.
+    """
+
+    def __init__(self, edges):
+        self.edges = edges
+        self._referenced_by = None
+
+    @classmethod
+    def load(cls, path=XREF_GRAPH_FILE):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @staticmethod
+    def _key(node):
+        statute, _, rest = node.partition(' ')
+        return f"{statute} {rest.lower()}"
+
+    def references(self, node):
+        """The nodes a node's text refers to outside itself."""
+        return self.edges.get(self._key(node), [])
+
+    def referenced_by(self, node):
+        """The nodes whose text refers to node (built on first use)."""
+        if self._referenced_by is None:
+            self._referenced_by = {}
+            for source, targets in self.edges.items():
+                for target in targets:
+                    self._referenced_by.setdefault(target, []).append(source)
+        return self._referenced_by.get(self._key(node), [])
+
+    def closure(self, nodes, follow=None, max_depth=None):
+        """
+        Every node reachable from nodes (a node or a list), nearest first,
+        not including nodes themselves. With follow, only targets for which
+        follow(target) is true are returned and followed further.
+        """
+        if isinstance(nodes, str):
+            nodes = [nodes]
+        seen = {self._key(node) for node in nodes}
+        queue = deque((node, 0) for node in seen)
+        found = []
+        while queue:
+            node, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for target in self.edges.get(node, []):
+                if target in seen or (follow and not follow(target)):
+                    continue
+                seen.add(target)
+                found.append(target)
+                queue.append((target, depth + 1))
+        return found
@@ -1,10 +1,59 @@
 const CACHE_NAME = 'police-report-drafter-v2';
 const urlsToCache = ['./', './index.html', './manifest.json'];
 
+// Data files listed in the precache manifest written by the data build
+// (precache_manifest.py), i.e. the offense text shards the app loads through
+// offense_text.ts. Their file names carry a content hash, so a cached URL
+// never goes stale and a dataset refresh only downloads the files that
+// changed. Files no longer listed are dropped from the cache.
+const DATA_CACHE = 'police-report-drafter-data';
+const MANIFEST_URL = './data/precache-manifest.json';
+const SYNC_INTERVAL = 15 * 60 * 1000;
+let lastSync = 0;
+
+const syncDataCache = async () => {
+  const response = await fetch(MANIFEST_URL, { cache: 'no-cache' });
+  if (!response.ok) return;
+  const manifest = await response.json();
+  const cache = await caches.open(DATA_CACHE);
+  const wanted = new Set(manifest.files.map(file => new URL(file.url, self.registration.scope).href));
+  const cached = await cache.keys();
+  const have = new Set(cached.map(request => request.url));
+
+  // One file at a time keeps a poor connection usable for the app itself
+  let complete = true;
+  for (const url of wanted) {
+    if (have.has(url)) continue;
+    try {
+      await cache.add(url);
+    } catch (err) {
+      complete = false;
+      console.log('Data precache failed:', url, err);
+    }
+  }
+  // Keep the previous shards until the new set is fully cached, so an
+  // interrupted refresh never leaves the device without offense text
+  if (complete) {
+    await Promise.all(cached.filter(request => !wanted.has(request.url)).map(request => cache.delete(request)));
+  }
+};
+
+const syncDataCacheQuietly = () => {
+  lastSync = Date.now();
+  return syncDataCache().catch(err => console.log('Data sync failed:', err));
+};
+
 self.addEventListener('install', event => {
-  event.waitUntil(caches.open(CACHE_NAME).then(cache => cache.addAll(urlsToCache)));
+  event.waitUntil(Promise.all([
+    caches.open(CACHE_NAME).then(cache => cache.addAll(urlsToCache)),
+    syncDataCacheQuietly(),
+  ]));
 });
 
 self.addEventListener('fetch', event => {
+  // Check for a dataset refresh when the app is opened, at most every SYNC_INTERVAL
+  if (event.request.mode === 'navigate' && Date.now() - lastSync > SYNC_INTERVAL) {
+    event.waitUntil(syncDataCacheQuietly());
+  }
   event.respondWith(caches.match(event.request).then(response => response || fetch(event.request)));
-});
\ No newline at end of file
+});
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Sync statute sheets of offense_codes_updated.xlsx into cjis_codes.json.
+
+Every sheet (PC, TC, HSC, ORD, ...) is joined to the dataset on literal with
+one pandas merge, instead of building a dict with iterrows() and looping over
+every JSON record per sheet. Per-sheet rules say which records a sheet may
+touch and how each column is copied:
+
+- scope: only records whose statute equals this value (None: any record)
+- columns: {column: mode}, where mode is
+    'nonempty' - overwrite only when the sheet cell has a value (default)
+    'always'   - overwrite even when the sheet cell is empty
+
+Each run prints (and with --report, writes) how many records matched, which
+fields changed, and which literals were unmatched on either side.
+
+Usage:
+    python sync_sheets.py                 # every statute sheet
+    python sync_sheets.py PC TC           # just these sheets
+    python sync_sheets.py --report sync_report.json
+"""
+
+import argparse
+import json
+import sys
+
+import pandas as pd
+
+from offense_store import OffenseStore, index_key
+
+EXCEL_FILE = 'offense_codes_updated.xlsx'
+
+SYNC_COLUMNS = ['citation', 'statute', 'level', 'elements', 'statuteText']
+
+# Sheets that are not one statute's offenses
+SKIP_SHEETS = {'ALL_OFFENSES', 'BLANK'}
+
+# Sheets listed here run first, in this order, with these rules. Any other
+# sheet is scoped to its own statute and copies whichever SYNC_COLUMNS it has.
+SHEET_RULES = {
+    'PC': {
+        'scope': None,
+        'columns': {'citation': 'nonempty', 'statute': 'nonempty',
+                    'level': 'nonempty', 'statuteText': 'nonempty'},
+    },
+    'TC': {
+        'scope': 'TC',
+        'columns': {'citation': 'nonempty', 'elements': 'nonempty',
+                    'statuteText': 'nonempty'},
+    },
+}
+
+
+def rule_for(sheet_name, df):
+    rule = SHEET_RULES.get(sheet_name)
+    if rule is None:
+        rule = {
+            'scope': sheet_name,
+            'columns': {c: 'nonempty' for c in SYNC_COLUMNS if c in df.columns},
+        }
+    return rule
+
+
+def sheet_values(df, columns):
+    """The sheet keyed by stripped literal, with cells as strings ('' for empty)."""
+    src = pd.DataFrame({'literal': df['literal'].astype(str).str.strip()})
+    for col in columns:
+        if col in df.columns:
+            src[col] = df[col].where(df[col].notna(), '').astype(str)
+    src = src[src['literal'] != '']
+    # Later rows win, as they did when the sheet was read into a dict
+    return src.drop_duplicates('literal', keep='last')
+
+
+def sync_sheet(store, sheet_name, df, rule):
+    """Apply one sheet to the store. Returns a report dict."""
+    columns = [c for c in rule['columns'] if c in df.columns]
+    src = sheet_values(df, columns)
+
+    records = store.records()
+    scope = rule['scope']
+    positions = [i for i, r in enumerate(records) if scope is None or r.get('statute') == scope]
+    targets = pd.DataFrame({
+        '_pos': positions,
+        'literal': [index_key(records[i].get('literal')) for i in positions],
+    })
+
+    merged = targets.merge(src, on='literal', how='left', indicator=True)
+    matched = merged[merged['_merge'] == 'both']
+
+    changed_fields = {}
+    changed_records = set()
+    for col in columns:
+        values = matched[col]
+        if rule['columns'][col] == 'nonempty':
+            values = values[values != '']
+        current = pd.Series([records[p].get(col) for p in matched.loc[values.index, '_pos']],
+                            index=values.index, dtype=object)
+        differs = values[current != values]
+        changed_fields[col] = int(len(differs))
+        for pos, value in zip(matched.loc[differs.index, '_pos'], differs):
+            store.update(records[pos], **{col: value})
+            changed_records.add(pos)
+
+    in_scope = set(targets['literal'])
+    return {
+        'sheet': sheet_name,
+        'scope': rule['scope'],
+        'sheet_rows': int(len(src)),
+        'matched_records': int(len(matched)),
+        'changed_records': len(changed_records),
+        'changed_fields': changed_fields,
+        'unmatched_records': sorted(set(merged.loc[merged['_merge'] == 'left_only', 'literal'])),
+        'unmatched_sheet_rows': sorted(set(src['literal']) - in_scope),
+    }
+
+
+def ordered_sheets(sheets, only=None):
+    names = [n for n in SHEET_RULES if n in sheets]
+    names += [n for n in sheets if n not in SHEET_RULES]
+    names = [n for n in names if n not in SKIP_SHEETS and 'literal' in sheets[n].columns]
+    if only:
+        names = [n for n in names if n in only]
+    return names
+
+
+def sync_sheets(store=None, sheet_names=None, excel_path=EXCEL_FILE, report_path=None):
+    own_store = store is None
+    if own_store:
+        store = OffenseStore.load()
+
+    print(f"Loading {excel_path}...")
+    sheets = pd.read_excel(excel_path, sheet_name=None)
+    names = ordered_sheets(sheets, sheet_names)
+    missing = sorted(set(sheet_names or ()) - set(names))
+    if missing:
+        print(f"Warning: sheet(s) not found or without a literal column: {', '.join(missing)}")
+
+    reports = []
+    for name in names:
+        report = sync_sheet(store, name, sheets[name], rule_for(name, sheets[name]))
+        reports.append(report)
+        fields = ', '.join(f"{k}={v}" for k, v in report['changed_fields'].items() if v) or 'none'
+        print(f"{name:>6}: {report['sheet_rows']} rows, {report['matched_records']} records matched, "
+              f"{report['changed_records']} changed ({fields}), "
+              f"{len(report['unmatched_records'])} records not in sheet, "
+              f"{len(report['unmatched_sheet_rows'])} sheet rows not in JSON")
+
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2, ensure_ascii=False)
+        print(f"Wrote sync report to {report_path}")
+
+    if own_store:
+        if store.flush():
+            print(f"Saved {store.json_path}.")
+        else:
+            print("No changes.")
+    return reports
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('sheets', nargs='*', help='sheets to sync (default: every statute sheet)')
+    parser.add_argument('--workbook', default=EXCEL_FILE, help=f'workbook to read (default: {EXCEL_FILE})')
+    parser.add_argument('--report', metavar='FILE', help='write the changed/unmatched report as JSON')
+    args = parser.parse_args()
+    sys.exit(0 if sync_sheets(None, args.sheets or None, args.workbook, args.report) is not None else 1)
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic source corpus for load-testing the data build.
+
+Writes the inputs pipeline.py expects, at a multiple of today's size:
+
+    Texas CJIS code v20.pdf   ruled table of Code / Literal / Citation / Statute / L/D
+    PE.htm/pe.N.htm           Penal Code chapters: <pre> text with <a name="N.NN"> anchors
+    TN.doc/tn.N.docx          Transportation Code chapters: "Sec. N.NNN." paragraphs
+    offense_codes.xlsx        ALL_OFFENSES plus one sheet per statute, texts blank
+
+Sections follow the structure the parsers rely on: "Sec. N." headers,
+(a)/(1)/(A) subsection markers, cross references and legislative history
+lines, with repeated anchors and non-statute anchors as in the real files.
+Every workbook citation points at a generated section, and the CJIS table
+lists the same literals, so each pipeline stage does its full work.
+
+Scale 1 matches today's data (BASE); sizes grow linearly except chapter
+numbers, which are capped where the citation formats run out of digits, so
+chapters get longer instead. Output is deterministic for a given seed.
+
+Usage:
+    python synth_corpus.py OUTDIR [--scale 10] [--seed 1]
+"""
+
+import argparse
+import html
+import os
+import random
+import textwrap
+import zlib
+
+import openpyxl
+from docx import Document
+
+# Today's data, from offense_codes_updated.xlsx and cjis_codes.json
+BASE = {
+    'pc_chapters': 31, 'pc_sections': 281, 'pc_rows': 1545, 'pc_text': 3400,
+    'tc_chapters': 57, 'tc_sections': 344, 'tc_rows': 945, 'tc_text': 1200,
+    'other_rows': {'HSC': 458, 'ORD': 389},
+    'blank_rows': 112,
+    'cjis_records': 2704,
+}
+# Chapter numbers the citation formats allow (PE anchors take 1-3 digits)
+PC_CHAPTERS = range(1, 1000)
+TC_CHAPTERS = range(500, 1000)
+DUPLICATE_LITERALS = 0.013
+
+PDF_FILE = 'Texas CJIS code v20.pdf'
+PE_DIR = 'PE.htm'
+TN_DIR = 'TN.doc'
+WORKBOOK = 'offense_codes.xlsx'
+COLUMNS = ['literal', 'citation', 'statute', 'level', 'elements', 'statuteText']
+HEADERS = ['Code', 'Literal', 'Citation', 'Statute', 'L/D']
+
+LEVELS = {
+    'PC': (['F3', 'F2', 'MA', 'FS', 'F1', 'MB', 'MC'], [282, 216, 206, 195, 169, 108, 27]),
+    'TC': (['MC', 'MB', 'MA', 'F3', 'M*'], [782, 47, 38, 25, 17]),
+    'HSC': (['F3', 'F2', 'MA', 'FS', 'MB'], [5, 4, 4, 3, 2]),
+    'ORD': (['MC'], [1]),
+}
+
+WORDS = (
+    'person vehicle operator offense highway public property owner consent another license '
+    'department officer motor bodily injury weapon roadway driver child individual school zone '
+    'permit owner agency county state court record notice device signal lane speed limit '
+    'controlled substance amount conduct premises building habitation commercial authority '
+    'registration insurance collision scene victim officer employee guardian minor firearm'
+).split()
+VERBS = ('operates', 'possesses', 'causes', 'obtains', 'displays', 'transports', 'fails to stop',
+         'uses', 'enters', 'threatens', 'delivers', 'knowingly permits')
+MENS_REA = ('intentionally', 'knowingly', 'recklessly', 'intentionally or knowingly',
+            'with criminal negligence')
+GRADES = ('a Class C misdemeanor', 'a Class B misdemeanor', 'a Class A misdemeanor',
+          'a state jail felony', 'a felony of the third degree', 'a felony of the second degree')
+OFFENSE_WORDS = (
+    'ASSAULT THEFT BURGLARY POSS DELIVERY FAIL DRIVING OPERATE UNLAWFUL CARRY DISPLAY '
+    'EVADING ARREST RESIST CRIMINAL MISCHIEF TRESPASS HABITATION VEHICLE WEAPON CHILD '
+    'FALSE REPORT LICENSE INVALID EXPIRED SPEEDING ZONE PARKING CONTROLLED SUBSTANCE '
+    'MARIJUANA FRAUD FORGERY TAMPER EVIDENCE AGG BODILY INJURY FAMILY MEMBER PUBLIC '
+    'INTOXICATION DWI OPEN CONTAINER HARASSMENT STALKING ROBBERY PROPERTY SCHOOL'
+).split()
+
+
+def scaled(value, scale):
+    return max(1, round(value * scale))
+
+
+def chapter_numbers(rng, count, allowed):
+    allowed = list(allowed)
+    return sorted(rng.sample(allowed, min(count, len(allowed))))
+
+
+def sentence(rng, section, sections):
+    kind = rng.random()
+    if kind < 0.35:
+        words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 9)))
+        return f"A person commits an offense if the person {rng.choice(MENS_REA)} {rng.choice(VERBS)} {words}."
+    if kind < 0.5:
+        return f"An offense under this section is {rng.choice(GRADES)}."
+    if kind < 0.65:
+        ref = rng.choice(sections)
+        return f"Except as provided by Section {ref}, the {rng.choice(WORDS)} shall {rng.choice(VERBS)} the {rng.choice(WORDS)}."
+    words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 20)))
+    return words[0].upper() + words[1:] + '.'
+
+
+def section_body(rng, section, sections, target):
+    """
+    Paragraphs of one section after its header: [(marker, text)], where
+    marker is '(a)', '(1)', '(A)' etc. Grows until near target characters.
+    """
+    paragraphs = []
+    size = 0
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    goal = target * rng.uniform(0.4, 1.6)
+    for i, letter in enumerate(letters):
+        if size >= goal and i >= 2:
+            break
+        marker = f"({letter})" if rng.random() > 0.1 or i == 0 else f"({letters[i - 1]}-1)"
+        text = ' '.join(sentence(rng, section, sections) for _ in range(rng.randint(1, 3)))
+        if i and rng.random() < 0.3:
+            text += f" Subsection ({letters[rng.randrange(i)]}) does not apply."
+        paragraphs.append((marker, text))
+        size += len(text)
+        if rng.random() < 0.4:
+            for n in range(1, rng.randint(2, 6)):
+                item = sentence(rng, section, sections).rstrip('.') + ';'
+                paragraphs.append((f"({n})", item))
+                size += len(item)
+                if rng.random() < 0.25:
+                    for sub in 'AB':
+                        paragraphs.append((f"({sub})", f"the {rng.choice(WORDS)} {rng.choice(WORDS)};"))
+    return paragraphs
+
+
+def ordinal(n):
+    suffix = 'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f"{n}{suffix}"
+
+
+def history(rng):
+    year = rng.randint(1973, 2025)
+    return (f"Acts {year}, {ordinal(year // 2 - 923)} Leg., ch. {rng.randint(1, 999)}, "
+            f"Sec. {rng.randint(1, 40)}, eff. Sept. 1, {year}.")
+
+
+def title(rng):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))).upper()
+
+
+def build_code(rng, chapters, sections_total, width):
+    """{chapter: [section number, ...]} with sections spread over chapters."""
+    code = {ch: [] for ch in chapters}
+    for i in range(sections_total):
+        ch = chapters[i % len(chapters)]
+        code[ch].append(f"{ch}.{len(code[ch]) + 1:0{width}d}")
+    return code
+
+
+def write_pe_htm(rng, out_dir, code, target):
+    """Penal Code chapters. Returns {section: [subsection markers]}."""
+    os.makedirs(os.path.join(out_dir, PE_DIR), exist_ok=True)
+    all_sections = [s for sections in code.values() for s in sections]
+    markers = {}
+    for ch, sections in code.items():
+        parts = ['<html><head><title>PENAL CODE</title></head><body>',
+                 f'<pre>PENAL CODE\nTITLE {ch}. OFFENSES\nCHAPTER {ch}. {title(rng)}\n\n']
+        for section in sections:
+            body = section_body(rng, section, all_sections, target)
+            markers[section] = [m for m, _ in body if m[1].islower()]
+            text = f"Sec. {section}.  {title(rng)}.  " + '\n'.join(f"{m} {t}" for m, t in body)
+            wrapped = '\n'.join(textwrap.fill(line, 66, subsequent_indent='') for line in text.split('\n'))
+            escaped = html.escape(wrapped, quote=False).replace('  ', '&nbsp;&nbsp;')
+            first, rest = escaped[:len(f"Sec. {section}.")], escaped[len(f"Sec. {section}."):]
+            parts.append(f'<a name="{section}"></a><a name="{section}">{first}</a>{rest}\n')
+            if rng.random() < 0.2:
+                # Repeated anchor for the same section, and a non-statute reference id
+                parts.append(f'<a name="{section}"></a><a name="6{rng.randint(1000, 99999)}.{rng.randint(1000, 99999)}"></a>')
+            parts.append(f"\n{history(rng)}\n\n")
+        parts.append('</pre></body></html>')
+        with open(os.path.join(out_dir, PE_DIR, f"pe.{ch}.htm"), 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
+    return markers
+
+
+def write_tn_doc(rng, out_dir, code, target):
+    """Transportation Code chapters. Returns {section: [subsection markers]}."""
+    os.makedirs(os.path.join(out_dir, TN_DIR), exist_ok=True)
+    all_sections = [s for sections in code.values() for s in sections]
+    markers = {}
+    nbsp = '\xa0'
+    for ch, sections in code.items():
+        doc = Document()
+        doc.add_paragraph(f"CHAPTER {ch}. {title(rng)}")
+        doc.add_paragraph("SUBCHAPTER A. GENERAL PROVISIONS")
+        for section in sections:
+            body = section_body(rng, section, all_sections, target)
+            markers[section] = [m for m, _ in body if m[1].islower()]
+            (first_marker, first_text), rest = body[0], body[1:]
+            doc.add_paragraph(f"Sec.{nbsp}{section}.{nbsp}{nbsp}{title(rng)}.  {first_marker}{nbsp}{nbsp}{first_text}")
+            for marker, text in rest:
+                doc.add_paragraph(f"{marker}{nbsp}{nbsp}{text}")
+            doc.add_paragraph(history(rng))
+            if rng.random() < 0.3:
+                doc.add_paragraph("Amended by:")
+                doc.add_paragraph(history(rng))
+        doc.save(os.path.join(out_dir, TN_DIR, f"tn.{ch}.docx"))
+    return markers
+
+
+def literal_for(rng, used):
+    if used and rng.random() < DUPLICATE_LITERALS:
+        return rng.choice(used)
+    words = [rng.choice(OFFENSE_WORDS) for _ in range(rng.randint(2, 5))]
+    literal = ' '.join(words)
+    if rng.random() < 0.3:
+        literal = f"{rng.randint(10000000, 99999999)} {literal}"
+    used.append(literal)
+    return literal
+
+
+def level_for(rng, statute):
+    choices, weights = LEVELS[statute]
+    return rng.choices(choices, weights)[0]
+
+
+def offense_rows(rng, scale, pc_markers, tc_markers):
+    """{sheet: [[literal, citation, statute, level, None, None], ...]}"""
+    used = []
+    sheets = {'PC': [], 'TC': []}
+    pc_sections = list(pc_markers)
+    tc_sections = list(tc_markers)
+    for _ in range(scaled(BASE['pc_rows'], scale)):
+        section = rng.choice(pc_sections)
+        citation = section
+        if rng.random() < 0.8:
+            citation += rng.choice(pc_markers[section])
+            if rng.random() < 0.3:
+                citation += f"({rng.randint(1, 4)})"
+        sheets['PC'].append([literal_for(rng, used), citation, 'PC', level_for(rng, 'PC'), None, None])
+    for _ in range(scaled(BASE['tc_rows'], scale)):
+        section = rng.choice(tc_sections)
+        kind = rng.random()
+        if kind < 0.4:
+            citation = f"{section} {rng.randint(3000, 3999)}"
+        elif kind < 0.8:
+            citation = section + rng.choice(tc_markers[section])
+        else:
+            citation = section
+        sheets['TC'].append([literal_for(rng, used), citation, 'TC', level_for(rng, 'TC'), None, None])
+    for statute, rows in BASE['other_rows'].items():
+        sheets[statute] = []
+        for _ in range(scaled(rows, scale)):
+            if statute == 'ORD':
+                citation = f"{rng.randint(1, 40)}.{rng.randint(1, 20):02d}.{rng.randint(1, 300):03d}"
+            else:
+                citation = f"{rng.randint(400, 499)}.{rng.randint(1, 200):03d}({rng.choice('abcd')})"
+            sheets[statute].append([literal_for(rng, used), citation, statute, level_for(rng, statute), None, None])
+    return sheets
+
+
+def write_workbook(rng, out_dir, sheets, scale):
+    wb = openpyxl.Workbook(write_only=True)
+    all_rows = sorted((row for rows in sheets.values() for row in rows), key=lambda r: r[0])
+    blank = [[literal_for(rng, []), None, None, None, None, None] for _ in range(scaled(BASE['blank_rows'], scale))]
+    for name, rows in [('ALL_OFFENSES', all_rows)] + list(sheets.items()) + [('BLANK', blank)]:
+        ws = wb.create_sheet(name)
+        ws.append(COLUMNS)
+        for row in rows:
+            ws.append(row)
+    wb.save(os.path.join(out_dir, WORKBOOK))
+    return len(all_rows)
+
+
+def pdf_text(value):
+    return str(value).replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_table_pdf(path, rows, rows_per_page=44):
+    """
+    A minimal PDF of ruled tables (one header row per page), the layout
+    extract_cjis.py reads with pdfplumber's line-based table finder.
+    """
+    widths = [60, 300, 120, 70, 50]
+    left, top, height = 36, 576, 12
+    xs = [left]
+    for w in widths:
+        xs.append(xs[-1] + w)
+
+    objects = []  # body of objects 1..n; 1 catalog, 2 pages, 3 font
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    add(b'')  # catalog, filled in below
+    add(b'')  # pages
+    font = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+    page_ids = []
+    for start in range(0, len(rows), rows_per_page):
+        chunk = [HEADERS] + rows[start:start + rows_per_page]
+        ops = ['0.5 w']
+        bottom = top - height * len(chunk)
+        for i in range(len(chunk) + 1):
+            y = top - height * i
+            ops.append(f"{xs[0]} {y} m {xs[-1]} {y} l S")
+        for x in xs:
+            ops.append(f"{x} {top} m {x} {bottom} l S")
+        ops.append('BT /F1 7 Tf')
+        for i, row in enumerate(chunk):
+            y = top - height * (i + 1) + 3
+            for x, value in zip(xs, row):
+                ops.append(f"1 0 0 1 {x + 2} {y} Tm ({pdf_text(value)}) Tj")
+        ops.append('ET')
+        stream = zlib.compress('\n'.join(ops).encode('latin-1', 'replace'))
+        content = add(b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(stream) + stream + b'\nendstream')
+        page_ids.append(add(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 792 612] '
+                            f'/Resources << /Font << /F1 {font} 0 R >> >> /Contents {content} 0 R >>'.encode()))
+    objects[0] = b'<< /Type /Catalog /Pages 2 0 R >>'
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{p} 0 R' for p in page_ids)}] /Count {len(page_ids)} >>".encode()
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    with open(path, 'wb') as f:
+        f.write(out)
+    return len(page_ids)
+
+
+def generate(out_dir, scale=1.0, seed=1):
+    """Write a corpus of the given scale into out_dir. Returns a summary dict."""
+    rng = random.Random(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    pc_code = build_code(rng, chapter_numbers(rng, scaled(BASE['pc_chapters'], scale), PC_CHAPTERS),
+                         scaled(BASE['pc_sections'], scale), 2)
+    tc_code = build_code(rng, chapter_numbers(rng, scaled(BASE['tc_chapters'], scale), TC_CHAPTERS),
+                         scaled(BASE['tc_sections'], scale), 3)
+    pc_markers = write_pe_htm(rng, out_dir, pc_code, BASE['pc_text'])
+    tc_markers = write_tn_doc(rng, out_dir, tc_code, BASE['tc_text'])
+
+    sheets = offense_rows(rng, scale, pc_markers, tc_markers)
+    offenses = write_workbook(rng, out_dir, sheets, scale)
+
+    listed = [row for rows in sheets.values() for row in rows]
+    rng.shuffle(listed)
+    cjis = sorted(listed[:scaled(BASE['cjis_records'], scale)], key=lambda r: r[0])
+    table = [[rng.randint(10000000, 99999999), r[0], r[1], r[2], r[3]] for r in cjis]
+    pages = write_table_pdf(os.path.join(out_dir, PDF_FILE), table)
+
+    return {
+        'scale': scale,
+        'pc_chapters': len(pc_code), 'pc_sections': len(pc_markers),
+        'tc_chapters': len(tc_code), 'tc_sections': len(tc_markers),
+        'offenses': offenses, 'cjis_records': len(table), 'cjis_pages': pages,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('out_dir', help='directory to write the corpus into')
+    parser.add_argument('--scale', type=float, default=1.0, help="multiple of today's data size (default: 1)")
+    parser.add_argument('--seed', type=int, default=1, help='random seed (default: 1)')
+    args = parser.parse_args()
+    summary = generate(args.out_dir, args.scale, args.seed)
+    print(f"Wrote {args.scale:g}x corpus to {args.out_dir}: "
+          f"{summary['pc_sections']} PC sections in {summary['pc_chapters']} chapters, "
+          f"{summary['tc_sections']} TC sections in {summary['tc_chapters']} chapters, "
+          f"{summary['offenses']} offenses, {summary['cjis_records']} CJIS records on {summary['cjis_pages']} pages.")
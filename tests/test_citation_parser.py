@@ -0,0 +1,25 @@
+import pandas as pd
+import pytest
+
+from citation_parser import parse_citation, parse_citations
+
+
+@pytest.mark.parametrize('citation, chapter, section, subsection, cjis', [
+    ('521.342 (A)(2) 3241', '521', '521.342', '(A)(2)', '3241'),
+    ('33A.051(b)', '33A', '33A.051', '(b)', None),
+    ('15.16CO', '15', '15.16', None, None),
+    ('1302-5.05', '1302-5', '1302-5.05', None, None),
+    ('1396-9.03A', '1396-9', '1396-9.03A', None, None),
+    ('R109.1.6', 'R109', 'R109.1.6', None, None),
+])
+def test_parse_citation(citation, chapter, section, subsection, cjis):
+    expected = {'chapter': chapter, 'section': section, 'subsection': subsection, 'cjis': cjis}
+    assert parse_citation(citation) == expected
+
+    row = parse_citations([citation]).iloc[0]
+    assert {column: (None if pd.isna(value) else value)
+            for column, value in row.to_dict().items()} == expected
+
+
+def test_unparseable_citation_gives_no_parts():
+    assert parse_citation('SEE NOTES') == dict.fromkeys(['chapter', 'section', 'subsection', 'cjis'])
@@ -0,0 +1,31 @@
+from extract_statute import SectionIndex
+
+PAGES = [
+    "Sec. 33.02. BREACH OF COMPUTER SECURITY. (a) A person commits an\r\n"
+    "offense if the person knowingly accesses a computer.\r\n"
+    "Added by Acts 2017, 85th Leg., R.S., Ch. 684 (H.B. 9), Sec. 3, eff.\r\n"
+    "September 1, 2017.\r\n"
+    "For text of section as amended by Acts 2017, 85th Leg., R.S., Ch. 684\r\n"
+    "(H.B. 9), Sec. 4, see other Sec. 33.03.\r\n"
+    "PENAL CODE\r\nStatute text rendered on: 10/2/2025 - 315 -",
+    "Sec. 33.03. DEFENSES. It is an affirmative defense to\r\n"
+    "prosecution under Section 33.02 that the actor was an officer.\r\n"
+    "PENAL CODE\r\nStatute text rendered on: 10/2/2025 - 316 -",
+]
+
+
+def test_see_other_note_is_not_a_section_header():
+    index = SectionIndex(PAGES)
+
+    assert index.numbers() == ['33.02', '33.03']
+    assert index.get('33.02') == (
+        "Sec. 33.02. BREACH OF COMPUTER SECURITY. (a) A person commits an\r\n"
+        "offense if the person knowingly accesses a computer.\r\n"
+        "Added by Acts 2017, 85th Leg., R.S., Ch. 684 (H.B. 9), Sec. 3, eff.\r\n"
+        "September 1, 2017."
+    )
+    assert index.get('33.03') == (
+        "Sec. 33.03. DEFENSES. It is an affirmative defense to\r\n"
+        "prosecution under Section 33.02 that the actor was an officer."
+    )
+    assert index.pages('33.02') == (0, 0)
@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+
+from offense_store import load_records
+from synth_corpus import generate
+from update_cjis import new_offenses
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_full_build_keeps_warrant_entries(tmp_path):
+    corpus_dir = str(tmp_path / 'corpus')
+    generate(corpus_dir, scale=0.05)
+
+    result = subprocess.run([sys.executable, os.path.join(REPO_DIR, 'pipeline.py'), '--workdir', corpus_dir],
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    literals = {record['literal'] for record in load_records(os.path.join(corpus_dir, 'cjis_codes.json'))}
+    assert 'CITY WARRANT' in literals
+    assert set(new_offenses) <= literals
+    assert 'City Warrant' not in literals
@@ -0,0 +1,50 @@
+import openpyxl
+from openpyxl.styles import Font
+
+from workbook_io import iter_rows, rewrite_workbook
+
+
+def make_workbook(path):
+    wb = openpyxl.Workbook()
+    tc = wb.active
+    tc.title = 'TC'
+    tc.append(['literal', 'citation', 'statute', 'level', 'elements', 'statuteText'])
+    tc.append(['SPEEDING', '545.351', 'TC', 'MC', 'old elements', 'old text'])
+    tc['A1'].font = Font(bold=True)
+
+    pc = wb.create_sheet('PC')
+    pc.append(['literal', 'citation', 'fine'])
+    pc.append(['ASSAULT', '22.01(a)(1)', 1250.5])
+    pc['A1'].font = Font(bold=True)
+    pc['C2'].number_format = '#,##0.00'
+    pc.column_dimensions['A'].width = 42
+    pc.freeze_panes = 'A2'
+    wb.save(path)
+
+
+def test_rewrite_sets_only_updated_cells(tmp_path):
+    path = str(tmp_path / 'offenses.xlsx')
+    make_workbook(path)
+
+    written = rewrite_workbook(path, {'TC': {2: {5: 'new elements', 6: None}}})
+
+    assert written == 2
+    rows = dict(iter_rows(path, 'TC'))
+    assert rows[2] == ('SPEEDING', '545.351', 'TC', 'MC', 'new elements', None)
+    assert rows[1][0] == 'literal'
+
+
+def test_rewrite_keeps_other_sheet_formatting(tmp_path):
+    path = str(tmp_path / 'offenses.xlsx')
+    make_workbook(path)
+
+    rewrite_workbook(path, {'TC': {2: {5: 'new elements'}}})
+
+    wb = openpyxl.load_workbook(path)
+    pc = wb['PC']
+    assert pc['A1'].font.bold
+    assert pc['C2'].value == 1250.5
+    assert pc['C2'].number_format == '#,##0.00'
+    assert pc.column_dimensions['A'].width == 42
+    assert pc.freeze_panes == 'A2'
+    assert wb['TC']['A1'].font.bold
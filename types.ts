@@ -10,6 +10,16 @@ export interface Template {
   defaultEvidence?: string[];
 }
 
+// One subsection of a statuteText: statuteText.slice(start, end) is the
+// whole subsection (label, text and children), written by
+// statute_text_normalizer.py so the app never re-splits the text
+export interface StatuteNode {
+  label: string; // e.g. '(a)', '(1)', '(A)', '(i)'
+  start: number;
+  end: number;
+  children: StatuteNode[];
+}
+
 export interface Offense {
   id?: string; // Unique instance ID
   literal: string;
@@ -18,8 +28,22 @@ export interface Offense {
   level: string;
   elements?: string;
   statuteText?: string;
+  statuteTree?: StatuteNode[];
 }
 
+// Slim offense record from cjis_codes_index.ts. The elements/statuteText
+// bodies live in a text shard, loaded on demand from textRef ('SHARD:slot').
+export interface OffenseIndexEntry {
+  literal: string;
+  citation: string;
+  statute: string;
+  level: string;
+  textRef?: string;
+}
+
+// An index entry whose text may not be loaded yet, or a full offense
+export type OffenseRef = Offense & Pick<OffenseIndexEntry, 'textRef'>;
+
 export interface NameEntry {
   name: string;
   sex: 'M' | 'F' | '';
@@ -1,4 +1,4 @@
-import json
+from offense_store import OffenseStore
 
 new_offenses = [
     "CITY WARRANT",
@@ -14,40 +14,26 @@ new_offenses = [
     "WELFARE CONCERN"
 ]
 
-file_path = 'c:\\Users\\pgarr\\Desktop\\police-report-drafter\\cjis_codes.json'
-
-with open(file_path, 'r', encoding='utf-8') as f:
-    data = json.load(f)
-
-# Create new entries
-new_entries = []
-for title in new_offenses:
-    new_entries.append({
-        "literal": title,
-        "citation": "",
-        "statute": "",
-        "level": ""
-    })
-
-# Add to data (avoid duplicates if I run it again)
-existing_literals = {item['literal'] for item in data}
-for entry in new_entries:
-    if entry['literal'] not in existing_literals:
-        data.append(entry)
-
-# Sort by literal
-data.sort(key=lambda x: x['literal'])
-
-# Write back to JSON
-with open(file_path, 'w', encoding='utf-8') as f:
-    json.dump(data, f, indent=2)
-
-# Update TS file
-ts_file_path = 'c:\\Users\\pgarr\\Desktop\\police-report-drafter\\cjis_codes.ts'
-with open(ts_file_path, 'w', encoding='utf-8') as f:
-    f.write('import { Offense } from "./types";\n\n')
-    f.write('export const CJIS_CODES: Offense[] = ')
-    json.dump(data, f, indent=2)
-    f.write(';\n')
-
-print("Successfully updated cjis_codes.json and cjis_codes.ts with ALL CAPS entries")
+def add_warrant_entries(store):
+    # Add to data (avoid duplicates if I run it again)
+    added = 0
+    for title in new_offenses:
+        if store.get(title) is None:
+            store.add({
+                "literal": title,
+                "citation": "",
+                "statute": "",
+                "level": ""
+            })
+            added += 1
+
+    # Sort by literal
+    store.sort(key=lambda x: x['literal'])
+    return added
+
+if __name__ == "__main__":
+    store = OffenseStore.load()
+    add_warrant_entries(store)
+    store.flush()
+
+    print("Successfully updated cjis_codes.json with ALL CAPS entries")
@@ -1,104 +1,114 @@
 import os
-import re
+import sys
+import time
 import pandas as pd
-from bs4 import BeautifulSoup
 
-def clean_html_text(html_content):
-    if not html_content: return ""
-    soup = BeautifulSoup(html_content, 'html.parser')
-    text = soup.get_text(separator=' ')
-    lines = [line.strip() for line in text.split('\n')]
-    cleaned = '\n'.join([line for line in lines if line])
-    cleaned = re.sub(r' +', ' ', cleaned)
-    return cleaned
+from citation_parser import parse_citations
+from run_report import current_report, run_report
+from statute_cache import get_default_cache
+from statute_source import PE_HTML_FOLDER, HtmlSource, StatuteSource
 
-def extract_sections_from_html(html_dir):
-    sections = {}
-    # Only match TRUE statute sections like 39.02, 22.041, etc.
-    # NOT internal reference IDs like 62261.53562 (5+ digit prefix)
-    # Statute format: 1-3 digit chapter, dot, 1-4 digit section (e.g., 39.02, 22.041)
-    statute_pattern = re.compile(r'<a name="(\d{1,3}\.\d{1,4})">', re.IGNORECASE)
+# Sheets enriched by another stage: process_tc_sheet.py also fills TC's elements
+OWN_STAGE_SHEETS = {'TC'}
+SKIP_SHEETS = {'ALL_OFFENSES', 'BLANK'}
 
-    files = [f for f in os.listdir(html_dir) if f.endswith('.htm')]
+def extract_sections_from_html(html_dir, report_timings=False):
+    """Every section of every chapter page in html_dir (longest text wins), read through an HtmlSource."""
+    sections = {}
+    timings = []
+    source = HtmlSource(html_dir, max_chapters=1)
+    files = source.chapter_files()
     print(f"Processing {len(files)} HTML files...")
 
-    for filename in files:
-        with open(os.path.join(html_dir, filename), 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-            matches = list(statute_pattern.finditer(content))
-            
-            for i, m in enumerate(matches):
-                section_num = m.group(1)
-                start_pos = m.start()
-                
-                # End at the next TRUE statute anchor with a DIFFERENT section number
-                end_pos = -1
-                for j in range(i + 1, len(matches)):
-                    if matches[j].group(1) != section_num:
-                        end_pos = matches[j].start()
-                        break
-                
-                if end_pos == -1:
-                    end_pos = content.find('</pre>', start_pos)
-                    if end_pos == -1: end_pos = content.find('</body>', start_pos)
-                    if end_pos == -1: end_pos = len(content)
-                
-                raw_section = content[start_pos:end_pos]
-                cleaned = clean_html_text(raw_section)
-                
+    with current_report().stage('parse_pe_html', cache=get_default_cache()) as stage:
+        for chapter, path in files:
+            misses = get_default_cache().stats['misses']
+            started = time.perf_counter()
+            cpu_started = time.process_time()
+            # Each file is parsed once and cached until its content changes
+            file_sections = source.chapter(chapter)
+            elapsed = time.perf_counter() - started
+            filename = os.path.basename(path)
+            timings.append((elapsed, filename, len(file_sections), get_default_cache().stats['misses'] > misses))
+            stage.add_file(filename, elapsed, time.process_time() - cpu_started, len(file_sections))
+            for section_num, (cleaned, _) in file_sections.items():
                 if section_num not in sections or len(cleaned) > len(sections[section_num]):
                     sections[section_num] = cleaned
+        stage.rows(rows_in=len(files), rows_out=len(sections))
+
+    if report_timings:
+        print_timing_report(timings)
                     
     return sections
 
-def update_excel_statutes(excel_path, output_path, sections_data):
+def print_timing_report(timings):
+    total = sum(t[0] for t in timings)
+    parsed = sum(1 for t in timings if t[3])
+    print(f"\n--- Per-file timing ({len(timings)} files, {parsed} parsed, "
+          f"{len(timings) - parsed} from cache, {total:.3f}s total) ---")
+    for elapsed, filename, count, was_parsed in sorted(timings, reverse=True):
+        source = 'parsed' if was_parsed else 'cache'
+        print(f"  {filename:<20} {elapsed * 1000:9.1f} ms  {count:5d} sections  ({source})")
+
+def update_sheet_statutes(df, statute, source):
+    """
+    Fill a sheet's statuteText from source, one lookup per distinct section.
+    Rows whose section no source has are blanked. Returns (rows updated,
+    sections not found).
+    """
+    sections = parse_citations(df['citation'])['section']
+    found = {section: source.section_text(statute, section) for section in sections.dropna().unique()}
+    texts = sections.map(found)
+    matched = texts.notna() & (texts != '')
+    missing_sections = set(sections[sections.notna() & texts.isna()])
+    df['statuteText'] = texts.where(matched, '').astype(object)
+    return int(matched.sum()), missing_sections
+
+def update_excel_statutes(excel_path, output_path, source):
+    """Fill statuteText on every sheet whose statute source has (see statute_source.STATUTE_SOURCES)."""
     print(f"Loading {excel_path}...")
     excel_file = pd.ExcelFile(excel_path)
     sheet_names = excel_file.sheet_names
     dfs = {name: excel_file.parse(name) for name in sheet_names}
-    
-    if 'PC' not in dfs:
-        print("Error: 'PC' sheet not found.")
-        return
-
-    df_pc = dfs['PC']
-    matches_found = 0
-    missing_sections = set()
 
-    def get_section_text(citation):
-        nonlocal matches_found
-        if pd.isna(citation): return ""
-        match = re.search(r'(\d{1,3}\.\d{1,4})', str(citation).strip())
-        if match:
-            section_num = match.group(1)
-            if section_num in sections_data:
-                text = sections_data[section_num]
-                if text:
-                    matches_found += 1
-                    return text
-            else:
-                missing_sections.add(section_num)
-        return ""
+    names = [name for name in sheet_names
+             if name not in SKIP_SHEETS | OWN_STAGE_SHEETS and 'citation' in dfs[name].columns
+             and source.backends(name)]
+    if not names:
+        print("No sheet has a statute source.")
 
-    df_pc['statuteText'] = df_pc['citation'].apply(get_section_text)
-    print(f"Update applied: {matches_found} rows updated.")
-    if missing_sections:
-        print(f"Missing sections: {sorted(list(missing_sections))[:10]}... (total: {len(missing_sections)})")
+    for name in names:
+        df = dfs[name]
+        with current_report().stage(f'update_{name.lower()}_sheet', cache=source) as stage:
+            matches_found, missing_sections = update_sheet_statutes(df, name, source)
+            stage.rows(rows_in=len(df), rows_out=matches_found)
+        print(f"{name}: update applied, {matches_found} rows updated "
+              f"(from {', '.join(map(repr, source.backends(name)))}).")
+        if missing_sections:
+            print(f"Missing sections: {sorted(list(missing_sections))[:10]}... (total: {len(missing_sections)})")
     
     print(f"Saving to {output_path}...")
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        for name, df in dfs.items():
-            df.to_excel(writer, sheet_name=name, index=False)
+    with current_report().stage('save_workbook'):
+        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            for name, df in dfs.items():
+                df.to_excel(writer, sheet_name=name, index=False)
     print(f"Successfully saved to {output_path}.")
 
 if __name__ == "__main__":
-    sections = extract_sections_from_html('PE.htm')
-    print(f"Extracted {len(sections)} sections.")
-    if "39.02" in sections:
-        print(f"DEBUG: 39.02 found, length {len(sections['39.02'])}")
-        print(f"DEBUG: Sample: {sections['39.02'][:150]}...")
-    else:
-        print("DEBUG: 39.02 NOT FOUND")
-        
-    update_excel_statutes('offense_codes.xlsx', 'offense_codes_updated.xlsx', sections)
+    with run_report('update_statute_text'):
+        if '--timing' in sys.argv:
+            sections = extract_sections_from_html(PE_HTML_FOLDER, report_timings=True)
+            print(f"Extracted {len(sections)} sections.")
+
+        # Every sheet's statutes come through one source, a chapter at a time
+        source = StatuteSource()
+        text = source.section_text('PC', '39.02')
+        if text:
+            print(f"DEBUG: 39.02 found, length {len(text)}")
+            print(f"DEBUG: Sample: {text[:150]}...")
+        else:
+            print("DEBUG: 39.02 NOT FOUND")
+
+        update_excel_statutes('offense_codes.xlsx', 'offense_codes_updated.xlsx', source)
+        print(f"Chapter cache: {source.stats['chapter_hits']} hits, "
+              f"{source.stats['chapter_misses']} misses, {source.stats['chapter_evictions']} evicted")
@@ -2,7 +2,15 @@ const fs = require('fs');
 const path = require('path');
 
 const jsonPath = path.join(__dirname, 'cjis_codes.json');
-const jsonData = JSON.parse(fs.readFileSync(jsonPath, 'utf8'));
+const payload = JSON.parse(fs.readFileSync(jsonPath, 'utf8'));
+
+// cjis_codes.json stores each unique text once; records refer to it by index
+const resolve = (table, value) => (typeof value === 'number' ? table[value] : value);
+const jsonData = Array.isArray(payload) ? payload : payload.records.map(entry => ({
+    ...entry,
+    elements: resolve(payload.texts.elements, entry.elements),
+    statuteText: resolve(payload.texts.statuteText, entry.statuteText),
+}));
 
 let errors = [];
 
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Streaming access to offense_codes_updated.xlsx.
+
+Loading the workbook in openpyxl's default mode builds every cell of every
+sheet in memory, and per-cell ws.cell(row, col) access is slow. Reads stream
+rows in read_only mode, so scanning a sheet holds roughly one row at a time.
+
+Writes load the workbook in the default mode once and set only the changed
+cells, so everything else - other sheets, cell styles, column widths, freeze
+panes and number formats - is saved as it was. That trades flat memory for
+formatting: write_only mode could stream the output, but it cannot copy
+styles or sheet settings, so a rewrite holds the whole workbook in memory
+and its peak grows with the workbook's size.
+"""
+
+import os
+
+import openpyxl
+
+
+def iter_rows(path, sheet_name, min_row=1, max_col=None):
+    """Yield (row_num, values) for a sheet without loading the workbook."""
+    wb = openpyxl.load_workbook(path, read_only=True)
+    try:
+        ws = wb[sheet_name]
+        for row_num, values in enumerate(
+                ws.iter_rows(min_row=min_row, max_col=max_col, values_only=True), min_row):
+            yield row_num, values
+    finally:
+        wb.close()
+
+
+def rewrite_workbook(path, updates, output_path=None):
+    """
+    Set the updated cells of a workbook and save it to output_path (default: in place).
+
+    updates maps sheet name -> {row_num: {col_num: value}} with 1-based row
+    and column numbers, as in ws.cell(row=..., column=...). Cells without
+    updates, and their formatting, are left alone. The whole workbook is
+    loaded to do this, so peak memory grows with its size. Returns the
+    number of cells written.
+    """
+    output_path = output_path or path
+    wb = openpyxl.load_workbook(path)
+    written = 0
+    try:
+        for sheet_name, sheet_updates in updates.items():
+            ws = wb[sheet_name]
+            for row_num, changes in sheet_updates.items():
+                for col_num, value in changes.items():
+                    # Assigned rather than passed to cell(), which ignores None
+                    ws.cell(row=row_num, column=col_num).value = value
+                    written += 1
+
+        # Write next to the target and swap, so a failure never truncates it
+        tmp_path = output_path + '.tmp.xlsx'
+        wb.save(tmp_path)
+        os.replace(tmp_path, output_path)
+    finally:
+        wb.close()
+    return written
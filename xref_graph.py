@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Build the statute cross-reference graph from PE.htm and TN.doc.
+
+Every section of the Penal Code (PE.htm) and Transportation Code (TN.doc)
+is scanned once for references to other statutes (statute_xref.py has the
+grammar and the node format). The graph is written to xref_graph.json
+({node: [targets]}) for the build scripts - process_tc_sheet.py pulls
+referenced TC subsections into elements through it - and to xref_graph.ts
+for the app. Parsed sources come from the statute cache, so a rebuild only
+re-reads changed files.
+
+Usage:
+    python xref_graph.py                        # build from PE.htm and TN.doc
+    python xref_graph.py --show "PC 49.07(a)"   # print a node's references
+"""
+
+import argparse
+import json
+import os
+
+from run_report import current_report, run_report
+from section_tree import flatten_tree
+from statute_source import PE_HTML_FOLDER, TN_DOC_FOLDER, DocxSource
+from statute_text_normalizer import normalize_statute_text
+from statute_xref import XREF_GRAPH_FILE, XrefGraph, add_section, citation_node, expand_ranges
+from update_statute_text import extract_sections_from_html
+
+XREF_TS_FILE = 'xref_graph.ts'
+
+
+def build_graph(pe_folder=PE_HTML_FOLDER, tn_folder=TN_DOC_FOLDER):
+    """Scan every PE.htm and TN.doc section. Returns ({node: sorted targets}, sections scanned)."""
+    graph = {}
+    scanned = 0
+    sections_by_statute = {'PC': set(), 'TC': set()}
+    if os.path.isdir(pe_folder):
+        pe_sections = extract_sections_from_html(pe_folder)
+        with current_report().stage('scan_pe_html') as stage:
+            for section, text in pe_sections.items():
+                # Subsections as the app's statuteTree sees them
+                formatted, tree = normalize_statute_text(text)
+                add_section(graph, 'PC', section, formatted, flatten_tree(tree))
+            stage.rows(rows_in=len(pe_sections))
+        sections_by_statute['PC'].update(pe_sections)
+        scanned += len(pe_sections)
+
+    source = DocxSource(tn_folder)
+    with current_report().stage('scan_tn_doc', cache=source) as stage:
+        for chapter, doc_path in source.chapter_files():
+            with stage.file(doc_path) as entry:
+                sections = source.chapter(chapter)
+                for section, (full_text, paths) in sections.items():
+                    add_section(graph, 'TC', section, full_text, paths)
+                sections_by_statute['TC'].update(sections)
+                entry['rows'] = len(sections)
+            scanned += len(sections)
+    # "Sections 22.01 through 22.04" covers every section scanned in between
+    expand_ranges(graph, sections_by_statute)
+    return {node: sorted(targets) for node, targets in sorted(graph.items())}, scanned
+
+
+TS_TEMPLATE = """// Generated by xref_graph.py from PE.htm and TN.doc; do not edit.
+// Statute cross-references. A node is "<statute> <section><path>" with the
+// section and path lower-cased (e.g. "PC 22.01(b)"), or "<statute> <chapter>".
+
+const NODES: string[] = {nodes};
+// For each node, the positions in NODES of what its text refers to
+const EDGES: number[][] = {edges};
+
+const POSITIONS = new Map<string, number>(NODES.map((node, i) => [node, i]));
+const CITATION_RE = /^\\s*(\\d+[A-Za-z]?(?:\\.\\d+[A-Za-z]?)+)\\s*((?:\\([A-Za-z0-9\\-]+\\))*)/;
+
+// The node for an offense's statute and citation, e.g. ('TC', '545.157(b) 3241')
+export const xrefNode = (statute: string, citation: string): string | null => {{
+  const match = CITATION_RE.exec(citation || '');
+  return statute && match ? `${{statute}} ${{(match[1] + match[2]).toLowerCase()}}` : null;
+}};
+
+// What a node's text refers to outside itself
+export const statuteReferences = (node: string): string[] =>
+  (EDGES[POSITIONS.get(node) ?? -1] || []).map(i => NODES[i]);
+
+// Everything reachable from node, nearest first, up to maxDepth references away
+export const transitiveReferences = (node: string, maxDepth = Infinity): string[] => {{
+  const start = POSITIONS.get(node);
+  if (start === undefined) return [];
+  const seen = new Set<number>([start]);
+  const found: string[] = [];
+  let frontier = [start];
+  for (let depth = 0; depth < maxDepth && frontier.length; depth++) {{
+    const next: number[] = [];
+    for (const i of frontier) {{
+      for (const j of EDGES[i]) {{
+        if (seen.has(j)) continue;
+        seen.add(j);
+        found.push(NODES[j]);
+        next.push(j);
+      }}
+    }}
+    frontier = next;
+  }}
+  return found;
+}};
+"""
+
+
+def write_graph(graph, json_path=XREF_GRAPH_FILE, ts_path=XREF_TS_FILE):
+    """Write the graph as JSON and as the app's TS module. Returns the TS size in bytes."""
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(graph, f, ensure_ascii=False, separators=(',', ':'))
+
+    nodes = sorted(set(graph).union(*graph.values()))
+    positions = {node: i for i, node in enumerate(nodes)}
+    source = TS_TEMPLATE.format(
+        nodes=json.dumps(nodes, ensure_ascii=False),
+        edges=json.dumps([[positions[t] for t in graph.get(node, [])] for node in nodes],
+                         separators=(',', ':')),
+    )
+    with open(ts_path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    return len(source.encode('utf-8'))
+
+
+def show(node, path=XREF_GRAPH_FILE):
+    graph = XrefGraph.load(path)
+    # Also takes a sheet citation, e.g. "TC 545.157(B) 3241"
+    statute, _, citation = node.partition(' ')
+    node = citation_node(statute, citation) or node
+    print(f"{node} refers to: {', '.join(graph.references(node)) or '-'}")
+    print(f"Referred to by: {', '.join(graph.referenced_by(node)) or '-'}")
+    print(f"Transitively: {', '.join(graph.closure(node)) or '-'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the statute cross-reference graph.")
+    parser.add_argument('--show', metavar='NODE',
+                        help='print the references of NODE (e.g. "PC 49.07(a)") from the built graph')
+    args = parser.parse_args()
+    if args.show:
+        show(args.show)
+        return
+
+    with run_report('xref_graph') as report:
+        graph, scanned = build_graph()
+        with report.stage('write_graph') as stage:
+            size = write_graph(graph)
+            stage.rows(rows_in=scanned, rows_out=sum(len(targets) for targets in graph.values()))
+    edges = sum(len(targets) for targets in graph.values())
+    print(f"Scanned {scanned} sections: {len(graph)} citing nodes, {edges} edges.")
+    print(f"Generated {XREF_GRAPH_FILE} and {XREF_TS_FILE} ({size // 1024} KB).")
+
+
+if __name__ == '__main__':
+    main()